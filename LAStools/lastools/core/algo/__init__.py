@@ -1,3 +1,5 @@
-from .lastools_algorithm import LastoolsAlgorithm
-
-__all__ = [LastoolsAlgorithm]
+from .lastools_algorithm import LastoolsAlgorithm
+from .lastools_algorithm_stub import LastoolsAlgorithmStub
+from .lastools_pipeline import LastoolsPipeline
+
+__all__ = [LastoolsAlgorithm, LastoolsAlgorithmStub, LastoolsPipeline]
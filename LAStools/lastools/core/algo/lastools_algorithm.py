@@ -20,13 +20,27 @@ __author__ = "rapidlasso"
 __date__ = "January 2025"
 __copyright__ = "(c) 2025, rapidlasso GmbH"
 
+import datetime
+import glob
+import math
 import re
 import os
+import sqlite3
+import tempfile
+import time
 from qgis.core import (
     Qgis,
+    QgsCoordinateReferenceSystem,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsProcessing,
     QgsProcessingAlgorithm,
+    QgsProcessingContext,
+    QgsProcessingOutputMultipleLayers,
     QgsProcessingParameterBoolean,
     QgsProcessingParameterEnum,
+    QgsProcessingParameterExtent,
+    QgsProcessingParameterFeatureSource,
     QgsProcessingParameterFile,
     QgsProcessingParameterFileDestination,
     QgsProcessingParameterFolderDestination,
@@ -34,11 +48,16 @@ from qgis.core import (
     QgsProcessingParameterString,
     QgsMessageLog,
     QgsProcessingException,
+    QgsProcessingUtils,
+    QgsRectangle,
+    QgsSpatialIndex,
 )
 from qgis.PyQt.QtCore import QCoreApplication
 from processing.tools.system import isWindows
 
-from ..utils import LastoolsUtils
+from ..io import COG_EXTENSIONS, LaxIndex, build_vrt, can_cloud_optimize, cloud_optimize_files
+from ..utils import LastoolsCache, LastoolsHistory, LastoolsPool, LastoolsUtils, replay_lines
+from .lastools_pipeline import LastoolsPipeline
 
 class LastoolsAlgorithm(QgsProcessingAlgorithm):
         
@@ -46,12 +65,19 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
     CPU64 = "CPU64"
     GUI = "GUI"
     CORES = "CORES"
+    PER_FILE = "PER_FILE"
+    PER_TILE = "PER_TILE"
     INPUT_GENERIC = "INPUT_GENERIC"
     INPUT_GENERIC_DIRECTORY = "INPUT_GENERIC_DIRECTORY"
     INPUT_GENERIC_WILDCARDS = "INPUT_GENERIC_WILDCARDS"
     INPUT_LASLAZ = "INPUT_LASLAZ"
     INPUT_DIRECTORY = "INPUT_DIRECTORY"
     INPUT_WILDCARDS = "INPUT_WILDCARDS"
+    AOI = "AOI"
+    AOI_POLYGONS = "AOI_POLYGONS"
+    AOI_BUFFER = "AOI_BUFFER"
+    TILE_SIZE = "TILE_SIZE"
+    BUFFER = "BUFFER"
     MERGED = "MERGED"
     OUTPUT_GENERIC = "OUTPUT_GENERIC"
     OUTPUT_LASLAZ = "OUTPUT_LASLAZ"
@@ -62,6 +88,9 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
     OUTPUT_RASTER = "OUTPUT_RASTER"
     OUTPUT_RASTER_FORMAT = "OUTPUT_RASTER_FORMAT"
     OUTPUT_RASTER_FORMATS = ["tif", "bil", "img", "dtm", "asc", "xyz", "png", "jpg", "laz"]
+    CLOUD_OPTIMIZED = "CLOUD_OPTIMIZED"
+    VIRTUAL_RASTER = "VIRTUAL_RASTER"
+    OUTPUT_VRT = "OUTPUT_VRT"
     OUTPUT_VECTOR = "OUTPUT_VECTOR"
     OUTPUT_VECTOR_FORMAT = "OUTPUT_VECTOR_FORMAT"
     OUTPUT_VECTOR_FORMATS = ["shp", "wkt", "kml", "txt"]
@@ -73,6 +102,15 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
     APPLY_FILE_SOURCE_ID = "APPLY_FILE_SOURCE_ID"
     STEP = "STEP"
     FILE_FILTER_LASLAZ = "LAZ/LAS files (*.las *.laz);;TXT-files (*.txt);;All files (*.*))"
+    # options that need all input files in one process: no per file scheduling with them
+    PER_FILE_BLOCKERS = ["-o", "-merged", "-buffered", "-files_are_flightlines", "-files_are_plots", "-lof"]
+    # max. length of the input files on the command line, longer lists are passed with '-lof'
+    INPUT_FILES_LENGTH = 8000
+    # automatic tiling: points per tile (help: "should not exceed 10 million") and buffer in steps (or point spacings)
+    TILE_POINTS = 8000000
+    TILE_BUFFER_STEPS = 25
+    # smallest tile size of the tiling parameters, 0 stands for automatic
+    MIN_TILE_SIZE = 4.0
 
     # Generic options that should be reimplemented in child classes
     TOOL_NAME = "Generic"
@@ -87,6 +125,22 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
         self.has32 = False
         self.has64 = False
         self.isCpu64 = False
+        # resource usage of all LAStools runs of this algorithm, see record_metrics()
+        self.run_metrics = []
+        # temporary directory created for this run when none was chosen, see pipeline()
+        self.workspace = None
+        # input files in the area of interest and their list file, see get_parameters_aoi_files()
+        self.aoi_files = None
+        self.aoi_list_file = None
+        # GeoTIFF outputs are rewritten as cloud optimized GeoTIFFs, see finish_raster_outputs()
+        self.cloud_optimized = False
+        # virtual rasters over the output tiles, see add_parameters_virtual_raster_outputs()
+        self.virtual_rasters = []
+        # files the runs of the algorithm wrote, see finish_raster_outputs()
+        self.raster_outputs = []
+        # start and normalized parameters of the run for the performance history, see prepareAlgorithm()
+        self.run_started = None
+        self.run_parameters = None
 
     @staticmethod
     def tr(string):
@@ -116,25 +170,35 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
     # called already at plugin load and on each tool load
     def initAlgorithm(self, config=None):
         LastoolsUtils.lastools_check_path()
-        # check for avaliable 32/64 bit versions
-        file32 = ""
-        file64 = ""
-        if LastoolsUtils.has_wine() or isWindows():
-            file32 = os.path.join(LastoolsUtils.lastools_path(),self.LASTOOL+".exe")
-            file64 = os.path.join(LastoolsUtils.lastools_path(),self.LASTOOL+"64.exe")
-            self.has32 = os.path.isfile(file32)
-            self.has64 = os.path.isfile(file64)
-            LastoolsUtils.debug(f"[{self.LASTOOL}] versions = {'32' if self.has32 else ''} {'64' if self.has64 else ''}")
-        else:
-            self.has32 = False
-            file64 = os.path.join(LastoolsUtils.lastools_path(),self.LASTOOL+"64")
-            self.has64 = os.path.isfile(file64)
+        # check for avaliable 32/64 bit versions (from the cached scan of the LAStools folder)
+        self.has32, self.has64 = LastoolsUtils.lastools_versions(self.LASTOOL)
+        LastoolsUtils.debug(f"[{self.LASTOOL}] versions = {'32' if self.has32 else ''} {'64' if self.has64 else ''}")
         if not self.has32 and not self.has64:
             LastoolsUtils.log(f"[{self.LASTOOL}] No exe found at [{LastoolsUtils.lastools_path()}]")
         self.canCpu64 = self.has32 and self.has64
         self.canGui = self.has32
         self.isCpu64 = self.has64
 
+    def prepareAlgorithm(self, parameters, context, feedback):
+        self.run_started = time.monotonic()
+        self.run_parameters = self.normalized_parameters(parameters, context)
+        return super().prepareAlgorithm(parameters, context, feedback)
+
+    def normalized_parameters(self, parameters, context):
+        # the parameters which make runs comparable: no outputs (and temporary directories)
+        values = {}
+        for definition in self.parameterDefinitions():
+            if definition.isDestination():
+                continue
+            value = parameters.get(definition.name())
+            if value is None:
+                value = definition.defaultValue()
+            if not isinstance(value, (str, int, float, bool, list, type(None))):
+                # layers, extents, ...
+                value = definition.valueAsPythonString(value, context)
+            values[definition.name()] = value
+        return values
+
     def get_command(self, parameters, context, feedback):
         # check if 64 bit was changed by user
         if self.canCpu64:
@@ -146,11 +210,16 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
             feedback.reportError(f"Executeable {las_command} not found. Check configuration.")
         return las_command
 
-    def run_lastools(self, commands, feedback):
+    def lastool_command(self, lastool):
+        # executable of a pipeline stage, 64 bit if there is one
+        _, has64 = LastoolsUtils.lastools_versions(lastool)
+        return lastool + ("64" if has64 else "") + self.command_ext()
+
+    def lastools_commandline(self, commands, feedback):
         # add path to command
         commands[0] = self.pathwrap(os.path.join(LastoolsUtils.lastools_path(),commands[0]))
         # check for license file - if no license at all: run in demo mode. otherwise fail if license is overdue
-        isDemo = not os.path.isfile(os.path.join(LastoolsUtils.lastools_path(),"lastoolslicense.txt"))
+        isDemo = os.path.normcase("lastoolslicense.txt") not in (LastoolsUtils.lastools_executables() or ())
         if isDemo and (self.LICENSE == "c") and self.isCpu64:
             feedback.pushWarning("No license file found. Run in demo mode.")
             commands.insert(1,"-demo")
@@ -161,25 +230,236 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
         #
         if ("-gui" in commands) and (self.isCpu64):
             feedback.reportError("GUI not available at 64 bit")
-        commandline = " ".join(commands)
+        return " ".join(commands)
+
+    def lastools_returncode(self, commands, ret, severity):
+        # wrap ret on win32: unreliable
+        if not self.isCpu64 or ("-cores" in commands):
+            return severity
+        return ret
+
+    @staticmethod
+    def input_files(commands):
+        # all files given by '-i' options (wildcards expanded)
+        files = []
+        for i, command in enumerate(commands[:-1]):
+            if command == "-i":
+                files.extend(file for file in glob.glob(LastoolsCache.unwrap(commands[i + 1])) if os.path.isfile(file))
+        return files
+
+    def results(self, commands):
+        # output dictionary of processAlgorithm, the run is done
+        self.record_history()
+        results = {"commands": commands, "metrics": self.run_metrics}
+        # seconds by phase of the verbose output, by tool
+        phases = {}
+        for record in self.run_metrics:
+            for name, phase in record.get("verbose", {}).get("phases", {}).items():
+                tool = phases.setdefault(LastoolsHistory.stage_name(record["tool"]), {})
+                tool[name] = round(tool.get(name, 0.0) + phase["seconds"], 3)
+        if phases:
+            results["phases"] = phases
+        if self.virtual_rasters:
+            results[self.OUTPUT_VRT] = self.virtual_rasters
+        return results
+
+    def record_metrics(self, tool, commandline, inputs, returncode, metrics, cached=False):
+        record = {
+            "algorithm": self.name(),
+            "tool": tool,
+            "command": commandline,
+            "input_files": len(inputs),
+            "input_bytes": sum(os.path.getsize(file) for file in inputs),
+            "returncode": returncode,
+            "cached": cached,
+        }
+        record.update(metrics)
+        if "start" in record:
+            record["start"] = datetime.datetime.fromtimestamp(record["start"]).isoformat(timespec="seconds")
+        self.run_metrics.append(record)
+        try:
+            LastoolsUtils.log_metrics(record)
+        except OSError as e:
+            LastoolsUtils.log(f"metrics log not written: {e}")
+        return record
+
+    def record_history(self):
+        # the run in the performance history, see LastoolsHistory
+        if self.run_started is None or not self.run_metrics:
+            return
+        executables = {}
+        for record in self.run_metrics:
+            try:
+                stat = os.stat(os.path.join(LastoolsUtils.lastools_path(), record["tool"] + self.command_ext()))
+                executables[record["tool"]] = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                # in process stages
+                pass
+        wall_time = time.monotonic() - self.run_started
+        try:
+            LastoolsUtils.history().add(self.name(), self.run_parameters, wall_time, self.run_metrics, executables)
+        except (OSError, sqlite3.Error) as e:
+            LastoolsUtils.log(f"performance history not written: {e}")
+
+    @staticmethod
+    def commands_cores(commands):
+        return int(commands[commands.index("-cores") + 1]) if "-cores" in commands[:-1] else 1
+
+    def watch_raster_outputs(self, commands):
+        # state of the output files of a run before it, see finish_raster_outputs()
+        if not self.cloud_optimized and self.parameterDefinition(self.VIRTUAL_RASTER) is None:
+            return None
+        return LastoolsCache("", 0).watch(commands)
+
+    def finish_raster_outputs(self, watch, feedback, cores=1, files=None):
+        """
+        Keeps the files the run wrote since watch_raster_outputs() (or restored from the cache: files) for the
+        virtual rasters and rewrites its GeoTIFFs as cloud optimized GeoTIFFs, in parallel.
+        Only the files of the run itself: other runs may still be writing into the same folder.
+        """
+        if watch is None:
+            return
+        if files is None:
+            files = LastoolsCache.written(watch)
+        self.raster_outputs.extend(files)
+        files = [file for file in files if os.path.splitext(file)[1].lower() in COG_EXTENSIONS]
+        if not self.cloud_optimized or not files:
+            return
+        if not can_cloud_optimize():
+            feedback.pushWarning("GeoTIFFs are not cloud optimized: GDAL is not available")
+            return
+        feedback.pushInfo(f"cloud optimizing {len(files)} GeoTIFF files on {cores} cores")
+
+        def progress(file, done, total):
+            feedback.pushInfo(f"[{done}/{total}] {os.path.basename(file)} cloud optimized")
+
+        failed = cloud_optimize_files(files, cores, progress)
+        for file, error in failed.items():
+            feedback.reportError(f"{file} not cloud optimized: {error}")
+
+    def run_lastools(self, commands, feedback, label=""):
+        # a canceled run must not start any further (pipeline) stage
+        if feedback.isCanceled():
+            raise QgsProcessingException("Canceled by user.")
+        raster_outputs = self.watch_raster_outputs(commands)
+        tool = os.path.splitext(os.path.basename(LastoolsCache.unwrap(commands[0])))[0]
+        inputs = self.input_files(commands)
+        commandline = self.lastools_commandline(commands, feedback)
         feedback.pushConsoleInfo("LAStools command line")
         feedback.pushConsoleInfo(commandline)
+        # identical command on unchanged inputs: restore the results of the earlier run
+        cache = LastoolsUtils.cache()
+        key = cache.key(commands) if cache is not None else None
+        if key is not None:
+            console_file = cache.restore(key)
+            if console_file is not None:
+                feedback.pushConsoleInfo("LAStools results restored from cache")
+                if os.path.isfile(console_file):
+                    replay_lines(feedback, console_file)
+                self.record_metrics(tool, commandline, inputs, 0, {}, cached=True)
+                self.finish_raster_outputs(
+                    raster_outputs, feedback, self.commands_cores(commands), cache.outputs(key)
+                )
+                return 0
+            watch = cache.watch(commands)
+            console_file = cache.console_file(key)
+        else:
+            console_file = None
         feedback.pushConsoleInfo("LAStools console output")
-        ret, output = LastoolsUtils.execute_command(commandline)
-        # wrap ret on win32: unreliable
-        if not self.isCpu64 or ("-cores" in commands):
-            if "ERROR:" in output:
-                ret = 3
-            elif "WARNING:" in output:
-                ret = 1
+        # console lines are forwarded and classified while the tool is running
+        ret, severity, metrics = LastoolsUtils.execute_command(commandline, feedback, console_file, label)
+        if feedback.isCanceled():
+            if key is not None:
+                cache.discard(console_file)
+            raise QgsProcessingException(f"{commands[0]} canceled by user.")
+        ret = self.lastools_returncode(commands, ret, severity)
+        self.record_metrics(tool, commandline, inputs, ret, metrics)
+        if key is not None:
+            # without the output files of the command known there is nothing to store
+            if ret < 3 and watch is not None:
+                cache.store(key, watch, console_file)
             else:
-                ret = 0
+                cache.discard(console_file)
         if ret >= 3:
-            feedback.reportError(output)
+            feedback.reportError(f"{commands[0]} finished with errors (return code {ret})")
         elif ret >= 1:
-            feedback.pushWarning(output)
-        else:
-            feedback.pushConsoleInfo(output)
+            feedback.pushWarning(f"{commands[0]} finished with warnings (return code {ret})")
+        if ret < 3:
+            self.finish_raster_outputs(raster_outputs, feedback, self.commands_cores(commands))
+        return ret
+
+    def run_lastools_per_file(self, parameters, context, commands, feedback):
+        # optional: expand the input wildcards here and run one process per input file instead of '-cores'
+        if not self.parameterAsBool(parameters, self.PER_FILE, context):
+            return self.run_lastools(commands, feedback)
+        # remove the wildcard inputs and the '-cores' option: the pool does the parallelization now
+        wildcards = []
+        self.add_parameters_point_input_folder_commands(parameters, context, wildcards)
+        self.add_parameters_generic_input_folder_commands(parameters, context, wildcards)
+        base = list(commands)
+        for i in range(0, len(wildcards), 2):
+            for j in range(1, len(base) - 1):
+                if base[j] == wildcards[i] and base[j + 1] == wildcards[i + 1]:
+                    del base[j : j + 2]
+                    break
+        blockers = [option for option in self.PER_FILE_BLOCKERS if option in base]
+        files = self.get_parameters_input_folder_files(parameters, context)
+        if blockers or not files:
+            if blockers:
+                feedback.pushWarning(f"Option {' '.join(blockers)} needs all files at once: no per file processing.")
+            return self.run_lastools(commands, feedback)
+        if feedback.isCanceled():
+            raise QgsProcessingException("Canceled by user.")
+        if "-cores" in base:
+            i = base.index("-cores")
+            del base[i : i + 2]
+        cores = max(1, self.parameterAsInt(parameters, self.CORES, context))
+        tool = os.path.splitext(os.path.basename(LastoolsCache.unwrap(base[0])))[0]
+        commandline = self.lastools_commandline(base, feedback)
+        jobs = [(os.path.basename(file), f"{commandline} -i {self.pathwrap(file)}") for file in files]
+        paths = {os.path.basename(file): file for file in files}
+        feedback.pushConsoleInfo(f"LAStools per file processing of {len(jobs)} files on {cores} cores")
+        feedback.pushConsoleInfo(jobs[0][1])
+        failed = []
+        raster_outputs = self.watch_raster_outputs(base + [arg for file in files for arg in ("-i", file)])
+
+        def finished(process, done, total):
+            ret = self.lastools_returncode(base, process.returncode, process.severity)
+            self.record_metrics(tool, process.commandline, [paths[process.label]], ret, process.metrics)
+            if ret >= 3:
+                failed.append(process.label)
+                feedback.reportError(f"{process.label} failed (return code {ret})")
+            feedback.pushInfo(f"[{done}/{total}] {process.label} finished")
+            feedback.setProgress(100.0 * done / total)
+
+        LastoolsPool(cores, feedback).run(jobs, finished)
+        if feedback.isCanceled():
+            raise QgsProcessingException(f"{commands[0]} canceled by user.")
+        if failed:
+            feedback.reportError(f"{len(failed)} of {len(jobs)} files failed: {' '.join(failed)}")
+            if len(failed) == len(jobs):
+                raise QgsProcessingException(f"{commands[0]} failed on all files.")
+        self.finish_raster_outputs(raster_outputs, feedback, cores)
+
+    def pipeline(self, parameters, context, feedback):
+        # the stages of the pipeline algorithms share the cores and the temporary directory
+        cores = self.parameterAsInt(parameters, self.CORES, context)
+        managed = parameters.get(self.TEMPORARY_DIRECTORY) in (None, "", QgsProcessing.TEMPORARY_OUTPUT)
+        if managed:
+            scratch_folder = LastoolsUtils.scratch_folder()
+            os.makedirs(scratch_folder, exist_ok=True)
+            self.workspace = tempfile.mkdtemp(prefix=f"{self.name()}_", dir=scratch_folder)
+            feedback.pushInfo(f"temporary directory: {self.workspace}")
+        output_directory = self.parameterAsString(parameters, self.OUTPUT_DIRECTORY, context)
+        return LastoolsPipeline(
+            self,
+            feedback,
+            cores,
+            self.get_parameters_temporary_directory(parameters, context),
+            output_directory.removesuffix(self.OUTPUT_DIRECTORY),
+            self.parameterAsBool(parameters, self.PER_TILE, context),
+            managed,
+        )
 
     def add_parameters_verbose_64_gui(self):
         self.addParameter(QgsProcessingParameterBoolean(self.VERBOSE, "verbose", True))
@@ -207,6 +487,20 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
             commands.append("-cores")
             commands.append(str(cores))
 
+    def add_parameters_per_file_gui(self):
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.PER_FILE, "one process per file (per file progress, largest files first)", False
+            )
+        )
+
+    def add_parameters_per_tile_gui(self):
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.PER_TILE, "process tile by tile (a tile goes on to the next step when done)", False
+            )
+        )
+
     def add_parameters_generic_input_gui(self, description, extension, optional):
         param = QgsProcessingParameterFile(self.INPUT_GENERIC, description, QgsProcessingParameterFile.File, extension, None, optional)
         if LastoolsUtils.isDebug():
@@ -274,6 +568,9 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
         self.addParameter(QgsProcessingParameterString(self.INPUT_WILDCARDS, "input wildcard(s)", "*.laz" if uselas == False else "*.las"))
 
     def add_parameters_point_input_folder_commands(self, parameters, context, commands):
+        if self.get_parameters_aoi_files(parameters, context) is not None:
+            self.add_parameters_aoi_files_commands(commands)
+            return
         input_directory = self.parameterAsString(parameters, self.INPUT_DIRECTORY, context)
         wildcards = self.parameterAsString(parameters, self.INPUT_WILDCARDS, context).split()
         for wildcard in wildcards:
@@ -283,6 +580,177 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
             else:
                 commands.append(self.pathwrap(wildcard))
 
+    def get_parameters_input_folder_files(self, parameters, context):
+        # expand the input wildcard(s) of a point or generic input folder, largest files first
+        files = set()
+        for directory, wildcards in [
+            (self.INPUT_DIRECTORY, self.INPUT_WILDCARDS),
+            (self.INPUT_GENERIC_DIRECTORY, self.INPUT_GENERIC_WILDCARDS),
+        ]:
+            input_directory = self.parameterAsString(parameters, directory, context)
+            if directory == self.INPUT_DIRECTORY and self.get_parameters_aoi_files(parameters, context) is not None:
+                files.update(self.aoi_files)
+                continue
+            for wildcard in self.parameterAsString(parameters, wildcards, context).split():
+                files.update(glob.glob(os.path.join(input_directory, wildcard)))
+        files = [file for file in files if os.path.isfile(file)]
+        return sorted(files, key=lambda file: (-os.path.getsize(file), file))
+
+    def get_parameters_input_folder_catalog(self, parameters, context, **query):
+        # header summaries of the files of the point input folder, see LasCatalog.files() for the query
+        input_directory = self.parameterAsString(parameters, self.INPUT_DIRECTORY, context)
+        wildcards = self.parameterAsString(parameters, self.INPUT_WILDCARDS, context).split()
+        catalog = LastoolsUtils.catalog()
+        catalog.refresh(input_directory, wildcards)
+        return catalog.files(input_directory, wildcards, **query)
+
+    def get_parameters_input_catalog(self, parameters, context):
+        # header summaries of the input folder or of the single input file
+        if self.parameterDefinition(self.INPUT_DIRECTORY) is not None:
+            return self.get_parameters_input_folder_catalog(parameters, context)
+        input_las_laz = self.parameterAsString(parameters, self.INPUT_LASLAZ, context)
+        wildcards = [glob.escape(os.path.basename(input_las_laz))]
+        catalog = LastoolsUtils.catalog()
+        catalog.refresh(os.path.dirname(input_las_laz), wildcards)
+        return catalog.files(os.path.dirname(input_las_laz), wildcards)
+
+    def get_parameters_tile_size_buffer(self, parameters, context, feedback):
+        # tile size 0: chosen from the point density in the headers of the input files
+        tile_size = self.parameterAsDouble(parameters, self.TILE_SIZE, context)
+        buffer = self.parameterAsDouble(parameters, self.BUFFER, context)
+        if 0 < tile_size < self.MIN_TILE_SIZE:
+            raise QgsProcessingException(
+                f"Tile size {tile_size:g} is too small: at least {self.MIN_TILE_SIZE:g}, or 0 for automatic."
+            )
+        if tile_size > 0:
+            return tile_size, buffer
+        step = None
+        if self.parameterDefinition(self.STEP) is not None:
+            step = self.get_parameters_step_value(parameters, context)
+        return self.auto_tiling(self.get_parameters_input_catalog(parameters, context), buffer, step, feedback)
+
+    def auto_tiling(self, entries, buffer, step, feedback):
+        """
+        Tile size for about TILE_POINTS points per tile and a buffer of at least TILE_BUFFER_STEPS steps
+        (without step: point spacings) from the header summaries of the input files, see LasCatalog.
+        """
+        entries = [entry for entry in entries if entry["point_count"]]
+        if not entries:
+            raise QgsProcessingException("Automatic tile size: no point counts in the headers of the input files.")
+        min_x = min(entry["min_x"] for entry in entries)
+        min_y = min(entry["min_y"] for entry in entries)
+        max_x = max(entry["max_x"] for entry in entries)
+        max_y = max(entry["max_y"] for entry in entries)
+        points = sum(entry["point_count"] for entry in entries)
+        area = (max_x - min_x) * (max_y - min_y)
+        # the densest file wins over the average: flight lines only cover parts of the bounding box
+        density = max([points / area if area > 0 else 0.0] + [entry["density"] for entry in entries])
+        if density <= 0:
+            raise QgsProcessingException("Automatic tile size: the input files have no extent.")
+        # rounded down to a multiple of half a power of ten, e.g. 894.4 to 850
+        exact = math.sqrt(self.TILE_POINTS / density)
+        unit = 10 ** math.floor(math.log10(exact)) / 2
+        tile_size = max(self.MIN_TILE_SIZE, unit * 2, math.floor(exact / unit) * unit)
+        buffer = max(buffer, self.TILE_BUFFER_STEPS * (step or 1 / math.sqrt(density)))
+        buffer = math.ceil(buffer)
+        tiles = (math.floor(max_x / tile_size) - math.floor(min_x / tile_size) + 1) * (
+            math.floor(max_y / tile_size) - math.floor(min_y / tile_size) + 1
+        )
+        tile_points = density * (tile_size + 2 * buffer) ** 2
+        record_length = max(entry["point_record_length"] for entry in entries)
+        feedback.pushInfo(
+            f"automatic tiling: tile size {tile_size:g} and buffer {buffer:g} for {density:.1f} points per square unit, "
+            f"up to {tiles} tiles of about {tile_points / 1e6:.1f} million points "
+            f"({tile_points * record_length / 1024**2:.0f} MB uncompressed) each"
+        )
+        return tile_size, buffer
+
+    def add_parameters_aoi_gui(self):
+        self.addParameter(
+            QgsProcessingParameterExtent(
+                self.AOI, "area of interest (only input files intersecting it are processed)", None, True
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.AOI_POLYGONS,
+                "area of interest polygon(s)",
+                [QgsProcessing.TypeVectorPolygon],
+                None,
+                True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.AOI_BUFFER, "area of interest buffer", QgsProcessingParameterNumber.Double, 0.0, False, 0.0
+            )
+        )
+
+    def get_parameters_aoi_files(self, parameters, context):
+        # files of the point input folder whose bounding box intersects the area of interest, None without one
+        if self.aoi_files is not None or self.parameterDefinition(self.AOI) is None:
+            return self.aoi_files
+        use_extent = parameters.get(self.AOI) not in (None, "")
+        use_polygons = parameters.get(self.AOI_POLYGONS) not in (None, "")
+        if not use_extent and not use_polygons:
+            return None
+        entries = self.get_parameters_input_folder_catalog(parameters, context)
+        # the area of interest in the CRS of the input files (as far as they have one)
+        crs = QgsCoordinateReferenceSystem()
+        definition = next((entry["crs"] for entry in entries if entry["crs"]), "")
+        if definition:
+            crs.createFromUserInput(definition)
+        areas = []
+        if use_extent:
+            areas.append(QgsGeometry.fromRect(self.parameterAsExtent(parameters, self.AOI, context, crs)))
+        if use_polygons:
+            request = QgsFeatureRequest()
+            if crs.isValid():
+                request.setDestinationCrs(crs, context.transformContext())
+            source = self.parameterAsSource(parameters, self.AOI_POLYGONS, context)
+            areas.extend(feature.geometry() for feature in source.getFeatures(request) if feature.hasGeometry())
+        buffer = self.parameterAsDouble(parameters, self.AOI_BUFFER, context)
+        if buffer > 0:
+            areas = [area.buffer(buffer, 8) for area in areas]
+        # R-tree of the bounding boxes from the headers, the exact test only for its candidates
+        index = QgsSpatialIndex()
+        boxes = []
+        for i, entry in enumerate(entries):
+            boxes.append(QgsRectangle(entry["min_x"], entry["min_y"], entry["max_x"], entry["max_y"]))
+            index.addFeature(i, boxes[i])
+        selected = set()
+        for area in areas:
+            selected.update(i for i in index.intersects(area.boundingBox()) if area.intersects(boxes[i]))
+        # with a spatial index (*.lax) a file is only taken if one of its occupied cells intersects
+        extents = [area.boundingBox() for area in areas]
+        extents = [(box.xMinimum(), box.yMinimum(), box.xMaximum(), box.yMaximum()) for box in extents]
+        for i in list(selected):
+            lax = LaxIndex.read(entries[i]["path"])
+            if lax is not None and not any(
+                area.intersects(QgsRectangle(*rect))
+                for area, extent in zip(areas, extents)
+                for rect in lax.cells_in(extent).values()
+            ):
+                selected.discard(i)
+        if not selected:
+            raise QgsProcessingException("No input file intersects the area of interest.")
+        self.aoi_files = [entries[i]["path"] for i in sorted(selected)]
+        return self.aoi_files
+
+    def add_parameters_aoi_files_commands(self, commands):
+        # the files in the area of interest one by one, or as list file when the command line gets too long
+        if sum(len(file) + 4 for file in self.aoi_files) <= self.INPUT_FILES_LENGTH:
+            for file in self.aoi_files:
+                commands.append("-i")
+                commands.append(self.pathwrap(file))
+            return
+        if self.aoi_list_file is None:
+            self.aoi_list_file = QgsProcessingUtils.generateTempFilename("aoi_files.txt")
+            with open(self.aoi_list_file, "w", encoding="utf-8") as out:
+                out.write("".join(f"{file}\n" for file in self.aoi_files))
+        commands.append("-lof")
+        commands.append(self.pathwrap(self.aoi_list_file))
+
     def add_parameters_point_input_merged_gui(self):
         self.addParameter(
             QgsProcessingParameterBoolean(self.MERGED, "merge all input files on-the-fly into one", False)
@@ -389,12 +857,14 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
         if LastoolsUtils.isDebug():
             param.setDefaultValue('/lastools/data/out.tif') 
         self.addParameter(param)
+        self.add_parameters_cloud_optimized_gui()
 
     def add_parameters_raster_output_commands(self, parameters, context, commands):
         output = self.parameterAsString(parameters, self.OUTPUT_RASTER, context)
         if output != "":
             commands.append("-o")
             commands.append(self.pathwrap(output))
+        self.cloud_optimized = self.parameterAsBool(parameters, self.CLOUD_OPTIMIZED, context)
 
     def add_parameters_raster_output_format_gui(self):
         self.addParameter(
@@ -406,10 +876,75 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
                 0,
             )
         )
+        self.add_parameters_cloud_optimized_gui()
 
     def add_parameters_raster_output_format_commands(self, parameters, context, commands):
+        commands.append("-o" + self.get_parameters_raster_output_format(parameters, context))
+        self.cloud_optimized = self.parameterAsBool(parameters, self.CLOUD_OPTIMIZED, context)
+
+    def add_parameters_virtual_raster_gui(self):
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.VIRTUAL_RASTER, "virtual raster (VRT) of the output tiles, added to the project", False
+            )
+        )
+        self.addOutput(QgsProcessingOutputMultipleLayers(self.OUTPUT_VRT, "virtual rasters"))
+
+    def add_parameters_virtual_raster_outputs(self, parameters, context, feedback):
+        """
+        Writes a virtual raster (VRT) over the raster tiles of a directory run, one for each product
+        (e.g. '_p95' of lascanopy), and loads them into the project when the algorithm is done.
+        The VRTs are built from the headers of the tiles only, without reading a cell, and only over
+        the tiles of this run (see finish_raster_outputs()), not over older rasters in the same folder.
+        """
+        if not self.parameterAsBool(parameters, self.VIRTUAL_RASTER, context):
+            return
+        extension = os.path.normcase("." + self.get_parameters_raster_output_format(parameters, context))
+        appendix = os.path.normcase(self.parameterAsString(parameters, self.OUTPUT_APPENDIX, context))
+        output_dir = self.parameterAsString(parameters, self.OUTPUT_DIRECTORY, context)
+        output_dir = output_dir.removesuffix(self.OUTPUT_DIRECTORY)
+        inputs = self.get_parameters_input_folder_files(parameters, context)
+        names = {os.path.normcase(os.path.splitext(os.path.basename(file))[0]) + appendix for file in inputs}
+        folders = [output_dir] if output_dir else sorted({os.path.dirname(file) for file in inputs})
+        # outputs are named like their input with the appendix and the suffix of the product
+        products = {}
+        for file in sorted(set(self.raster_outputs)):
+            name, ext = os.path.splitext(os.path.normcase(os.path.basename(file)))
+            if ext != extension:
+                continue
+            for length in range(len(name), 0, -1):
+                if name[:length] in names:
+                    products.setdefault(name[length:], []).append(file)
+                    break
+        if not products:
+            feedback.pushWarning(f"no {extension} tiles of the input files for a virtual raster")
+            return
+        for suffix, files in sorted(products.items()):
+            vrt = os.path.join(folders[0], f"{self.LASTOOL}{appendix}{suffix}.vrt")
+            try:
+                columns, rows = build_vrt(files, vrt)
+            except (OSError, ValueError) as e:
+                feedback.reportError(f"virtual raster {vrt} not written: {e}")
+                continue
+            feedback.pushInfo(f"virtual raster {vrt} of {len(files)} tiles, {columns} x {rows} cells")
+            self.virtual_rasters.append(vrt)
+            name = os.path.splitext(os.path.basename(vrt))[0]
+            context.addLayerToLoadOnCompletion(
+                vrt, QgsProcessingContext.LayerDetails(name, context.project(), self.OUTPUT_VRT)
+            )
+
+    def add_parameters_cloud_optimized_gui(self):
+        # shared by the raster output file and the raster output format, once per algorithm
+        if self.parameterDefinition(self.CLOUD_OPTIMIZED) is None:
+            self.addParameter(
+                QgsProcessingParameterBoolean(
+                    self.CLOUD_OPTIMIZED, "cloud optimized GeoTIFF (tiled, compressed, with overviews)", False
+                )
+            )
+
+    def get_parameters_raster_output_format(self, parameters, context):
         format_output_raster = self.parameterAsInt(parameters, self.OUTPUT_RASTER_FORMAT, context)
-        commands.append("-o" + self.OUTPUT_RASTER_FORMATS[format_output_raster])
+        return self.OUTPUT_RASTER_FORMATS[format_output_raster]
 
     def add_parameters_vector_output_gui(self):
         param = QgsProcessingParameterFileDestination(self.OUTPUT_VECTOR, "output vector file", "shp", "", True, False)
@@ -463,19 +998,28 @@ class LastoolsAlgorithm(QgsProcessingAlgorithm):
     def add_parameters_temporary_directory_gui(self):
         self.addParameter(
             QgsProcessingParameterFolderDestination(
-                self.TEMPORARY_DIRECTORY, "temporary directory (must be empty!!!)", None, False
+                self.TEMPORARY_DIRECTORY,
+                "temporary directory (empty: automatic, removed when done; or the one of an earlier run to resume it)",
+                None,
+                True,
+                False,
             )
         )
 
+    def get_parameters_temporary_directory(self, parameters, context):
+        if self.workspace is not None:
+            return self.workspace
+        temp_dir = self.parameterAsString(parameters, self.TEMPORARY_DIRECTORY, context)
+        return temp_dir.removesuffix(self.OUTPUT_DIRECTORY) # may added on temp dir, remove now!
+
     def add_parameters_temporary_directory_as_output_directory_commands(self, parameters, context, commands):
-        output_dir = self.parameterAsString(parameters, self.TEMPORARY_DIRECTORY, context)
+        output_dir = self.get_parameters_temporary_directory(parameters, context)
         if output_dir != "":
             commands.append("-odir")
-            output_dir = output_dir.removesuffix(self.OUTPUT_DIRECTORY) # may added on temp dir, remove now!
             commands.append(self.pathwrap(output_dir))
 
     def add_parameters_temporary_directory_as_input_files_commands(self, parameters, context, commands, files):
-        temp_output = self.parameterAsString(parameters, self.TEMPORARY_DIRECTORY, context)
+        temp_output = self.get_parameters_temporary_directory(parameters, context)
         if temp_output != "":
             commands.append("-i")
             commands.append(os.path.join(self.pathwrap(temp_output), files))
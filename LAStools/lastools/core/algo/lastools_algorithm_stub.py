@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    lastools_algorithm_stub.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import importlib
+
+from qgis.core import QgsProcessingAlgorithm
+from qgis.PyQt.QtGui import QIcon
+
+from ..utils import lasgroup_info, lastool_info, licence, paths
+
+# package of the algorithm modules, see registry.py
+CORE_PACKAGE = __package__.rsplit(".", 1)[0]
+
+
+class LastoolsAlgorithmStub(QgsProcessingAlgorithm):
+    """
+    Placeholder registered in the toolbox instead of the real algorithm.
+
+    It answers the toolbox (name, group, icon) from the registry and imports the module of
+    the real algorithm only when an instance is created to run, to show its dialog or its help.
+    The parameters are not defined on the stub, so the provider load does not have to
+    initialize (and look up the executables of) all algorithms.
+    """
+
+    def __init__(self, tool_name, lastool, module, class_name, lasgroup, license):
+        super().__init__()
+        self.TOOL_NAME = tool_name
+        self.LASTOOL = lastool
+        self.LICENSE = license
+        self.LASGROUP = lasgroup
+        self.module = module
+        self.class_name = class_name
+
+    def algorithm_class(self):
+        module = importlib.import_module(f"{CORE_PACKAGE}.{self.module}")
+        return getattr(module, self.class_name)
+
+    def initAlgorithm(self, config=None):
+        pass
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # not reached: processing runs the initialized instance returned by create()
+        return self.create().processAlgorithm(parameters, context, feedback)
+
+    def createInstance(self):
+        return self.algorithm_class()()
+
+    def name(self):
+        return self.TOOL_NAME
+
+    def displayName(self):
+        return lastool_info[self.TOOL_NAME]["disp"]
+
+    def group(self):
+        return lasgroup_info[self.LASGROUP]["group"]
+
+    def groupId(self):
+        return lasgroup_info[self.LASGROUP]["group_id"]
+
+    # help from the algorithm, some tools have no README: the module is imported when the help is shown
+    def helpUrl(self):
+        return self.createInstance().helpUrl()
+
+    def shortHelpString(self):
+        return self.createInstance().shortHelpString()
+
+    def shortDescription(self):
+        return lastool_info[self.TOOL_NAME]["desc"]
+
+    def icon(self):
+        icon_file = licence[self.LICENSE]["path"]
+        return QIcon(f"{paths['img']}{icon_file}")
@@ -0,0 +1,848 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    lastools_pipeline.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import datetime
+import fnmatch
+import glob
+import json
+import os
+import queue
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+
+from qgis.core import QgsProcessingException
+
+from ..io import mosaic_formats, mosaic_rasters
+from ..utils import LastoolsCache, LastoolsHistory, LastoolsUtils
+
+
+@lru_cache(maxsize=None)
+def patterns_overlap(first, second):
+    """True if there is a file name matched by both wildcard patterns ('*' and '?')."""
+    first = os.path.normcase(first)
+    second = os.path.normcase(second)
+
+    @lru_cache(maxsize=None)
+    def overlap(i, j):
+        if i == len(first) and j == len(second):
+            return True
+        if i < len(first) and first[i] == "*":
+            # the '*' matches nothing or (at least) the next character of the other pattern
+            if overlap(i + 1, j) or (j < len(second) and overlap(i, j + 1)):
+                return True
+        if j < len(second) and second[j] == "*":
+            if overlap(i, j + 1) or (i < len(first) and overlap(i + 1, j)):
+                return True
+        if i < len(first) and j < len(second) and first[i] != "*" and second[j] != "*":
+            if first[i] == second[j] or "?" in (first[i], second[j]):
+                return overlap(i + 1, j + 1)
+        return False
+
+    return overlap(0, 0)
+
+
+# options of stages which need all files at once, these stages never run per tile
+TILE_BLOCKERS = ["-o", "-merged", "-lof", "-files_are_flightlines", "-files_are_plots", "-reverse_tiling"]
+
+
+class LastoolsStage:
+    """
+    One LAStools run of a pipeline with the files (wildcard patterns) it reads and writes.
+    A stage with a function runs it in process instead, the commands only describe the run.
+    """
+
+    def __init__(self, name, commands, outputs, inputs=None, function=None):
+        self.name = name
+        # function(input files, cores) of a stage run in process
+        self.function = function
+        # position in the pipeline
+        self.index = 0
+        self.commands = commands
+        if inputs is None:
+            inputs = [commands[i + 1] for i, command in enumerate(commands[:-1]) if command == "-i"]
+        # patterns without the quotes of LastoolsAlgorithm.pathwrap, also inside of the pattern
+        self.inputs = [pattern.replace('"', "") for pattern in inputs if pattern]
+        self.outputs = [pattern.replace('"', "") for pattern in outputs if pattern]
+        # '-cores' in the commands: the pipeline decides on the number of cores
+        self.multi_core = "-cores" in commands
+        self.dependencies = []
+        self.done = False
+        # per tile runs: the tile names (what the '*' of the input pattern stands for) and the finished ones
+        self.tiles = None
+        self.tiles_done = set()
+        # files written by the finished runs of the stage (or by the earlier run they were skipped for)
+        self.files = set()
+        # intermediate files already deleted, see LastoolsPipeline.collect_garbage()
+        self.collected = set()
+        # share of the work done, set by the function of a stage run in process while it runs
+        self.fraction = None
+
+    def conflicts(self, earlier):
+        # read after write, write after read and write after write of the same files
+        def overlap(first, second):
+            return any(patterns_overlap(a, b) for a in first for b in second)
+
+        return (
+            overlap(earlier.outputs, self.inputs)
+            or overlap(self.outputs, earlier.inputs)
+            or overlap(self.outputs, earlier.outputs)
+        )
+
+    def per_tile(self):
+        # one input pattern with a single '*' and one output file per input file
+        return (
+            len(self.inputs) == 1
+            and self.inputs[0].count("*") == 1
+            and "?" not in self.inputs[0]
+            and not any(option in self.commands for option in TILE_BLOCKERS)
+        )
+
+    def find_tiles(self, files=None):
+        prefix, suffix = self.inputs[0].split("*")
+        if files is None:
+            files = glob.glob(self.inputs[0])
+        return sorted(file[len(prefix) : len(file) - len(suffix)] for file in files)
+
+    def commands_on(self, cores, tile=None):
+        commands = list(self.commands)
+        if "-cores" in commands:
+            i = commands.index("-cores")
+            del commands[i : i + 2]
+        if tile is not None:
+            i = next(i for i, command in enumerate(commands[:-1]) if command == "-i" and "*" in commands[i + 1])
+            commands[i + 1] = commands[i + 1].replace("*", tile)
+        if cores > 1:
+            commands.append("-cores")
+            commands.append(str(cores))
+        return commands
+
+
+class LastoolsJob:
+    """A stage run on all its inputs, or on a single tile."""
+
+    def __init__(self, stage, tile=None):
+        self.stage = stage
+        self.tile = tile
+        self.cores = 1
+        # set when the job starts: the time, the state of its output files and the number of files it writes
+        self.started = None
+        self.before = None
+        self.expected = None
+
+    def ready(self):
+        for dependency in self.stage.dependencies:
+            if self.tile is not None and dependency.tiles is not None and self.tile in dependency.tiles:
+                # per tile only the same tile of the previous per tile stage has to be finished
+                if self.tile not in dependency.tiles_done:
+                    return False
+            elif not dependency.done:
+                return False
+        return True
+
+    def label(self):
+        return self.stage.name if self.tile is None else f"{self.stage.name} {self.tile.strip('_')}"
+
+    def outputs(self):
+        # current state of all output files, a single tile only writes the files of the tile
+        patterns = self.stage.outputs
+        if self.tile is not None:
+            patterns = [pattern.replace("*", self.tile) for pattern in patterns]
+        files = {}
+        for pattern in patterns:
+            for file in glob.glob(pattern):
+                stat = os.stat(file)
+                files[file] = [stat.st_size, stat.st_mtime_ns]
+        return files
+
+
+class PipelineFeedback:
+    """
+    The feedback of the worker threads of a pipeline. The messages are queued and forwarded to the
+    processing feedback by the pipeline loop (see forward()), as LastoolsPool does for its processes:
+    the log of the processing feedback is not synchronized. The pipeline reports the progress itself.
+    """
+
+    def __init__(self, feedback):
+        self.feedback = feedback
+        self.messages = queue.SimpleQueue()
+
+    def isCanceled(self):
+        return self.feedback.isCanceled()
+
+    def pushInfo(self, *args):
+        self.messages.put(("pushInfo", args))
+
+    def pushConsoleInfo(self, *args):
+        self.messages.put(("pushConsoleInfo", args))
+
+    def pushCommandInfo(self, *args):
+        self.messages.put(("pushCommandInfo", args))
+
+    def pushWarning(self, *args):
+        self.messages.put(("pushWarning", args))
+
+    def reportError(self, *args):
+        self.messages.put(("reportError", args))
+
+    def setProgress(self, progress):
+        pass
+
+    def setProgressText(self, text):
+        pass
+
+    def forward(self):
+        """Forwards the queued messages, called by the thread of the processing feedback only."""
+        while True:
+            try:
+                name, args = self.messages.get_nowait()
+            except queue.Empty:
+                return
+            getattr(self.feedback, name)(*args)
+
+
+class LastoolsPipeline:
+    """
+    Runs the stages of a pipeline algorithm as a graph instead of one after the other.
+
+    A stage depends on all earlier stages it shares files with (see LastoolsStage.conflicts),
+    stages without such a dependency run at the same time. The cores budget is shared by the
+    running stages: a single ready stage gets all cores, several ready stages split them.
+    A stage may also run a function in process instead of a LAStools command (see add_mosaic).
+
+    With per_tile the stages working file by file on the tiles are run tile by tile instead:
+    a tile moves on to the next stage as soon as it is done, without waiting for the slowest
+    tile of the stage. All tile runs share one pool of single core workers.
+
+    Every finished run is recorded in a manifest in the temporary directory: its command, the
+    state of its input files (see LastoolsCache.key) and of its output files. Running the
+    pipeline again in the same temporary directory skips all runs which are up to date.
+
+    A managed temporary directory was created for this run only: intermediate files are deleted
+    as soon as no later stage reads them any more and the directory is removed at the end.
+    Before the first stage the disk space the temporary files need is estimated and checked.
+
+    The progress of all stages is reported as one, each stage weighted by its cost (see stage_weights),
+    with an estimate of the time left.
+    """
+
+    POLL_INTERVAL = 0.1
+    # seconds between two progress reports
+    PROGRESS_INTERVAL = 1.0
+    # costs of the stages relative to each other, by tool, without earlier runs in the performance history
+    STAGE_WEIGHTS = {
+        "lastile": 1.0,
+        "lasground": 3.0,
+        "lasground_new": 4.0,
+        "lasheight": 1.0,
+        "lasclassify": 2.0,
+        "lasthin": 0.5,
+        "las2dem": 1.0,
+        "blast2dem": 1.0,
+        "lasgrid": 0.5,
+        "mosaic": 0.2,
+    }
+    MANIFEST = "lastools_pipeline.json"
+    # estimated output size of a stage relative to the size of its inputs, by file extension
+    SIZE_RATIOS = {".las": 1.0, ".laz": 1.0}
+    RASTER_SIZE_RATIO = 0.1
+    # free disk space required on top of the estimate
+    DISK_SPACE_MARGIN = 1.2
+
+    def __init__(
+        self,
+        algorithm,
+        feedback,
+        cores=1,
+        temporary_directory="",
+        output_directory="",
+        per_tile=False,
+        managed=False,
+    ):
+        self.algorithm = algorithm
+        self.feedback = feedback
+        # messages of the stages, from the worker threads
+        self.messages = PipelineFeedback(feedback)
+        self.cores = max(1, cores)
+        self.temporary_directory = temporary_directory
+        # without output directory the results are written next to their inputs in the temporary directory
+        self.output_directory = output_directory or temporary_directory
+        self.per_tile = per_tile
+        self.managed = managed and bool(temporary_directory)
+        self.stages = []
+        self.manifest = {}
+        self.manifest_lock = threading.Lock()
+        # only used to compute the keys of the runs, never stores anything
+        self.keys = LastoolsCache("", 0)
+
+    def temporary(self, files):
+        return os.path.join(self.temporary_directory, files)
+
+    def output(self, files):
+        return os.path.join(self.output_directory, files)
+
+    def add(self, name, commands, outputs, inputs=None, function=None):
+        """
+        Adds a stage. outputs (and inputs) are the wildcard patterns of all files the stage writes (and reads),
+        the inputs default to the '-i' arguments of the commands.
+        """
+        stage = LastoolsStage(name, commands, outputs, inputs, function)
+        stage.index = len(self.stages)
+        stage.dependencies = [earlier for earlier in self.stages if stage.conflicts(earlier)]
+        self.stages.append(stage)
+        return stage
+
+    def add_mosaic(self, commands, files, output, step, method="highest"):
+        """
+        Adds the stage mosaicking the BIL rasters matching files into the output raster. It runs in process
+        (see mosaic_rasters) block by block on the cores, without rasterizing the cells again. The lasgrid
+        commands doing the same run instead if the output format is not supported (or numpy is missing).
+        """
+        extension = os.path.splitext(output)[1].lower()
+        if extension not in mosaic_formats():
+            return self.add("lasgrid", commands, [output])
+        mosaic = ["mosaic", "-i", self.algorithm.pathwrap(files), f"-{method}"]
+        if step:
+            mosaic += ["-step", str(step)]
+        mosaic += ["-o", self.algorithm.pathwrap(output), "-cores", str(self.cores)]
+        # the headers and world files are read as well
+        inputs = [files] + [os.path.splitext(files)[0] + sidecar for sidecar in (".hdr", ".blw")]
+        outputs = [output]
+        if extension == ".bil":
+            outputs += [os.path.splitext(output)[0] + sidecar for sidecar in (".hdr", ".blw", ".prj")]
+
+        def progress(done, total):
+            stage.fraction = done / total if total else 1.0
+            # about ten messages
+            if done == total or done % (total // 10 + 1) == 0:
+                self.messages.pushInfo(f"mosaic: {done} of {total} blocks written")
+
+        def run(inputs, cores):
+            rasters = [file for file in inputs if os.path.splitext(file)[1].lower() == ".bil"]
+            rows, columns, _ = mosaic_rasters(
+                rasters,
+                output,
+                step or None,
+                method,
+                workers=cores,
+                progress=progress,
+                canceled=self.messages.isCanceled,
+            )
+            self.messages.pushInfo(f"mosaic of {len(rasters)} rasters: {columns} x {rows} cells written to {output}")
+
+        stage = self.add("mosaic", mosaic, outputs, inputs, run)
+        return stage
+
+    def consumers(self, stage):
+        # later stages reading files of the stage
+        return [
+            later
+            for later in self.stages[stage.index + 1 :]
+            if stage in later.dependencies
+            and any(patterns_overlap(output, pattern) for output in stage.outputs for pattern in later.inputs)
+        ]
+
+    def producer(self, stage, pattern):
+        # the stage wrote the files an input pattern stands for last
+        producers = [
+            dependency
+            for dependency in stage.dependencies
+            if any(patterns_overlap(output, pattern) for output in dependency.outputs)
+        ]
+        return producers[-1] if producers else None
+
+    def in_temporary_directory(self, file):
+        if not self.temporary_directory:
+            return False
+        directory = os.path.normcase(os.path.abspath(self.temporary_directory))
+        file = os.path.normcase(os.path.abspath(file))
+        return os.path.commonpath([directory, file]) == directory and file != directory
+
+    def expand(self, stage):
+        """Returns the jobs of a stage once they are known, None while they are not."""
+        if not (self.per_tile and stage.per_tile()):
+            if not all(dependency.done for dependency in stage.dependencies):
+                return None
+            return [LastoolsJob(stage)]
+        tiled = [dependency for dependency in stage.dependencies if dependency.tiles is not None]
+        if not all(dependency.done for dependency in stage.dependencies if dependency not in tiled):
+            return None
+        if tiled:
+            # the tiles are passed on from stage to stage
+            stage.tiles = tiled[0].tiles
+        elif all(dependency.done for dependency in stage.dependencies):
+            # first stage of a run per tile: the tiles are the files there are now
+            stage.tiles = stage.find_tiles(self.known_files(stage, stage.inputs[0]))
+        else:
+            return None
+        return [LastoolsJob(stage, tile) for tile in stage.tiles]
+
+    def manifest_file(self):
+        return os.path.join(self.temporary_directory, self.MANIFEST)
+
+    def load_manifest(self):
+        self.manifest = {}
+        if not self.temporary_directory:
+            return
+        try:
+            with open(self.manifest_file(), encoding="utf-8") as data:
+                self.manifest = json.load(data)["runs"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def record(self, name, entry):
+        # a run finished (entry) or failed (None)
+        with self.manifest_lock:
+            if entry is None:
+                self.manifest.pop(name, None)
+            else:
+                self.manifest[name] = entry
+            if not os.path.isdir(self.temporary_directory):
+                return
+            staging = f"{self.manifest_file()}.tmp"
+            with open(staging, "w", encoding="utf-8") as out:
+                json.dump({"runs": self.manifest}, out, indent=1)
+            os.replace(staging, self.manifest_file())
+
+    def up_to_date(self, name, key):
+        with self.manifest_lock:
+            entry = self.manifest.get(name)
+        if entry is None or entry["key"] != key or not entry["outputs"]:
+            return False
+        for file, state in entry["outputs"].items():
+            try:
+                stat = os.stat(file)
+            except OSError:
+                return False
+            if [stat.st_size, stat.st_mtime_ns] != state:
+                return False
+        return True
+
+    def written(self, name, before, after):
+        # changed files, and unchanged ones (e.g. restored from the cache) no other run of the manifest wrote
+        with self.manifest_lock:
+            others = {file for other, entry in self.manifest.items() if other != name for file in entry["outputs"]}
+        return {file: state for file, state in after.items() if before.get(file) != state or file not in others}
+
+    def known_files(self, stage, pattern):
+        """
+        Files matching an input pattern written by the stages before, None if not known.
+        A temporary directory of an earlier run may hold other files matching the pattern.
+        """
+        producers = [
+            dependency
+            for dependency in stage.dependencies
+            if any(patterns_overlap(output, pattern) for output in dependency.outputs)
+        ]
+        if not self.temporary_directory or not producers:
+            return None
+        pattern = os.path.normcase(pattern)
+        return sorted(
+            file
+            for dependency in producers
+            for file in dependency.files
+            if fnmatch.fnmatch(os.path.normcase(file), pattern)
+        )
+
+    def known_inputs(self, stage, commands):
+        # replace input patterns matching files of an earlier run by the list of the files of this run
+        for i in range(len(commands) - 1):
+            if commands[i] != "-i":
+                continue
+            pattern = commands[i + 1].replace('"', "")
+            files = self.known_files(stage, pattern)
+            if files is None or sorted(glob.glob(pattern)) == files:
+                continue
+            list_file = os.path.join(self.temporary_directory, f"{stage.index}_{stage.name}_files.txt")
+            text = "".join(f"{file}\n" for file in files)
+            try:
+                with open(list_file, encoding="utf-8") as data:
+                    unchanged = data.read() == text
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                with open(list_file, "w", encoding="utf-8") as out:
+                    out.write(text)
+            commands[i : i + 2] = ["-lof", self.algorithm.pathwrap(list_file)]
+        return commands
+
+    def run_job(self, job, label):
+        commands = job.stage.commands_on(job.cores, job.tile)
+        if self.temporary_directory and job.tile is None:
+            commands = self.known_inputs(job.stage, commands)
+        # same command on the same inputs: the outputs of an earlier run can be used if they are unchanged
+        key = self.keys.key(commands) if self.temporary_directory else None
+        name = f"{job.stage.index} {job.label()}"
+        if key is not None and self.up_to_date(name, key):
+            self.messages.pushInfo(f"{job.label()}: up to date from an earlier run in the temporary directory")
+            with self.manifest_lock:
+                job.stage.files.update(self.manifest[name]["outputs"])
+            return 0
+        entry = {"key": key, "commands": list(commands)}
+        before = job.outputs()
+        job.expected = self.expected_files(job)
+        job.before = before
+        job.started = time.monotonic()
+        if job.stage.function is not None:
+            ret = self.run_function(job, commands)
+        else:
+            ret = self.algorithm.run_lastools(commands, self.messages, label)
+        if self.temporary_directory:
+            entry["outputs"] = self.written(name, before, job.outputs())
+            with self.manifest_lock:
+                job.stage.files.update(entry["outputs"])
+        if key is not None:
+            self.record(name, entry if ret < 3 else None)
+        if ret >= 3:
+            # no later stage may run on the missing or partial outputs
+            raise QgsProcessingException(f"{job.stage.name} failed (return code {ret})")
+        return ret
+
+    def run_function(self, job, commands):
+        if self.messages.isCanceled():
+            raise QgsProcessingException("Canceled by user.")
+        inputs = []
+        for pattern in job.stage.inputs:
+            files = self.known_files(job.stage, pattern)
+            inputs.extend(sorted(glob.glob(pattern)) if files is None else files)
+        inputs = [file for file in inputs if os.path.isfile(file)]
+        commandline = " ".join(commands)
+        self.messages.pushConsoleInfo(f"in process: {commandline}")
+        raster_outputs = self.algorithm.watch_raster_outputs(commands)
+        start = time.time()
+        started = time.monotonic()
+        try:
+            job.stage.function(inputs, job.cores)
+        except (OSError, ValueError) as e:
+            self.algorithm.record_metrics(job.stage.name, commandline, inputs, 3, {})
+            raise QgsProcessingException(f"{job.stage.name} failed: {e}")
+        if self.messages.isCanceled():
+            raise QgsProcessingException(f"{job.stage.name} canceled by user.")
+        self.algorithm.finish_raster_outputs(raster_outputs, self.messages, job.cores)
+        self.algorithm.record_metrics(
+            job.stage.name, commandline, inputs, 0, {"start": start, "wall_time": time.monotonic() - started}
+        )
+        return 0
+
+    def expected_files(self, job):
+        # number of files a stage writes file by file (one per input file), None if not known
+        stage = job.stage
+        if job.tile is not None or not stage.per_tile() or not stage.outputs or "*" not in stage.outputs[0]:
+            return None
+        files = self.known_files(stage, stage.inputs[0])
+        if files is None:
+            files = glob.glob(stage.inputs[0])
+        return len(files) or None
+
+    def input_bytes(self):
+        # size of the files the pipeline starts from, the inputs no stage writes
+        files = set()
+        for stage in self.stages:
+            for pattern in stage.inputs:
+                if self.producer(stage, pattern) is None:
+                    files.update(file for file in glob.glob(pattern) if os.path.isfile(file))
+        return sum(os.path.getsize(file) for file in files)
+
+    def stage_weights(self):
+        """
+        The cost of the stages relative to each other and True if the costs are seconds. The seconds are
+        estimated from the earlier runs of the algorithm in the performance history (the time per byte of
+        input of each stage), without earlier runs of all stages the STAGE_WEIGHTS are used.
+        """
+        try:
+            input_bytes = self.input_bytes()
+            rates = LastoolsUtils.history().stage_rates(self.algorithm.name()) if input_bytes else {}
+        except (OSError, sqlite3.Error):
+            rates = {}
+        names = [LastoolsHistory.stage_name(stage.name) for stage in self.stages]
+        if rates and all(name in rates for name in names):
+            # the history sums the runs of a tool, stages running the same tool share its time
+            return {
+                stage: rates[name] * input_bytes / names.count(name) for stage, name in zip(self.stages, names)
+            }, True
+        return {stage: self.STAGE_WEIGHTS.get(name, 1.0) for stage, name in zip(self.stages, names)}, False
+
+    def job_fraction(self, job, estimate, now):
+        """
+        Share of the work of a running job: as reported by an in process stage, else from the output files
+        it has written of the files it writes and from its time so far against the estimated seconds.
+        """
+        if job.stage.fraction is not None:
+            return job.stage.fraction
+        if job.started is None:
+            return 0.0
+        fraction = 0.0
+        if job.expected and job.before is not None:
+            pattern = os.path.normcase(job.stage.outputs[0])
+            written = sum(
+                1
+                for file, state in job.outputs().items()
+                if job.before.get(file) != state and fnmatch.fnmatch(os.path.normcase(file), pattern)
+            )
+            # the files of the cores are still being written
+            fraction = min(0.99, max(0, written - job.cores) / job.expected)
+        if estimate:
+            fraction = max(fraction, min(0.95, (now - job.started) / estimate))
+        return fraction
+
+    def stage_fraction(self, stage, jobs, estimate, now):
+        # share of the work of a stage, jobs are its running jobs, estimate the seconds of the stage (or None)
+        if stage.done:
+            return 1.0
+        if stage.tiles:
+            estimate = estimate / len(stage.tiles) if estimate else None
+            running = sum(self.job_fraction(job, estimate, now) for job in jobs)
+            return (len(stage.tiles_done) + running) / len(stage.tiles)
+        return min(1.0, sum(self.job_fraction(job, estimate, now) for job in jobs))
+
+    def report_progress(self, weights, seconds, running, started, now, progress=0.0):
+        """
+        Reports the progress of all stages, weighted by their costs (see stage_weights), and the time left.
+        Returns the progress, which never goes back below the one reported before.
+        """
+        total = sum(weights.values())
+        jobs = {}
+        for job in running.values():
+            jobs.setdefault(job.stage, []).append(job)
+        done = sum(
+            weight * self.stage_fraction(stage, jobs.get(stage, []), weight if seconds else None, now)
+            for stage, weight in weights.items()
+        )
+        progress = max(progress, done / total if total > 0 else 0.0)
+        self.feedback.setProgress(100 * progress)
+        names = list(dict.fromkeys(job.stage.name for job in running.values()))
+        text = f"{', '.join(names) or 'waiting'}: {progress:.0%}"
+        elapsed = now - started
+        if 0.02 <= progress < 1 and elapsed >= self.PROGRESS_INTERVAL:
+            left = datetime.timedelta(seconds=round(elapsed * (1 - progress) / progress))
+            text += f", about {left} left"
+        self.feedback.setProgressText(text)
+        return progress
+
+    def collect_garbage(self):
+        """
+        Deletes the intermediate files all stages reading them are done with,
+        the files of a tile as soon as the tile is done.
+        """
+        for stage in self.stages:
+            consumers = self.consumers(stage)
+            if not consumers:
+                # results
+                continue
+            with self.manifest_lock:
+                files = [file for file in stage.files if file not in stage.collected]
+                # never files another stage wrote too
+                others = {file for other in self.stages if other is not stage for file in other.files}
+            for file in files:
+                readers = [
+                    consumer
+                    for consumer in consumers
+                    if any(
+                        fnmatch.fnmatch(os.path.normcase(file), os.path.normcase(pattern))
+                        for pattern in consumer.inputs
+                    )
+                ]
+                # a stage run per tile is done with the file once it is done with the tile of the file
+                if not all(
+                    reader.done or (reader.tiles is not None and reader.find_tiles([file])[0] in reader.tiles_done)
+                    for reader in readers
+                ):
+                    continue
+                stage.collected.add(file)
+                if file in others or not self.in_temporary_directory(file):
+                    continue
+                try:
+                    os.remove(file)
+                except OSError:
+                    pass
+
+    def estimate_disk_space(self):
+        """
+        Estimated peak size of the files in the temporary directory in bytes. The size of the
+        output of a stage is estimated from the size of its inputs, see SIZE_RATIOS.
+        """
+        sizes = {}
+        # the stages reading the files of a stage
+        readers = {stage: [] for stage in self.stages}
+        for stage in self.stages:
+            size = 0
+            for pattern in stage.inputs:
+                producer = self.producer(stage, pattern)
+                if producer is not None:
+                    size += sizes[producer]
+                    readers[producer].append(stage)
+                else:
+                    size += sum(os.path.getsize(file) for file in glob.glob(pattern) if os.path.isfile(file))
+            extension = os.path.splitext(stage.outputs[0])[1].lower() if stage.outputs else ""
+            sizes[stage] = size * self.SIZE_RATIOS.get(extension, self.RASTER_SIZE_RATIO)
+        # the stages one after the other, in a managed directory files go once the last stage reading them is done
+        used = peak = 0
+        for stage in self.stages:
+            if any(self.in_temporary_directory(output) for output in stage.outputs):
+                used += sizes[stage]
+                peak = max(peak, used)
+            if not self.managed:
+                continue
+            for earlier in self.stages[: stage.index]:
+                if readers[earlier] and readers[earlier][-1] is stage:
+                    if any(self.in_temporary_directory(output) for output in earlier.outputs):
+                        used -= sizes[earlier]
+        return peak
+
+    def check_disk_space(self):
+        if not self.temporary_directory:
+            return
+        needed = self.estimate_disk_space() * self.DISK_SPACE_MARGIN
+        folder = os.path.abspath(self.temporary_directory)
+        while not os.path.isdir(folder) and os.path.dirname(folder) != folder:
+            folder = os.path.dirname(folder)
+        free = shutil.disk_usage(folder).free
+        gigabyte = 1024**3
+        message = (
+            f"temporary files need about {needed / gigabyte:.1f} GB, "
+            f"{free / gigabyte:.1f} GB are free in {self.temporary_directory}"
+        )
+        if needed <= free:
+            self.feedback.pushInfo(message)
+        elif self.managed:
+            raise QgsProcessingException(
+                f"Not enough disk space: {message}. Choose a temporary directory "
+                "(or a LAStools scratch folder in the processing settings) on a larger disk."
+            )
+        else:
+            # files of an earlier run to resume are not in the estimate
+            self.feedback.pushWarning(f"Possibly not enough disk space: {message}.")
+
+    def clean_up(self):
+        """Removes the managed temporary directory, except for the results written into it."""
+        results = {
+            os.path.normcase(os.path.abspath(file))
+            for stage in self.stages
+            if not self.consumers(stage)
+            for file in stage.files
+            if self.in_temporary_directory(file)
+        }
+        if not results:
+            shutil.rmtree(self.temporary_directory, ignore_errors=True)
+            return
+        for folder, _, files in os.walk(self.temporary_directory):
+            for file in files:
+                file = os.path.join(folder, file)
+                if os.path.normcase(os.path.abspath(file)) not in results:
+                    try:
+                        os.remove(file)
+                    except OSError:
+                        pass
+        self.feedback.pushInfo(f"results are in the temporary directory {self.temporary_directory}")
+
+    def run(self):
+        """Runs the stages, in a managed temporary directory the intermediate files are deleted."""
+        try:
+            self.check_disk_space()
+            self.run_stages()
+        except Exception:
+            if self.managed and not self.feedback.isCanceled():
+                # failed stage: run_job raised, nothing was cleaned up
+                self.feedback.reportError(
+                    f"intermediate files are kept in {self.temporary_directory}, choose it as temporary directory "
+                    "to resume the run"
+                )
+            elif self.managed:
+                self.clean_up()
+            raise
+        if self.managed:
+            self.clean_up()
+
+    def run_stages(self):
+        self.load_manifest()
+        for stage in self.stages:
+            stage.done = False
+            stage.tiles = None
+            stage.tiles_done = set()
+            stage.files = set()
+            stage.collected = set()
+            stage.fraction = None
+        weights, seconds = self.stage_weights()
+        started = time.monotonic()
+        reported = None
+        progress = 0.0
+        unexpanded = list(self.stages)
+        jobs = []
+        remaining = {stage: 0 for stage in self.stages}
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=self.cores) as executor:
+            while unexpanded or jobs or running:
+                if error is None and not self.feedback.isCanceled():
+                    for stage in list(unexpanded):
+                        expanded = self.expand(stage)
+                        if expanded is not None:
+                            unexpanded.remove(stage)
+                            jobs.extend(expanded)
+                            remaining[stage] = len(expanded)
+                            stage.done = not expanded
+                    # later stages first: tiles are finished early and their intermediates can go
+                    ready = sorted((job for job in jobs if job.ready()), key=lambda job: -self.stages.index(job.stage))
+                    free = self.cores - sum(job.cores for job in running.values())
+                    concurrent = len(ready) + len(running) > 1
+                    for i, job in enumerate(ready):
+                        if free < 1 and running:
+                            break
+                        multi_core = job.stage.multi_core and job.tile is None
+                        job.cores = max(1, free // (len(ready) - i)) if multi_core else 1
+                        free -= job.cores
+                        jobs.remove(job)
+                        label = job.label() if concurrent or job.tile is not None else ""
+                        running[executor.submit(self.run_job, job, label)] = job
+                elif not running:
+                    break
+                finished, _ = wait(list(running), timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                self.messages.forward()
+                for future in finished:
+                    job = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        # no further stages, the running ones are finished (or stop on their own when canceled)
+                        error = error or e
+                        continue
+                    if job.tile is not None:
+                        job.stage.tiles_done.add(job.tile)
+                    remaining[job.stage] -= 1
+                    job.stage.done = remaining[job.stage] == 0
+                # after a failure the intermediate files are kept for a look at them and to resume the run
+                if finished and self.managed and error is None:
+                    self.collect_garbage()
+                now = time.monotonic()
+                if reported is None or now - reported >= self.PROGRESS_INTERVAL:
+                    reported = now
+                    progress = self.report_progress(weights, seconds, running, started, now, progress)
+        # the last messages of the workers
+        self.messages.forward()
+        if error is not None:
+            raise error
+        if self.feedback.isCanceled():
+            raise QgsProcessingException("Canceled by user.")
+        self.feedback.setProgress(100)
@@ -53,7 +53,7 @@ class LasClassify(LastoolsAlgorithm):
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasClassify()
@@ -98,6 +98,7 @@ class LasClassifyPro(LastoolsAlgorithm):
         self.add_parameters_horizontal_and_vertical_feet_gui()
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_point_output_format_gui()
@@ -115,8 +116,8 @@ class LasClassifyPro(LastoolsAlgorithm):
         self.add_parameters_output_appendix_commands(parameters, context, commands)
         self.add_parameters_point_output_format_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasClassifyPro()
@@ -78,7 +78,7 @@ class LasGround(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasGround()
@@ -137,6 +137,7 @@ class LasGroundPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterEnum(self.GRANULARITY, "preprocessing", self.GRANULARITIES, False, 1))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_point_output_format_gui()
@@ -162,8 +163,8 @@ class LasGroundPro(LastoolsAlgorithm):
         self.add_parameters_output_appendix_commands(parameters, context, commands)
         self.add_parameters_point_output_format_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasGroundPro()
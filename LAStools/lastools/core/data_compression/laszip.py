@@ -60,7 +60,7 @@ class LasZip(LastoolsAlgorithm):
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasZip()
@@ -110,6 +110,7 @@ class LasZipPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.CREATE_LAX, "create spatial indexing file (*.lax)", False))
         self.addParameter(QgsProcessingParameterBoolean(self.APPEND_LAX, "append *.lax into *.laz file", False))
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_directory_gui()
 
@@ -129,9 +130,9 @@ class LasZipPro(LastoolsAlgorithm):
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        self.run_lastools_per_file(parameters, context, commands, feedback)
 
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasZipPro()
@@ -120,7 +120,7 @@ class Blast2Iso(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_vector_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": None}
+        return self.results(commands)
 
     def createInstance(self):
         return Blast2Iso()
@@ -165,6 +165,7 @@ class Blast2IsoPro(LastoolsAlgorithm):
     def initAlgorithm(self, config=None):
         super().initAlgorithm(config)
         self.add_parameters_point_input_folder_gui()
+        self.add_parameters_aoi_gui()
         self.add_parameters_point_input_merged_gui()
         self.addParameter(
             QgsProcessingParameterNumber(
@@ -217,6 +218,7 @@ class Blast2IsoPro(LastoolsAlgorithm):
         )
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_vector_output_format_gui()
@@ -252,8 +254,8 @@ class Blast2IsoPro(LastoolsAlgorithm):
         self.add_parameters_vector_output_format_commands(parameters, context, commands)
         self.add_parameters_vector_output_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return Blast2IsoPro()
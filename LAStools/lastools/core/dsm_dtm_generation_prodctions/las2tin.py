@@ -46,7 +46,7 @@ class las2tin(LastoolsAlgorithm):
 
         self.run_lastools(commands, feedback)
 
-        return {"": None}
+        return self.results(commands)
 
     def name(self):
         return self.LASTOOL
@@ -181,7 +181,7 @@ class LasCanopy(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_raster_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasCanopy()
@@ -271,6 +271,7 @@ class LasCanopyPro(LastoolsAlgorithm):
     def initAlgorithm(self, config=None):
         super().initAlgorithm(config)
         self.add_parameters_point_input_folder_gui()
+        self.add_parameters_aoi_gui()
         self.add_parameters_point_input_merged_gui()
         self.addParameter(
             QgsProcessingParameterNumber(
@@ -303,11 +304,13 @@ class LasCanopyPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.FILES_ARE_PLOTS, "input files are single plots", False))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_output_directory_gui()
+        self.add_parameters_virtual_raster_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
         commands = [self.get_command(parameters, context, feedback)]
@@ -369,8 +372,9 @@ class LasCanopyPro(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_raster_output_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"": None}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        self.add_parameters_virtual_raster_outputs(parameters, context, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasCanopyPro()
@@ -70,7 +70,7 @@ class LasGrid(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_raster_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"": None}
+        return self.results(commands)
 
     def createInstance(self):
         return LasGrid()
@@ -115,6 +115,7 @@ class LasGridPro(LastoolsAlgorithm):
     def initAlgorithm(self, config=None):
         super().initAlgorithm(config)
         self.add_parameters_point_input_folder_gui()
+        self.add_parameters_aoi_gui()
         self.add_parameters_point_input_merged_gui()
         self.add_parameters_filter1_return_class_flags_gui()
         self.add_parameters_step_gui()
@@ -125,11 +126,13 @@ class LasGridPro(LastoolsAlgorithm):
         )
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_output_directory_gui()
+        self.add_parameters_virtual_raster_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
         commands = [self.get_command(parameters, context, feedback)]
@@ -152,8 +155,9 @@ class LasGridPro(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_raster_output_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        self.add_parameters_virtual_raster_outputs(parameters, context, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasGridPro()
@@ -0,0 +1,37 @@
+"""
+reading LAS/LAZ files and LAStools rasters without running LAStools
+"""
+
+from .bil_raster import BilHeader, BilRaster, mosaic_formats, mosaic_rasters
+from .cog import COG_EXTENSIONS, can_cloud_optimize, cloud_optimize, cloud_optimize_files
+from .las_header import LasHeader, LasVlr, read_las_headers
+from .las_catalog import LasCatalog
+from .las_points import LasPoints, point_dtype
+from .las_synthetic import SYNTHETIC_VERSIONS, SyntheticLas
+from .lax_index import LaxIndex, query_lax_indexes
+from .vrt import VRT_EXTENSIONS, RasterInfo, build_vrt, raster_info
+
+__all__ = [
+    BilHeader,
+    BilRaster,
+    LasHeader,
+    LasVlr,
+    LasCatalog,
+    LasPoints,
+    LaxIndex,
+    SyntheticLas,
+    RasterInfo,
+    SYNTHETIC_VERSIONS,
+    VRT_EXTENSIONS,
+    COG_EXTENSIONS,
+    can_cloud_optimize,
+    cloud_optimize,
+    cloud_optimize_files,
+    mosaic_formats,
+    mosaic_rasters,
+    point_dtype,
+    build_vrt,
+    raster_info,
+    read_las_headers,
+    query_lax_indexes,
+]
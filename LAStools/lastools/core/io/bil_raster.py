@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    bil_raster.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import math
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+# numpy type of the cells by pixeltype and nbits of the .hdr file
+PIXEL_TYPES = {
+    ("float", 32): "f4",
+    ("float", 64): "f8",
+    ("signedint", 8): "i1",
+    ("signedint", 16): "i2",
+    ("signedint", 32): "i4",
+    ("unsignedint", 8): "u1",
+    ("unsignedint", 16): "u2",
+    ("unsignedint", 32): "u4",
+}
+# nodata value of the mosaics, the one of LAStools
+NODATA = -9999.0
+MOSAIC_METHODS = ["highest", "lowest", "first"]
+# blocks of the mosaic are a multiple of the tiles of the GeoTIFF
+GEOTIFF_TILE_SIZE = 256
+MOSAIC_BLOCK_SIZE = 4 * GEOTIFF_TILE_SIZE
+
+
+def read_hdr(file):
+    # ESRI .hdr file: one keyword and value per line, keywords in any case
+    header = {}
+    with open(file, encoding="ascii", errors="replace") as data:
+        for line in data:
+            fields = line.split(None, 1)
+            if len(fields) == 2:
+                header[fields[0].lower()] = fields[1].strip()
+    return header
+
+
+def read_world_file(file):
+    # the six parameters of a world file, None if there is none
+    try:
+        with open(file, encoding="ascii", errors="replace") as data:
+            values = [float(line) for line in data.read().split()[:6]]
+    except (OSError, ValueError):
+        return None
+    return values if len(values) == 6 else None
+
+
+class BilHeader:
+    """
+    Layout and georeference of the first band of a BIL raster as written by las2dem, lasgrid, ...
+    with '-obil'. The layout is read from the .hdr file, the georeference from the .blw world file
+    (else from ulxmap, ulymap, xdim and ydim of the .hdr file).
+    """
+
+    def __init__(self, file):
+        self.file = file
+        base = os.path.splitext(file)[0]
+        try:
+            header = read_hdr(base + ".hdr")
+            self.rows = int(header["nrows"])
+            self.columns = int(header["ncols"])
+            bands = int(header.get("nbands", 1))
+            bits = int(header.get("nbits", 8))
+            skip = int(header.get("skipbytes", 0))
+        except KeyError as e:
+            raise ValueError(f"{file}: no {e.args[0]} in the .hdr file")
+        pixel_type = header.get("pixeltype", "unsignedint").lower()
+        if (pixel_type, bits) not in PIXEL_TYPES:
+            raise ValueError(f"{file}: unsupported pixel type {pixel_type} of {bits} bits")
+        if self.rows < 1 or self.columns < 1:
+            raise ValueError(f"{file}: no cells")
+        if header.get("layout", "bil").lower() != "bil" and bands > 1:
+            raise ValueError(f"{file}: layout {header['layout']} is no BIL")
+        byte_order = ">" if header.get("byteorder", "I").upper() in ("M", "MOTOROLA", "MSBFIRST") else "<"
+        # numpy type of the cells, e.g. '<f4'
+        self.type = byte_order + PIXEL_TYPES[(pixel_type, bits)]
+        size = bits // 8
+        self.skip = skip
+        band_row_bytes = int(header.get("bandrowbytes", self.columns * size))
+        self.total_row_bytes = int(header.get("totalrowbytes", bands * band_row_bytes))
+        if band_row_bytes < self.columns * size or self.total_row_bytes % size:
+            raise ValueError(f"{file}: unsupported row layout")
+        if skip + self.rows * self.total_row_bytes > os.path.getsize(file):
+            raise ValueError(f"{file}: truncated, {self.rows} rows of {self.total_row_bytes} bytes expected")
+        self.nodata = float(header["nodata"]) if "nodata" in header else None
+        # center of the upper left cell and cell size
+        world = read_world_file(base + ".blw")
+        if world is not None:
+            self.xdim, _, _, ydim, x, y = world
+            self.ydim = -ydim
+        else:
+            self.xdim = float(header.get("xdim", 1.0))
+            self.ydim = float(header.get("ydim", 1.0))
+            x = float(header.get("ulxmap", self.xdim / 2))
+            y = float(header.get("ulymap", (self.rows - 0.5) * self.ydim))
+        if self.xdim <= 0 or self.ydim <= 0:
+            raise ValueError(f"{file}: rotated or flipped rasters are not supported")
+        # outer edges: min x, min y, max x, max y
+        self.extent = (
+            x - self.xdim / 2,
+            y - self.ydim * (self.rows - 0.5),
+            x + self.xdim * (self.columns - 0.5),
+            y + self.ydim / 2,
+        )
+
+    @property
+    def wkt(self):
+        """WKT of the CRS from the .prj file, empty if there is none."""
+        try:
+            with open(os.path.splitext(self.file)[0] + ".prj", encoding="utf-8", errors="replace") as data:
+                return data.read().strip()
+        except OSError:
+            return ""
+
+
+class BilRaster(BilHeader):
+    """
+    First band of a BIL raster, memory mapped: the cells (values, rows from north to south)
+    are only read when they are used.
+    """
+
+    def __init__(self, file):
+        if numpy is None:
+            raise ImportError("reading BIL rasters needs numpy")
+        super().__init__(file)
+        dtype = numpy.dtype(self.type)
+        shape = (self.rows, self.total_row_bytes // dtype.itemsize)
+        self.values = numpy.memmap(file, dtype, "r", offset=self.skip, shape=shape)[:, : self.columns]
+
+    def cell_centers(self):
+        # x of the centers of the columns, y of the centers of the rows
+        x = self.extent[0] + (numpy.arange(self.columns) + 0.5) * self.xdim
+        y = self.extent[3] - (numpy.arange(self.rows) + 0.5) * self.ydim
+        return x, y
+
+
+def mosaic_formats():
+    """Extensions of the rasters mosaic_rasters() can write with the modules available."""
+    if numpy is None:
+        return []
+    if gdal is None:
+        return [".bil"]
+    return [".bil", ".tif", ".tiff"]
+
+
+def write_bil_header(output, rows, columns, extent, step, wkt):
+    base = os.path.splitext(output)[0]
+    with open(base + ".hdr", "w", encoding="ascii") as out:
+        out.write(f"nrows {rows}\nncols {columns}\nnbands 1\nnbits 32\npixeltype float\nbyteorder I\n")
+        out.write(f"layout bil\nulxmap {extent[0] + step / 2!r}\nulymap {extent[3] - step / 2!r}\n")
+        out.write(f"xdim {step!r}\nydim {step!r}\nnodata {NODATA:g}\n")
+    with open(base + ".blw", "w", encoding="ascii") as out:
+        out.write(f"{step!r}\n0\n0\n{-step!r}\n{extent[0] + step / 2!r}\n{extent[3] - step / 2!r}\n")
+    if wkt:
+        with open(base + ".prj", "w", encoding="utf-8") as out:
+            out.write(wkt)
+
+
+def target_index(targets):
+    # index of the cells of a block the rows (or columns) of an input go to: a slice if they go to
+    # consecutive cells, the array if they go to different cells, None if several go to the same cell
+    if len(targets) > 1 and numpy.any(targets[1:] == targets[:-1]):
+        return None
+    if targets[-1] - targets[0] == len(targets) - 1:
+        return slice(int(targets[0]), int(targets[-1]) + 1)
+    return targets
+
+
+def mosaic_rasters(
+    files,
+    output,
+    step=None,
+    method="highest",
+    block_size=MOSAIC_BLOCK_SIZE,
+    workers=1,
+    progress=None,
+    canceled=None,
+):
+    """
+    Mosaics BIL rasters into a single band float32 raster, a BIL or (with GDAL) a tiled GeoTIFF.
+
+    Every cell of an input goes into the output cell of size step (default: the smallest cell size of
+    the inputs) its center falls into, as if lasgrid read the rasters as points: 'highest' (and 'lowest')
+    keep the highest (lowest) value of an output cell, 'first' the value of the first file.
+
+    The output is written block by block, the blocks run on the workers in parallel. Only the
+    blocks being worked on are held in memory, the inputs are memory mapped.
+    progress(done, total) is called for each finished block, canceled() stops the mosaic.
+    Returns the number of rows and columns and the extent of the output.
+    """
+    if method not in MOSAIC_METHODS:
+        raise ValueError(f"unknown mosaic method {method}")
+    extension = os.path.splitext(output)[1].lower()
+    if extension not in mosaic_formats():
+        raise ValueError(f"mosaics can not be written as {extension or 'files without extension'}")
+    rasters = [BilRaster(file) for file in files]
+    if not rasters:
+        raise ValueError("no rasters to mosaic")
+    step = float(step or min(min(raster.xdim, raster.ydim) for raster in rasters))
+    # extent of all inputs, aligned to multiples of step
+    min_x = math.floor(min(raster.extent[0] for raster in rasters) / step) * step
+    min_y = math.floor(min(raster.extent[1] for raster in rasters) / step) * step
+    max_x = math.ceil(max(raster.extent[2] for raster in rasters) / step) * step
+    max_y = math.ceil(max(raster.extent[3] for raster in rasters) / step) * step
+    columns = max(1, round((max_x - min_x) / step))
+    rows = max(1, round((max_y - min_y) / step))
+    extent = (min_x, max_y - rows * step, min_x + columns * step, max_y)
+    # output row and column of each row and column of the inputs, both increasing
+    targets = []
+    for raster in rasters:
+        x, y = raster.cell_centers()
+        target_columns = numpy.floor((x - min_x) / step).astype(numpy.int64)
+        target_rows = numpy.floor((max_y - y) / step).astype(numpy.int64)
+        targets.append((raster, target_rows, target_columns))
+    wkt = next((raster.wkt for raster in rasters if raster.wkt), "")
+
+    if extension == ".bil":
+        cells = numpy.memmap(output, numpy.dtype("<f4"), "w+", shape=(rows, columns))
+        write_bil_header(output, rows, columns, extent, step, wkt)
+    else:
+        options = [
+            "TILED=YES",
+            f"BLOCKXSIZE={GEOTIFF_TILE_SIZE}",
+            f"BLOCKYSIZE={GEOTIFF_TILE_SIZE}",
+            "COMPRESS=DEFLATE",
+            "PREDICTOR=3",
+            "BIGTIFF=IF_SAFER",
+        ]
+        dataset = gdal.GetDriverByName("GTiff").Create(output, columns, rows, 1, gdal.GDT_Float32, options)
+        if dataset is None:
+            raise OSError(f"{output} can not be written: {gdal.GetLastErrorMsg()}")
+        dataset.SetGeoTransform((extent[0], step, 0.0, extent[3], 0.0, -step))
+        if wkt:
+            dataset.SetProjection(wkt)
+        band = dataset.GetRasterBand(1)
+        band.SetNoDataValue(NODATA)
+        # GDAL datasets are not thread safe
+        band_lock = threading.Lock()
+
+    def mosaic_block(row, column):
+        if canceled is not None and canceled():
+            return
+        block = numpy.full((min(block_size, rows - row), min(block_size, columns - column)), numpy.nan, numpy.float32)
+        for raster, target_rows, target_columns in targets:
+            first_row, last_row = numpy.searchsorted(target_rows, [row, row + block.shape[0]])
+            first_column, last_column = numpy.searchsorted(target_columns, [column, column + block.shape[1]])
+            if first_row >= last_row or first_column >= last_column:
+                continue
+            # the only read of the input: the window within the block
+            values = numpy.array(raster.values[first_row:last_row, first_column:last_column], numpy.float32)
+            if raster.nodata is not None:
+                values[values == raster.nodata] = numpy.nan
+            block_rows = target_rows[first_row:last_row] - row
+            block_columns = target_columns[first_column:last_column] - column
+            index_rows = target_index(block_rows)
+            index_columns = target_index(block_columns)
+            if index_rows is not None and index_columns is not None:
+                if isinstance(index_rows, slice) and isinstance(index_columns, slice):
+                    index = (index_rows, index_columns)
+                else:
+                    index = numpy.ix_(block_rows, block_columns)
+                current = block[index]
+                if method == "highest":
+                    block[index] = numpy.fmax(current, values)
+                elif method == "lowest":
+                    block[index] = numpy.fmin(current, values)
+                else:
+                    block[index] = numpy.where(numpy.isnan(current), values, current)
+                continue
+            # an input with smaller cells than the output: several of its cells go into the same output cell
+            index = numpy.broadcast_arrays(block_rows[:, None], block_columns[None, :])
+            if method == "highest":
+                numpy.fmax.at(block, tuple(index), values)
+            elif method == "lowest":
+                numpy.fmin.at(block, tuple(index), values)
+            else:
+                valid = ~numpy.isnan(values)
+                flat = (index[0] * block.shape[1] + index[1])[valid]
+                # the first valid value of each output cell which has no value yet
+                flat, first = numpy.unique(flat, return_index=True)
+                empty = numpy.isnan(block.ravel()[flat])
+                block.ravel()[flat[empty]] = values[valid][first[empty]]
+        block[numpy.isnan(block)] = NODATA
+        if extension == ".bil":
+            cells[row : row + block.shape[0], column : column + block.shape[1]] = block
+        else:
+            with band_lock:
+                band.WriteArray(block, column, row)
+
+    blocks = [(row, column) for row in range(0, rows, block_size) for column in range(0, columns, block_size)]
+    done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            # never more blocks in work than twice the workers: the memory needed does not grow with the mosaic
+            pending = set()
+            for row, column in blocks:
+                if len(pending) >= 2 * max(1, workers):
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                        done += 1
+                        if progress is not None:
+                            progress(done, len(blocks))
+                pending.add(executor.submit(mosaic_block, row, column))
+            for future in pending:
+                future.result()
+                done += 1
+                if progress is not None:
+                    progress(done, len(blocks))
+    finally:
+        if extension == ".bil":
+            cells.flush()
+            del cells
+        else:
+            band.FlushCache()
+            band = dataset = None
+    return rows, columns, extent
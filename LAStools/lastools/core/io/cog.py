@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    cog.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+COG_BLOCK_SIZE = 512
+# overviews are built down to this size
+COG_OVERVIEW_SIZE = 256
+COG_EXTENSIONS = [".tif", ".tiff"]
+
+
+def can_cloud_optimize():
+    return gdal is not None
+
+
+def gdal_error(file):
+    return OSError(f"{file}: {gdal.GetLastErrorMsg() or 'GDAL failed'}")
+
+
+def overview_factors(width, height):
+    factors = []
+    factor = 2
+    while max(width, height) / factor >= COG_OVERVIEW_SIZE:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
+def cloud_optimize(file, threads=1):
+    """
+    Rewrites a GeoTIFF as cloud optimized GeoTIFF: internally tiled, deflate compressed and with an
+    overview pyramid, so QGIS only reads the tiles of the visible area at the zoom level shown.
+
+    The new file is written next to the old one and replaces it when complete, the old file stays
+    valid until then (and for anybody who still has a hard link to it, e.g. the LAStools cache).
+    """
+    if gdal is None:
+        raise ImportError("cloud optimized GeoTIFFs need GDAL")
+    staging = f"{file}.{uuid.uuid4().hex}.tmp"
+    options = [
+        "COMPRESS=DEFLATE",
+        "PREDICTOR=YES",
+        "BIGTIFF=IF_SAFER",
+        f"NUM_THREADS={max(1, threads)}",
+    ]
+    try:
+        if gdal.GetDriverByName("COG") is not None:
+            options += [f"BLOCKSIZE={COG_BLOCK_SIZE}", "OVERVIEWS=IGNORE_EXISTING", "RESAMPLING=AVERAGE"]
+            if gdal.Translate(staging, file, format="COG", creationOptions=options) is None:
+                raise gdal_error(file)
+        else:
+            # GDAL before 3.1: tiled copy with overviews, then copied again for the overviews to come first
+            tiled = f"{staging}.tiled"
+            dataset = gdal.Translate(
+                tiled,
+                file,
+                format="GTiff",
+                creationOptions=["TILED=YES", f"BLOCKXSIZE={COG_BLOCK_SIZE}", f"BLOCKYSIZE={COG_BLOCK_SIZE}"],
+            )
+            if dataset is None:
+                raise gdal_error(file)
+            dataset.BuildOverviews("AVERAGE", overview_factors(dataset.RasterXSize, dataset.RasterYSize))
+            dataset = None
+            options += ["TILED=YES", f"BLOCKXSIZE={COG_BLOCK_SIZE}", f"BLOCKYSIZE={COG_BLOCK_SIZE}"]
+            options.append("COPY_SRC_OVERVIEWS=YES")
+            result = gdal.Translate(staging, tiled, format="GTiff", creationOptions=options)
+            os.remove(tiled)
+            if result is None:
+                raise gdal_error(file)
+            result = None
+        os.replace(staging, file)
+    except RuntimeError as e:
+        # GDAL with gdal.UseExceptions() (set by another plugin or a later GDAL default)
+        raise gdal_error(file) from e
+    finally:
+        for leftover in (staging, f"{staging}.tiled"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+
+def cloud_optimize_files(files, workers=1, progress=None):
+    """
+    Rewrites the GeoTIFFs among files as cloud optimized GeoTIFFs, several files at the same time on
+    the workers (the workers left over compress in parallel). progress(file, done, total) is called
+    for each finished file. Returns the files which failed as {file: error}, none of them raises.
+    """
+    files = [file for file in files if os.path.splitext(file)[1].lower() in COG_EXTENSIONS]
+    workers = max(1, workers)
+    threads = max(1, workers // max(1, len(files)))
+    failed = {}
+    with ThreadPoolExecutor(max_workers=min(workers, max(1, len(files)))) as executor:
+        futures = {executor.submit(cloud_optimize, file, threads): file for file in files}
+        for done, future in enumerate(as_completed(futures), 1):
+            file = futures[future]
+            try:
+                future.result()
+            except OSError as e:
+                failed[file] = str(e)
+            if progress is not None:
+                progress(file, done, len(files))
+    return failed
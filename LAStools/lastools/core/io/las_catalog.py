@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    las_catalog.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import fnmatch
+import glob
+import os
+import sqlite3
+from contextlib import closing
+
+from .las_header import LasHeader
+
+SCHEMA = """
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    error TEXT NOT NULL DEFAULT '',
+    version TEXT,
+    point_format INTEGER,
+    compressed INTEGER,
+    point_record_length INTEGER,
+    point_count INTEGER,
+    density REAL,
+    min_x REAL,
+    min_y REAL,
+    min_z REAL,
+    max_x REAL,
+    max_y REAL,
+    max_z REAL,
+    scale_x REAL,
+    scale_y REAL,
+    scale_z REAL,
+    offset_x REAL,
+    offset_y REAL,
+    offset_z REAL,
+    epsg INTEGER,
+    crs TEXT
+);
+CREATE INDEX files_folder ON files (folder, min_x, max_x);
+"""
+
+
+class LasCatalog:
+    """
+    Header summaries of LAS/LAZ files in a SQLite database.
+
+    A refresh of a folder reads the header of new files and of files whose size or
+    modification time changed only, the others are taken from the database.
+    The summaries can then be queried by extent, point density, point format or CRS
+    without opening any of the files.
+    """
+
+    # increase on changes of SCHEMA, an older database is rebuilt
+    SCHEMA_VERSION = 2
+
+    def __init__(self, database):
+        self.database = database
+
+    @staticmethod
+    def normpath(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.database)), exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=30)
+        connection.row_factory = sqlite3.Row
+        # concurrent readers (e.g. parallel algorithms) while a refresh writes
+        connection.execute("PRAGMA journal_mode=WAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS files")
+                connection.executescript(SCHEMA)
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        return connection
+
+    @staticmethod
+    def row(file, folder, stat):
+        try:
+            header = LasHeader(file)
+        except (OSError, ValueError) as e:
+            # remembered as well, so it is not read again until it changes
+            return {"path": file, "folder": folder, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "error": str(e)}
+        area = (header.maxs[0] - header.mins[0]) * (header.maxs[1] - header.mins[1])
+        return {
+            "path": file,
+            "folder": folder,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "error": "",
+            "version": "%d.%d" % header.version,
+            "point_format": header.point_format,
+            "compressed": int(header.compressed),
+            "point_record_length": header.point_record_length,
+            "point_count": header.point_count,
+            "density": header.point_count / area if area > 0 else 0.0,
+            "min_x": header.mins[0],
+            "min_y": header.mins[1],
+            "min_z": header.mins[2],
+            "max_x": header.maxs[0],
+            "max_y": header.maxs[1],
+            "max_z": header.maxs[2],
+            "scale_x": header.scale[0],
+            "scale_y": header.scale[1],
+            "scale_z": header.scale[2],
+            "offset_x": header.offset[0],
+            "offset_y": header.offset[1],
+            "offset_z": header.offset[2],
+            "epsg": header.epsg,
+            "crs": header.crs,
+        }
+
+    def refresh(self, folder, wildcards=("*.laz", "*.las")):
+        """
+        Brings the entries of the files in the folder matching the wildcards up to date.
+        Returns the number of files read and of entries removed because their file is gone.
+        """
+        folder = self.normpath(folder)
+        files = {}
+        for wildcard in wildcards:
+            for file in glob.glob(os.path.join(folder, wildcard)):
+                if os.path.isfile(file):
+                    files[self.normpath(file)] = os.stat(file)
+        with closing(self.connect()) as connection, connection:
+            known = {
+                row["path"]: (row["size"], row["mtime_ns"])
+                for row in connection.execute("SELECT path, size, mtime_ns FROM files WHERE folder = ?", (folder,))
+            }
+            rows = [
+                self.row(file, os.path.dirname(file), stat)
+                for file, stat in files.items()
+                if known.get(file) != (stat.st_size, stat.st_mtime_ns)
+            ]
+            for row in rows:
+                columns = ", ".join(row)
+                values = ", ".join("?" for _ in row)
+                connection.execute(f"INSERT OR REPLACE INTO files ({columns}) VALUES ({values})", list(row.values()))
+            # entries of files not matching the wildcards are kept, another refresh may need them
+            removed = [(file,) for file in known if file not in files and not os.path.isfile(file)]
+            connection.executemany("DELETE FROM files WHERE path = ?", removed)
+        return len(rows), len(removed)
+
+    def files(
+        self,
+        folder,
+        wildcards=None,
+        extent=None,
+        point_formats=None,
+        min_density=None,
+        max_density=None,
+        epsg=None,
+    ):
+        """
+        Entries (dicts with the columns of SCHEMA) of the readable files in the folder, by path.
+        extent is (min x, min y, max x, max y), a file is selected if its bounding box intersects it.
+        """
+        sql = "SELECT * FROM files WHERE folder = ? AND error = ''"
+        args = [self.normpath(folder)]
+        if extent is not None:
+            sql += " AND min_x <= ? AND max_x >= ? AND min_y <= ? AND max_y >= ?"
+            args += [extent[2], extent[0], extent[3], extent[1]]
+        if point_formats is not None:
+            sql += f" AND point_format IN ({', '.join('?' for _ in point_formats)})"
+            args += list(point_formats)
+        if min_density is not None:
+            sql += " AND density >= ?"
+            args.append(min_density)
+        if max_density is not None:
+            sql += " AND density <= ?"
+            args.append(max_density)
+        if epsg is not None:
+            sql += " AND epsg = ?"
+            args.append(epsg)
+        with closing(self.connect()) as connection:
+            rows = [dict(row) for row in connection.execute(sql + " ORDER BY path", args)]
+        if wildcards is not None:
+            wildcards = [os.path.normcase(wildcard) for wildcard in wildcards]
+            rows = [
+                row
+                for row in rows
+                if any(fnmatch.fnmatch(os.path.basename(row["path"]), wildcard) for wildcard in wildcards)
+            ]
+        return rows
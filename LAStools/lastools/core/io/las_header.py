@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    las_header.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+# public header block of LAS 1.0 to 1.2, little endian
+HEADER = struct.Struct("<4sHH16sBB32s32sHHHIIBHI5I3d3d6d")
+# additions of LAS 1.3 (start of waveform data) and LAS 1.4 (EVLRs, 64 bit point counts)
+HEADER_13 = struct.Struct("<Q")
+HEADER_14 = struct.Struct("<QIQ15Q")
+VLR_HEADER = struct.Struct("<H16sHH32s")
+EVLR_HEADER = struct.Struct("<H16sHQ32s")
+LASZIP_VLR = struct.Struct("<HHBBHIIqqH")
+LASZIP_ITEM = struct.Struct("<HHH")
+
+LASZIP_USER_ID = "laszip encoded"
+LASZIP_RECORD_ID = 22204
+PROJECTION_USER_ID = "LASF_Projection"
+WKT_RECORD_ID = 2112
+GEOKEYS_RECORD_ID = 34735
+# GeoTIFF keys holding an EPSG code
+PROJECTED_CRS_KEY = 3072
+GEOGRAPHIC_CRS_KEY = 2048
+VERTICAL_CRS_KEY = 4096
+# user defined, not an EPSG code
+USER_DEFINED = 32767
+
+# payloads kept in memory: the records parsed from the header, see LasHeader.read_data() for all others
+PARSED_RECORDS = {
+    (LASZIP_USER_ID, LASZIP_RECORD_ID),
+    (PROJECTION_USER_ID, WKT_RECORD_ID),
+    (PROJECTION_USER_ID, GEOKEYS_RECORD_ID),
+}
+
+# offset and length of the payload in the file, data holds it only for the PARSED_RECORDS (else None)
+LasVlr = namedtuple("LasVlr", ["user_id", "record_id", "description", "offset", "length", "data"])
+
+
+def text(raw):
+    # fixed size, null padded character fields
+    return raw.split(b"\0", 1)[0].decode("ascii", errors="replace").strip()
+
+
+class LasHeader:
+    """
+    Header, VLRs and EVLRs of a LAS or LAZ file.
+
+    Only the header and the records around the point data are read (through a memory map),
+    the points are never touched, so a header is read in microseconds also for a huge LAZ file.
+    Of the payloads of the records only the parsed ones are read, large EVLRs (waveforms,
+    spatial index) stay in the file until read_data() is called.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.vlrs = []
+        self.evlrs = []
+        # LASzip VLR: compressor, chunk size and items, None for uncompressed files
+        self.laszip = None
+        with open(file, "rb") as data:
+            size = os.fstat(data.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{file} is no LAS/LAZ file: too small")
+            with mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                try:
+                    self.parse(view, size)
+                except struct.error:
+                    raise ValueError(f"{file} is no LAS/LAZ file: truncated header")
+
+    def parse(self, view, size):
+        fields = HEADER.unpack_from(view, 0)
+        if fields[0] != b"LASF":
+            raise ValueError(f"{self.file} is no LAS/LAZ file: no LASF signature")
+        (
+            _,
+            self.file_source_id,
+            self.global_encoding,
+            guid,
+            major,
+            minor,
+            system_identifier,
+            generating_software,
+            self.creation_day,
+            self.creation_year,
+            self.header_size,
+            self.offset_to_point_data,
+            number_of_vlrs,
+            point_format,
+            self.point_record_length,
+            legacy_point_count,
+        ) = fields[:16]
+        self.guid = guid.hex()
+        self.version = (major, minor)
+        self.system_identifier = text(system_identifier)
+        self.generating_software = text(generating_software)
+        self.points_by_return = list(fields[16:21])
+        self.scale = fields[21:24]
+        self.offset = fields[24:27]
+        max_x, min_x, max_y, min_y, max_z, min_z = fields[27:33]
+        self.mins = (min_x, min_y, min_z)
+        self.maxs = (max_x, max_y, max_z)
+        # LASzip sets the two highest bits of the point format
+        self.compressed = bool(point_format & 0xC0)
+        self.point_format = point_format & 0x3F
+        self.point_count = legacy_point_count
+        self.start_of_waveform_data = 0
+        start_of_evlrs = 0
+        number_of_evlrs = 0
+        if self.version >= (1, 3) and self.header_size >= HEADER.size + HEADER_13.size:
+            (self.start_of_waveform_data,) = HEADER_13.unpack_from(view, HEADER.size)
+        if self.version >= (1, 4) and self.header_size >= HEADER.size + HEADER_13.size + HEADER_14.size:
+            fields = HEADER_14.unpack_from(view, HEADER.size + HEADER_13.size)
+            start_of_evlrs, number_of_evlrs, point_count = fields[:3]
+            # the legacy fields are zero for point formats 6 to 10 and more than 2^32 points
+            if point_count or not legacy_point_count:
+                self.point_count = point_count
+                self.points_by_return = list(fields[3:])
+        self.vlrs = self.read_records(view, size, self.header_size, number_of_vlrs, VLR_HEADER)
+        if start_of_evlrs:
+            self.evlrs = self.read_records(view, size, start_of_evlrs, number_of_evlrs, EVLR_HEADER)
+        laszip = self.find(LASZIP_USER_ID, LASZIP_RECORD_ID)
+        if laszip is not None and len(laszip.data) >= LASZIP_VLR.size:
+            self.laszip = self.parse_laszip(laszip.data)
+
+    def read_records(self, view, size, position, count, record_header):
+        records = []
+        for _ in range(count):
+            if position + record_header.size > size:
+                break
+            _, user_id, record_id, length, description = record_header.unpack_from(view, position)
+            position += record_header.size
+            user_id = text(user_id)
+            data = view[position : position + length] if (user_id, record_id) in PARSED_RECORDS else None
+            records.append(LasVlr(user_id, record_id, text(description), position, length, data))
+            position += length
+        return records
+
+    def read_data(self, record):
+        """The payload of a VLR or EVLR, read from the file unless it was parsed with the header."""
+        if record.data is not None:
+            return record.data
+        with open(self.file, "rb") as data:
+            data.seek(record.offset)
+            return data.read(record.length)
+
+    @staticmethod
+    def parse_laszip(data):
+        fields = LASZIP_VLR.unpack_from(data, 0)
+        items = [
+            LASZIP_ITEM.unpack_from(data, LASZIP_VLR.size + i * LASZIP_ITEM.size)
+            for i in range(fields[9])
+            if LASZIP_VLR.size + (i + 1) * LASZIP_ITEM.size <= len(data)
+        ]
+        return {
+            "compressor": fields[0],
+            "coder": fields[1],
+            "version": fields[2:5],
+            "options": fields[5],
+            # 0xFFFFFFFF: variable chunk size
+            "chunk_size": fields[6],
+            "items": [{"type": kind, "size": size, "version": version} for kind, size, version in items],
+        }
+
+    def find(self, user_id, record_id):
+        """First VLR or EVLR with the user and record id, None if there is none."""
+        for record in self.vlrs + self.evlrs:
+            if record.user_id == user_id and record.record_id == record_id:
+                return record
+        return None
+
+    @property
+    def extent(self):
+        # 2D bounding box: min x, min y, max x, max y
+        return (self.mins[0], self.mins[1], self.maxs[0], self.maxs[1])
+
+    @property
+    def wkt(self):
+        """OGC WKT of the CRS, empty if the file has none."""
+        record = self.find(PROJECTION_USER_ID, WKT_RECORD_ID)
+        if record is None:
+            return ""
+        return record.data.split(b"\0", 1)[0].decode("utf-8", errors="replace").strip()
+
+    @property
+    def geokeys(self):
+        """GeoTIFF keys with a short value as {key id: value}."""
+        record = self.find(PROJECTION_USER_ID, GEOKEYS_RECORD_ID)
+        if record is None or len(record.data) < 8:
+            return {}
+        count = min(struct.unpack_from("<4H", record.data)[3], len(record.data) // 8 - 1)
+        keys = {}
+        for i in range(count):
+            key, location, _, value = struct.unpack_from("<4H", record.data, 8 + i * 8)
+            # location 0: the value is stored in the key entry itself
+            if location == 0:
+                keys[key] = value
+        return keys
+
+    @property
+    def epsg(self):
+        """EPSG code of the horizontal CRS from the GeoTIFF keys, 0 if unknown."""
+        keys = self.geokeys
+        for key in (PROJECTED_CRS_KEY, GEOGRAPHIC_CRS_KEY):
+            if keys.get(key, USER_DEFINED) != USER_DEFINED:
+                return keys[key]
+        return 0
+
+    @property
+    def vertical_epsg(self):
+        value = self.geokeys.get(VERTICAL_CRS_KEY, USER_DEFINED)
+        return 0 if value == USER_DEFINED else value
+
+    @property
+    def crs(self):
+        """The CRS for QgsCoordinateReferenceSystem.createFromUserInput(): WKT, else 'EPSG:<code>', else empty."""
+        if self.wkt:
+            return self.wkt
+        if self.epsg:
+            return f"EPSG:{self.epsg}"
+        return ""
+
+
+def read_las_headers(files):
+    """Headers of all readable files as {file: LasHeader}, files which are no LAS/LAZ are skipped."""
+    headers = {}
+    for file in files:
+        try:
+            headers[file] = LasHeader(file)
+        except (OSError, ValueError):
+            continue
+    return headers
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    las_points.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .las_header import LasHeader
+
+# fields of the point record formats, little endian
+LEGACY = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("return_bits", "u1"),
+    ("class_bits", "u1"),
+    ("scan_angle_rank", "i1"),
+    ("user_data", "u1"),
+    ("point_source_id", "<u2"),
+]
+EXTENDED = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("return_bits", "u1"),
+    ("flag_bits", "u1"),
+    ("classification", "u1"),
+    ("user_data", "u1"),
+    ("scan_angle", "<i2"),
+    ("point_source_id", "<u2"),
+    ("gps_time", "<f8"),
+]
+GPS_TIME = [("gps_time", "<f8")]
+RGB = [("red", "<u2"), ("green", "<u2"), ("blue", "<u2")]
+NIR = [("nir", "<u2")]
+WAVE_PACKET = [
+    ("wave_packet_index", "u1"),
+    ("wave_byte_offset", "<u8"),
+    ("wave_packet_size", "<u4"),
+    ("return_point_location", "<f4"),
+    ("x_t", "<f4"),
+    ("y_t", "<f4"),
+    ("z_t", "<f4"),
+]
+POINT_FORMATS = {
+    0: LEGACY,
+    1: LEGACY + GPS_TIME,
+    2: LEGACY + RGB,
+    3: LEGACY + GPS_TIME + RGB,
+    4: LEGACY + GPS_TIME + WAVE_PACKET,
+    5: LEGACY + GPS_TIME + RGB + WAVE_PACKET,
+    6: EXTENDED,
+    7: EXTENDED + RGB,
+    8: EXTENDED + RGB + NIR,
+    9: EXTENDED + WAVE_PACKET,
+    10: EXTENDED + RGB + NIR + WAVE_PACKET,
+}
+
+
+def point_dtype(point_format, point_record_length):
+    """numpy dtype of a point record, bytes beyond the standard fields go into 'extra_bytes'."""
+    if point_format not in POINT_FORMATS:
+        raise ValueError(f"unknown point format {point_format}")
+    dtype = numpy.dtype(POINT_FORMATS[point_format])
+    if point_record_length < dtype.itemsize:
+        raise ValueError(f"point record length {point_record_length} too short for point format {point_format}")
+    if point_record_length > dtype.itemsize:
+        dtype = numpy.dtype(POINT_FORMATS[point_format] + [("extra_bytes", f"V{point_record_length - dtype.itemsize}")])
+    return dtype
+
+
+class LasPoints:
+    """
+    The points of an uncompressed LAS file as read-only numpy structured array (points),
+    memory mapped: nothing is read until it is used and nothing is copied, also for chunks.
+
+    The fields hold the raw record values, x(), y() and z() scale the coordinates of
+    a chunk (or of all points) on access. The statistics go chunk by chunk, so the memory
+    needed does not depend on the size of the file.
+    """
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, file):
+        if numpy is None:
+            raise ImportError("reading points needs numpy")
+        self.header = LasHeader(file)
+        if self.header.compressed:
+            raise ValueError(f"{file} is compressed (LAZ): decompress it first, e.g. with laszip")
+        self.dtype = point_dtype(self.header.point_format, self.header.point_record_length)
+        # a truncated file only has the complete records
+        available = (os.path.getsize(file) - self.header.offset_to_point_data) // self.dtype.itemsize
+        count = max(0, min(self.header.point_count, available))
+        if count == 0:
+            self.points = numpy.zeros(0, dtype=self.dtype)
+        else:
+            self.points = numpy.memmap(
+                file, dtype=self.dtype, mode="r", offset=self.header.offset_to_point_data, shape=(count,)
+            )
+        self.extended = self.header.point_format >= 6
+
+    def __len__(self):
+        return len(self.points)
+
+    def chunks(self, size=CHUNK_SIZE):
+        """Views of consecutive slices of the points."""
+        for start in range(0, len(self.points), size):
+            yield self.points[start : start + size]
+
+    def scaled(self, axis, points=None):
+        points = self.points if points is None else points
+        return points["XYZ"[axis]] * self.header.scale[axis] + self.header.offset[axis]
+
+    def x(self, points=None):
+        return self.scaled(0, points)
+
+    def y(self, points=None):
+        return self.scaled(1, points)
+
+    def z(self, points=None):
+        return self.scaled(2, points)
+
+    def classification(self, points=None):
+        points = self.points if points is None else points
+        if self.extended:
+            return points["classification"]
+        return points["class_bits"] & 0x1F
+
+    def return_number(self, points=None):
+        points = self.points if points is None else points
+        if self.extended:
+            return points["return_bits"] & 0x0F
+        return points["return_bits"] & 0x07
+
+    def number_of_returns(self, points=None):
+        points = self.points if points is None else points
+        if self.extended:
+            return points["return_bits"] >> 4
+        return (points["return_bits"] >> 3) & 0x07
+
+    def withheld(self, points=None):
+        points = self.points if points is None else points
+        if self.extended:
+            return (points["flag_bits"] & 0x04) != 0
+        return (points["class_bits"] & 0x80) != 0
+
+    def ranges(self):
+        """min and max of the scaled x, y and z of the points: ((min x, min y, min z), (max x, max y, max z))."""
+        if not len(self.points):
+            return None
+        mins = numpy.full(3, numpy.iinfo(numpy.int32).max, dtype=numpy.int64)
+        maxs = numpy.full(3, numpy.iinfo(numpy.int32).min, dtype=numpy.int64)
+        # on the integer values, scaled once at the end
+        for chunk in self.chunks():
+            for axis, name in enumerate("XYZ"):
+                mins[axis] = min(mins[axis], chunk[name].min())
+                maxs[axis] = max(maxs[axis], chunk[name].max())
+        scale = numpy.array(self.header.scale)
+        offset = numpy.array(self.header.offset)
+        return tuple((mins * scale + offset).tolist()), tuple((maxs * scale + offset).tolist())
+
+    def classification_histogram(self):
+        """Number of points per classification (0 to 255) as numpy array."""
+        histogram = numpy.zeros(256, dtype=numpy.int64)
+        for chunk in self.chunks():
+            histogram += numpy.bincount(self.classification(chunk), minlength=256)
+        return histogram
+
+    def return_histogram(self):
+        """Number of points per return number (0 to 15) as numpy array."""
+        histogram = numpy.zeros(16, dtype=numpy.int64)
+        for chunk in self.chunks():
+            histogram += numpy.bincount(self.return_number(chunk), minlength=16)
+        return histogram
+
+    def density_grid(self, cell_size, extent=None):
+        """
+        Points per cell of a grid over the extent (min x, min y, max x, max y, default: the header bounding box).
+        Returns the counts (rows from north to south) and the extent of the grid.
+        """
+        if extent is None:
+            extent = self.header.extent
+        columns = max(1, int(numpy.ceil((extent[2] - extent[0]) / cell_size)))
+        rows = max(1, int(numpy.ceil((extent[3] - extent[1]) / cell_size)))
+        counts = numpy.zeros(rows * columns, dtype=numpy.int64)
+        for chunk in self.chunks():
+            x = self.x(chunk)
+            y = self.y(chunk)
+            inside = (x >= extent[0]) & (x <= extent[2]) & (y >= extent[1]) & (y <= extent[3])
+            column = ((x[inside] - extent[0]) // cell_size).astype(numpy.int64)
+            row = ((extent[3] - y[inside]) // cell_size).astype(numpy.int64)
+            # points on the east or south border belong to the last cell
+            column = numpy.minimum(column, columns - 1)
+            row = numpy.minimum(row, rows - 1)
+            counts += numpy.bincount(row * columns + column, minlength=rows * columns)
+        grid_extent = (extent[0], extent[3] - rows * cell_size, extent[0] + columns * cell_size, extent[3])
+        return counts.reshape(rows, columns), grid_extent
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    las_synthetic.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import datetime
+import math
+import struct
+import zlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .las_header import (
+    GEOKEYS_RECORD_ID,
+    HEADER,
+    HEADER_13,
+    HEADER_14,
+    PROJECTED_CRS_KEY,
+    PROJECTION_USER_ID,
+    VLR_HEADER,
+    WKT_RECORD_ID,
+)
+from .las_points import POINT_FORMATS
+
+# point formats by LAS version, the waveform formats are left out
+SYNTHETIC_VERSIONS = {(1, 2): [0, 1, 2, 3], (1, 4): [0, 1, 2, 3, 6, 7, 8]}
+# ASPRS classes of the scene
+GROUND = 2
+LOW_VEGETATION = 3
+MEDIUM_VEGETATION = 4
+HIGH_VEGETATION = 5
+BUILDING = 6
+NOISE = 7
+# max. number of cells of the grids holding the buildings and the vegetation
+GRID_CELLS = 1 << 22
+# global encoding: adjusted standard GPS time, OGC WKT CRS
+GPS_TIME_ADJUSTED = 0x1
+WKT_CRS = 0x10
+# colors (8 bit RGB, NIR) by class
+COLORS = {
+    GROUND: (150, 120, 90, 60),
+    LOW_VEGETATION: (110, 160, 70, 180),
+    MEDIUM_VEGETATION: (70, 140, 50, 200),
+    HIGH_VEGETATION: (40, 110, 40, 220),
+    BUILDING: (170, 170, 175, 90),
+    NOISE: (255, 0, 255, 0),
+}
+
+
+class SyntheticLas:
+    """
+    A synthetic airborne LiDAR scene: a smooth terrain with buildings, vegetation and noise,
+    scanned by parallel flight lines (flying north and south in turns) with some overlap.
+
+    The scene is defined by the seed, the same arguments give the same points. write() writes
+    the points of all or of some flight lines in all or a part of the scene to a LAS file,
+    generated and written chunk by chunk, so any size needs a few MB of memory.
+    """
+
+    # points generated at a time: the arrays of a chunk stay in the cache
+    CHUNK_SIZE = 1 << 16
+    # ground speed of the aircraft [m/s], gps time of the first line and time between the lines [s]
+    SPEED = 60.0
+    START_TIME = 1.0e8
+    LINE_INTERVAL = 600.0
+    MAX_SCAN_ANGLE = 20.0
+    # share of the pulses into vegetation which return from the vegetation first
+    CANOPY_HITS = 0.7
+
+    def __init__(
+        self,
+        extent=(0.0, 0.0, 1000.0, 1000.0),
+        density=10.0,
+        flightlines=4,
+        overlap=0.2,
+        vegetation=0.3,
+        buildings=20,
+        noise=0.001,
+        seed=0,
+    ):
+        if numpy is None:
+            raise ImportError("synthetic point clouds need numpy")
+        if extent[2] <= extent[0] or extent[3] <= extent[1]:
+            raise ValueError(f"empty extent {extent}")
+        if density <= 0 or flightlines < 1 or not 0 <= overlap < 1:
+            raise ValueError("density and flight lines must be positive, the overlap below 1")
+        if not 0 <= vegetation <= 1 or not 0 <= noise <= 1 or buildings < 0:
+            raise ValueError("vegetation and noise are shares from 0 to 1, buildings a count")
+        self.extent = tuple(float(value) for value in extent)
+        self.density = float(density)
+        self.flightlines = int(flightlines)
+        self.overlap = float(overlap)
+        self.noise = float(noise)
+        self.seed = int(seed)
+        rng = numpy.random.default_rng(self.seed)
+        width = self.extent[2] - self.extent[0]
+        height = self.extent[3] - self.extent[1]
+        size = max(width, height)
+        # terrain: three waves with wave lengths between a fifth of the scene and the whole scene
+        self.waves = [
+            (rng.uniform(2, 10) * math.pi / size, rng.uniform(0, 2 * math.pi), rng.uniform(0.005, 0.02) * size)
+            for _ in range(3)
+        ]
+        self.base = 100.0 + rng.uniform(0, 200)
+        self.cell = max(1.0, math.sqrt(width * height / GRID_CELLS))
+        self.columns = max(1, math.ceil(width / self.cell))
+        self.rows = max(1, math.ceil(height / self.cell))
+        # height of the roofs above ground by cell, 0: no building
+        self.roofs = numpy.zeros((self.rows, self.columns), dtype=numpy.float32)
+        for _ in range(int(buildings)):
+            sides = rng.uniform(8, 40, 2) / self.cell
+            column = int(rng.uniform(0, max(1, self.columns - sides[0])))
+            row = int(rng.uniform(0, max(1, self.rows - sides[1])))
+            block = self.roofs[row : row + max(1, int(sides[1])), column : column + max(1, int(sides[0]))]
+            numpy.maximum(block, rng.uniform(3, 30), out=block)
+        # height of the vegetation by cell: patches from a smooth field, 0: open terrain
+        self.canopy = numpy.zeros_like(self.roofs)
+        if vegetation > 0:
+            x = (numpy.arange(self.columns) + 0.5) * self.cell
+            y = (numpy.arange(self.rows) + 0.5) * self.cell
+            frequencies = rng.uniform(4, 16, 3) * math.pi / size
+            phases = rng.uniform(0, 2 * math.pi, 3)
+            field = numpy.sin(y[:, None] * frequencies[1] + phases[1]) * numpy.sin(x * frequencies[0] + phases[0])
+            field += 0.5 * numpy.sin((x - y[:, None]) * frequencies[2] + phases[2])
+            field += rng.uniform(-0.3, 0.3, field.shape)
+            threshold = numpy.quantile(field, 1 - vegetation) if vegetation < 1 else -numpy.inf
+            trees = (field >= threshold) & (self.roofs == 0)
+            self.canopy[trees] = (2 + 28 * rng.random(numpy.count_nonzero(trees))).astype(numpy.float32)
+
+    def ground(self, x, y):
+        """Height of the terrain above the base at the coordinates relative to the south west corner of the scene."""
+        z = numpy.zeros(len(x), dtype=numpy.float32)
+        for i, (frequency, phase, amplitude) in enumerate(self.waves):
+            along = x if i == 0 else y if i == 1 else x + y
+            wave = numpy.multiply(along, numpy.float32(frequency))
+            wave += numpy.float32(phase)
+            numpy.sin(wave, out=wave)
+            wave *= numpy.float32(amplitude)
+            z += wave
+        return z
+
+    def strip(self, line):
+        # min and max x covered by a flight line
+        width = (self.extent[2] - self.extent[0]) / self.flightlines
+        center = self.extent[0] + (line + 0.5) * width
+        half = width * (1 + self.overlap) / 2
+        return center, half, max(self.extent[0], center - half), min(self.extent[2], center + half)
+
+    def region(self, line, extent):
+        # part of the extent covered by a flight line: min x, min y, max x, max y, None if nothing
+        _, _, min_x, max_x = self.strip(line)
+        region = (
+            max(min_x, extent[0]),
+            max(self.extent[1], extent[1]),
+            min(max_x, extent[2]),
+            min(self.extent[3], extent[3]),
+        )
+        if region[2] <= region[0] or region[3] <= region[1]:
+            return None
+        return region
+
+    def count(self, lines=None, extent=None):
+        """Number of points write() writes for the flight lines in the extent."""
+        extent = self.extent if extent is None else extent
+        total = 0
+        for line in range(self.flightlines) if lines is None else lines:
+            region = self.region(line, extent)
+            if region is not None:
+                total += round(self.density * (region[2] - region[0]) * (region[3] - region[1]))
+        return total
+
+    def chunks(self, line, extent, dtype, scale, offset):
+        """The points of a flight line in the extent as records of dtype, chunk by chunk along the line."""
+        region = self.region(line, extent)
+        if region is None:
+            return
+        count = round(self.density * (region[2] - region[0]) * (region[3] - region[1]))
+        chunks = max(1, math.ceil(count / self.CHUNK_SIZE))
+        length = (region[3] - region[1]) / chunks
+        center, half, _, _ = self.strip(line)
+        extended = "classification" in dtype.names
+        colors = numpy.zeros((NOISE + 1, 4), dtype=numpy.uint16)
+        for kind, color in COLORS.items():
+            colors[kind] = [value * 256 for value in color]
+        for chunk in range(chunks):
+            size = count // chunks + (chunk < count % chunks)
+            if not size:
+                continue
+            # a stream of its own per chunk: the same points whatever else is written
+            rng = numpy.random.default_rng([self.seed, line, chunk, zlib.crc32(repr(tuple(extent)).encode())])
+            # single precision metres from the south west corner of the scene, half the memory traffic
+            x = rng.random(size, dtype=numpy.float32)
+            x *= region[2] - region[0]
+            x += region[0] - self.extent[0]
+            y = rng.random(size, dtype=numpy.float32)
+            y += chunk
+            y *= length
+            y += region[1] - self.extent[1]
+            rows = numpy.subtract(numpy.float32(self.extent[3] - self.extent[1]), y)
+            rows *= 1 / self.cell
+            cells = numpy.minimum(rows.astype(numpy.intp), self.rows - 1)
+            cells *= self.columns
+            cells += numpy.minimum((x / self.cell).astype(numpy.intp), self.columns - 1)
+            roof = self.roofs.ravel()[cells]
+            canopy = self.canopy.ravel()[cells]
+            draw = rng.random(size, dtype=numpy.float32)
+            # a pulse hitting the vegetation returns twice: from the vegetation (at a random height), then from
+            # the ground. The pulses up to size points are taken, a pulse one return too many misses the canopy.
+            hits = (canopy > 0) & (draw < self.CANOPY_HITS)
+            returns = hits.view(numpy.uint8) + numpy.uint8(1)
+            ends = numpy.cumsum(returns, dtype=numpy.intp)
+            pulses = int(numpy.searchsorted(ends, size)) + 1
+            if ends[pulses - 1] > size:
+                hits[pulses - 1] = False
+                returns[pulses - 1] = 1
+            # the points of the pulses, the returns of a pulse one after the other
+            pulse = numpy.repeat(numpy.arange(pulses), returns[:pulses])
+            first = numpy.ones(size, dtype=bool)
+            numpy.not_equal(pulse[1:], pulse[:-1], out=first[1:])
+            # the terrain of the pulses taken only
+            z = self.ground(x[:pulses], y[:pulses])
+            canopy *= draw
+            canopy *= 1 / self.CANOPY_HITS
+            x, y, z, roof, canopy, draw, hits, returns = (
+                values[pulse] for values in (x, y, z, roof, canopy, draw, hits, returns)
+            )
+            hits &= first
+            heights = numpy.where(hits, canopy, numpy.float32(0))
+            z += roof
+            z += heights
+            classification = numpy.where(roof > 0, numpy.uint8(BUILDING), numpy.uint8(GROUND))
+            vegetation_class = (heights >= 2).view(numpy.uint8) + numpy.uint8(LOW_VEGETATION)
+            vegetation_class += (heights >= 5).view(numpy.uint8)
+            numpy.copyto(classification, vegetation_class, where=hits)
+            number_of_returns = returns
+            return_number = numpy.uint8(2) - first.view(numpy.uint8)
+            noise = numpy.flatnonzero(rng.random(size, dtype=numpy.float32) < self.noise)
+            z[noise] += rng.uniform(-30, 80, len(noise)).astype(numpy.float32)
+            classification[noise] = NOISE
+            points = numpy.zeros(size, dtype=dtype)
+            points["point_source_id"] = line + 1
+            draw *= 400
+            points["intensity"] = classification * numpy.uint16(100) + draw.astype(numpy.uint16)
+            center_x = center - self.extent[0]
+            scan_angle = numpy.subtract(x, numpy.float32(center_x))
+            scan_angle *= self.MAX_SCAN_ANGLE / half
+            if extended:
+                points["return_bits"] = return_number | (number_of_returns << 4)
+                points["classification"] = classification
+                # 0.006 degree steps
+                scan_angle *= 1 / 0.006
+                points["scan_angle"] = numpy.rint(scan_angle, out=scan_angle)
+            else:
+                points["return_bits"] = return_number | (number_of_returns << 3)
+                points["class_bits"] = classification
+                points["scan_angle_rank"] = numpy.rint(scan_angle, out=scan_angle)
+            if "gps_time" in dtype.names:
+                # along the line, northwards on even and southwards on odd lines
+                height = self.extent[3] - self.extent[1]
+                along = y.astype(numpy.float64) if line % 2 == 0 else height - y.astype(numpy.float64)
+                along *= 1 / self.SPEED
+                along += self.START_TIME + line * self.LINE_INTERVAL
+                points["gps_time"] = along
+            if "red" in dtype.names:
+                color = colors[classification]
+                points["red"] = color[:, 0]
+                points["green"] = color[:, 1]
+                points["blue"] = color[:, 2]
+                if "nir" in dtype.names:
+                    points["nir"] = color[:, 3]
+            shifts = (self.extent[0] - offset[0], self.extent[1] - offset[1], self.base - offset[2])
+            for name, values, shift in zip("XYZ", (x, y, z), shifts):
+                scaled = values.astype(numpy.float64)
+                scaled += shift
+                scaled *= 1 / scale
+                points[name] = numpy.rint(scaled, out=scaled)
+            yield points
+
+    def write(
+        self,
+        file,
+        point_format=1,
+        version=(1, 2),
+        lines=None,
+        extent=None,
+        scale=0.01,
+        epsg=0,
+        wkt="",
+        progress=None,
+        canceled=None,
+    ):
+        """
+        Writes the points of the flight lines (default: all) in the extent (default: the scene) to a LAS file
+        and returns the number of points. The CRS is written as GeoTIFF keys (epsg) and as OGC WKT (wkt).
+        progress(points written, points) is called after each chunk, a run stops early when canceled() is true
+        (the file then has the points up to there).
+        """
+        version = tuple(version)
+        if version not in SYNTHETIC_VERSIONS:
+            raise ValueError(f"LAS {version[0]}.{version[1]} is not supported, only 1.2 and 1.4")
+        if point_format not in SYNTHETIC_VERSIONS[version]:
+            raise ValueError(f"point format {point_format} is not supported for LAS {version[0]}.{version[1]}")
+        extent = self.extent if extent is None else tuple(extent)
+        lines = range(self.flightlines) if lines is None else lines
+        dtype = numpy.dtype(POINT_FORMATS[point_format])
+        total = self.count(lines, extent)
+        offset = (math.floor(extent[0] / 1000) * 1000, math.floor(extent[1] / 1000) * 1000, 0.0)
+        records = self.records(epsg, wkt)
+        header_size = HEADER.size + (HEADER_13.size + HEADER_14.size if version == (1, 4) else 0)
+        mins = numpy.full(3, numpy.iinfo(numpy.int32).max, dtype=numpy.int64)
+        maxs = numpy.full(3, numpy.iinfo(numpy.int32).min, dtype=numpy.int64)
+        by_return = numpy.zeros(16, dtype=numpy.int64)
+        written = 0
+        chunks = (points for line in lines for points in self.chunks(line, extent, dtype, scale, offset))
+        with open(file, "wb") as out:
+            # the header is written again at the end, with the counts and the bounding box
+            out.write(bytes(header_size) + b"".join(records))
+            for points in chunks:
+                if canceled is not None and canceled():
+                    break
+                points.tofile(out)
+                written += len(points)
+                for axis, name in enumerate("XYZ"):
+                    mins[axis] = min(mins[axis], points[name].min())
+                    maxs[axis] = max(maxs[axis], points[name].max())
+                return_number = points["return_bits"] & (0x0F if point_format >= 6 else 0x07)
+                by_return += numpy.bincount(return_number, minlength=16)
+                if progress is not None:
+                    progress(written, total)
+            if not written:
+                mins[:] = maxs[:] = 0
+            mins = mins * scale + offset
+            maxs = maxs * scale + offset
+            out.seek(0)
+            out.write(
+                self.header(
+                    version,
+                    point_format,
+                    dtype,
+                    header_size,
+                    records,
+                    written,
+                    by_return,
+                    scale,
+                    offset,
+                    mins,
+                    maxs,
+                    wkt,
+                )
+            )
+        return written
+
+    @staticmethod
+    def records(epsg, wkt):
+        # VLRs of the CRS
+        records = []
+        if epsg:
+            # GeoKeyDirectory: version 1.1.0, projected model, the EPSG code of the projected CRS
+            keys = struct.pack("<12H", 1, 1, 0, 2, 1024, 0, 1, 1, PROJECTED_CRS_KEY, 0, 1, epsg)
+            header = VLR_HEADER.pack(
+                0, PROJECTION_USER_ID.encode(), GEOKEYS_RECORD_ID, len(keys), b"GeoKeyDirectoryTag"
+            )
+            records.append(header + keys)
+        if wkt:
+            data = wkt.encode("utf-8") + b"\0"
+            records.append(VLR_HEADER.pack(0, PROJECTION_USER_ID.encode(), WKT_RECORD_ID, len(data), b"OGC WKT") + data)
+        return records
+
+    @staticmethod
+    def header(version, point_format, dtype, header_size, records, count, by_return, scale, offset, mins, maxs, wkt):
+        today = datetime.date.today()
+        legacy = point_format < 6 and count < 1 << 32
+        fields = HEADER.pack(
+            b"LASF",
+            0,
+            GPS_TIME_ADJUSTED | (WKT_CRS if wkt and version == (1, 4) else 0),
+            bytes(16),
+            version[0],
+            version[1],
+            b"synthetic",
+            b"LAStools QGIS plugin",
+            today.timetuple().tm_yday,
+            today.year,
+            header_size,
+            header_size + sum(len(record) for record in records),
+            len(records),
+            point_format,
+            dtype.itemsize,
+            count if legacy else 0,
+            *[int(value) if legacy else 0 for value in by_return[1:6]],
+            scale,
+            scale,
+            scale,
+            *offset,
+            maxs[0],
+            mins[0],
+            maxs[1],
+            mins[1],
+            maxs[2],
+            mins[2],
+        )
+        if version == (1, 4):
+            fields += HEADER_13.pack(0) + HEADER_14.pack(0, 0, count, *[int(value) for value in by_return[1:16]])
+        return fields
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    lax_index.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+import struct
+
+from .las_header import LasHeader
+
+# signature and version of the index, then of the quadtree and of the intervals
+LASX = struct.Struct("<4sI")
+QUADTREE = struct.Struct("<4sI4sIIII4f")
+INTERVALS = struct.Struct("<4sII")
+CELL = struct.Struct("<iII")
+# an index appended to a LAZ file by 'lasindex -append' is stored as EVLR
+LAX_USER_ID = "LAStools"
+LAX_RECORD_ID = 30
+
+
+class LaxIndex:
+    """
+    Spatial index of a LAS/LAZ file as written by lasindex (*.lax).
+
+    The points of the file are binned into the cells of a quadtree over the bounding box,
+    each cell holds the intervals of point indices (in file order) of its points.
+    A query returns the intervals of all cells intersecting a rectangle, without reading a point.
+    """
+
+    def __init__(self, data):
+        position = 0
+        signature, _ = LASX.unpack_from(data, position)
+        if signature != b"LASX":
+            raise ValueError("no LASindex: no LASX signature")
+        position += LASX.size
+        fields = QUADTREE.unpack_from(data, position)
+        if fields[0] != b"LASS" or fields[2] != b"LASQ":
+            raise ValueError("no LASindex: unsupported spatial structure")
+        self.levels = fields[4]
+        min_x, max_x, min_y, max_y = fields[7:11]
+        self.bounds = (min_x, min_y, max_x, max_y)
+        position += QUADTREE.size
+        signature, _, number_of_cells = INTERVALS.unpack_from(data, position)
+        if signature != b"LASV":
+            raise ValueError("no LASindex: no LASV signature")
+        position += INTERVALS.size
+        # {cell index: (number of points, [(first, last point index), ...])}
+        self.cells = {}
+        for _ in range(number_of_cells):
+            cell, number_of_intervals, number_of_points = CELL.unpack_from(data, position)
+            position += CELL.size
+            bounds = struct.unpack_from(f"<{2 * number_of_intervals}I", data, position)
+            position += 8 * number_of_intervals
+            self.cells[cell] = (number_of_points, list(zip(bounds[0::2], bounds[1::2])))
+
+    @classmethod
+    def read(cls, file):
+        """The index of a LAS/LAZ file from its *.lax file or its EVLR, None if it has none."""
+        try:
+            with open(os.path.splitext(file)[0] + ".lax", "rb") as lax:
+                return cls(lax.read())
+        except OSError:
+            pass
+        except (ValueError, struct.error):
+            return None
+        try:
+            header = LasHeader(file)
+            record = header.find(LAX_USER_ID, LAX_RECORD_ID)
+            return None if record is None else cls(header.read_data(record))
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def level_of(cell):
+        # cells of level l are numbered from (4^l - 1) / 3 on
+        level = 0
+        offset = 0
+        while cell >= offset + (1 << (2 * level)):
+            offset += 1 << (2 * level)
+            level += 1
+        return level, cell - offset
+
+    def cell_rect(self, cell):
+        """min x, min y, max x, max y of a cell."""
+        min_x, min_y, max_x, max_y = self.bounds
+        level, index = self.level_of(cell)
+        # two bits per level, the top level in the highest bits: bit 0 is the upper x half, bit 1 the upper y half
+        for shift in range(2 * (level - 1), -1, -2):
+            quadrant = (index >> shift) & 3
+            mid_x = (min_x + max_x) / 2
+            mid_y = (min_y + max_y) / 2
+            if quadrant & 1:
+                min_x = mid_x
+            else:
+                max_x = mid_x
+            if quadrant & 2:
+                min_y = mid_y
+            else:
+                max_y = mid_y
+        return (min_x, min_y, max_x, max_y)
+
+    def cells_in(self, extent):
+        """The cells intersecting an extent (min x, min y, max x, max y) as {cell index: rect}."""
+        cells = {}
+        for cell in self.cells:
+            rect = self.cell_rect(cell)
+            if rect[0] <= extent[2] and rect[2] >= extent[0] and rect[1] <= extent[3] and rect[3] >= extent[1]:
+                cells[cell] = rect
+        return cells
+
+    def intervals(self, extent, cells=None):
+        """Merged intervals (first, last point index) of the points in the cells intersecting the extent."""
+        if cells is None:
+            cells = self.cells_in(extent)
+        intervals = sorted(interval for cell in cells for interval in self.cells[cell][1])
+        merged = []
+        for first, last in intervals:
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+        return merged
+
+    def count(self, extent, cells=None):
+        """Number of points in the cells intersecting the extent, an upper bound of the points in it."""
+        if cells is None:
+            cells = self.cells_in(extent)
+        return sum(self.cells[cell][0] for cell in cells)
+
+
+def query_lax_indexes(files, extent):
+    """
+    The points of the files within reach of the extent (min x, min y, max x, max y) by their indexes:
+    {file: intervals}, where intervals is None for a file without index (all its points may be in reach).
+    Files whose index has no cell intersecting the extent are left out.
+    """
+    result = {}
+    for file in files:
+        index = LaxIndex.read(file)
+        if index is None:
+            result[file] = None
+            continue
+        cells = index.cells_in(extent)
+        if cells:
+            result[file] = index.intervals(extent, cells)
+    return result
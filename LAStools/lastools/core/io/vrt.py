@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    vrt.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+import struct
+import uuid
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+try:
+    from osgeo import gdal
+except ImportError:
+    gdal = None
+
+from .bil_raster import BilHeader
+
+# TIFF tags of the layout and the georeference of a GeoTIFF
+IMAGE_WIDTH = 256
+IMAGE_LENGTH = 257
+BITS_PER_SAMPLE = 258
+ROWS_PER_STRIP = 278
+TILE_WIDTH = 322
+TILE_LENGTH = 323
+SAMPLE_FORMAT = 339
+MODEL_PIXEL_SCALE = 33550
+MODEL_TIEPOINT = 33922
+MODEL_TRANSFORMATION = 34264
+GEO_KEY_DIRECTORY = 34735
+GDAL_NODATA = 42113
+# struct format of the TIFF field types (rational: two longs)
+TIFF_TYPES = {
+    1: "B",
+    2: "s",
+    3: "H",
+    4: "I",
+    5: "2I",
+    6: "b",
+    7: "B",
+    8: "h",
+    9: "i",
+    11: "f",
+    12: "d",
+    16: "Q",
+    17: "q",
+}
+# GeoTIFF keys
+RASTER_TYPE_KEY = 1025
+RASTER_PIXEL_IS_POINT = 2
+PROJECTED_CRS_KEY = 3072
+GEOGRAPHIC_CRS_KEY = 2048
+USER_DEFINED = 32767
+# GDAL data type by sample format (1: unsigned, 2: signed, 3: float) and bits
+TIFF_DATA_TYPES = {
+    (1, 8): "Byte",
+    (1, 16): "UInt16",
+    (1, 32): "UInt32",
+    (2, 8): "Int8",
+    (2, 16): "Int16",
+    (2, 32): "Int32",
+    (3, 32): "Float32",
+    (3, 64): "Float64",
+}
+# GDAL data type by numpy type character and size
+BIL_DATA_TYPES = {
+    "u1": "Byte",
+    "i1": "Int8",
+    "u2": "UInt16",
+    "i2": "Int16",
+    "u4": "UInt32",
+    "i4": "Int32",
+    "f4": "Float32",
+    "f8": "Float64",
+}
+VRT_EXTENSIONS = [".tif", ".tiff", ".bil", ".asc"]
+
+# geotransform: (x of the left edge, cell width, 0, y of the upper edge, 0, -cell height)
+RasterInfo = namedtuple(
+    "RasterInfo", ["file", "width", "height", "geotransform", "data_type", "nodata", "srs", "block"]
+)
+
+
+def read_prj(file):
+    try:
+        with open(os.path.splitext(file)[0] + ".prj", encoding="utf-8", errors="replace") as data:
+            return data.read().strip()
+    except OSError:
+        return ""
+
+
+def read_tiff_tags(file):
+    """Tags of the first image of a (Big)TIFF file as {tag: tuple of values, or str for ASCII}."""
+    tags = {}
+    with open(file, "rb") as data:
+        head = data.read(16)
+        if head[:2] == b"II":
+            order = "<"
+        elif head[:2] == b"MM":
+            order = ">"
+        else:
+            raise ValueError(f"{file} is no TIFF file")
+        (version,) = struct.unpack_from(order + "H", head, 2)
+        if version == 42:
+            (offset,) = struct.unpack_from(order + "I", head, 4)
+            count_format, entry_format, inline = "H", "HHI", 4
+        elif version == 43:
+            (offset,) = struct.unpack_from(order + "Q", head, 8)
+            count_format, entry_format, inline = "Q", "HHQ", 8
+        else:
+            raise ValueError(f"{file} is no TIFF file")
+        data.seek(offset)
+        (count,) = struct.unpack(order + count_format, data.read(struct.calcsize(count_format)))
+        entry_size = struct.calcsize(order + entry_format) + inline
+        entries = data.read(count * entry_size)
+        for i in range(count):
+            tag, kind, length = struct.unpack_from(order + entry_format, entries, i * entry_size)
+            if kind not in TIFF_TYPES:
+                continue
+            value_format = order + TIFF_TYPES[kind] * length if kind != 2 else f"{length}s"
+            size = struct.calcsize(value_format)
+            position = i * entry_size + struct.calcsize(order + entry_format)
+            if size <= inline:
+                raw = entries[position : position + size]
+            else:
+                (value_offset,) = struct.unpack_from(order + ("I" if inline == 4 else "Q"), entries, position)
+                data.seek(value_offset)
+                raw = data.read(size)
+            if len(raw) < size:
+                raise ValueError(f"{file}: truncated TIFF tag {tag}")
+            if kind == 2:
+                tags[tag] = raw.split(b"\0", 1)[0].decode("ascii", errors="replace")
+            else:
+                tags[tag] = struct.unpack(value_format, raw)
+    return tags
+
+
+def tiff_info(file):
+    tags = read_tiff_tags(file)
+    try:
+        width = tags[IMAGE_WIDTH][0]
+        height = tags[IMAGE_LENGTH][0]
+    except KeyError:
+        raise ValueError(f"{file}: no image size")
+    bits = tags.get(BITS_PER_SAMPLE, (1,))[0]
+    sample_format = tags.get(SAMPLE_FORMAT, (1,))[0]
+    if (sample_format, bits) not in TIFF_DATA_TYPES:
+        raise ValueError(f"{file}: unsupported sample format {sample_format} of {bits} bits")
+    keys = {}
+    directory = tags.get(GEO_KEY_DIRECTORY, ())
+    for i in range(4, len(directory) - 3, 4):
+        key, location, _, value = directory[i : i + 4]
+        # location 0: the value is stored in the key entry itself
+        if location == 0:
+            keys[key] = value
+    if MODEL_PIXEL_SCALE in tags and MODEL_TIEPOINT in tags:
+        scale_x, scale_y = tags[MODEL_PIXEL_SCALE][:2]
+        column, row, _, x, y, _ = tags[MODEL_TIEPOINT][:6]
+        x -= column * scale_x
+        y += row * scale_y
+    elif MODEL_TRANSFORMATION in tags:
+        matrix = tags[MODEL_TRANSFORMATION]
+        if matrix[1] or matrix[4]:
+            raise ValueError(f"{file}: rotated rasters are not supported")
+        scale_x, x, scale_y, y = matrix[0], matrix[3], -matrix[5], matrix[7]
+    else:
+        raise ValueError(f"{file}: no georeference")
+    if keys.get(RASTER_TYPE_KEY) == RASTER_PIXEL_IS_POINT:
+        # the coordinates are the ones of the center of the upper left cell
+        x -= scale_x / 2
+        y += scale_y / 2
+    srs = ""
+    for key in (PROJECTED_CRS_KEY, GEOGRAPHIC_CRS_KEY):
+        if keys.get(key, USER_DEFINED) != USER_DEFINED:
+            srs = f"EPSG:{keys[key]}"
+            break
+    try:
+        nodata = float(tags[GDAL_NODATA]) if GDAL_NODATA in tags else None
+    except ValueError:
+        nodata = None
+    if TILE_WIDTH in tags and TILE_LENGTH in tags:
+        block = (tags[TILE_WIDTH][0], tags[TILE_LENGTH][0])
+    else:
+        block = (width, min(height, tags.get(ROWS_PER_STRIP, (height,))[0]))
+    geotransform = (x, scale_x, 0.0, y, 0.0, -scale_y)
+    return RasterInfo(file, width, height, geotransform, TIFF_DATA_TYPES[(sample_format, bits)], nodata, srs, block)
+
+
+def bil_info(file):
+    header = BilHeader(file)
+    geotransform = (header.extent[0], header.xdim, 0.0, header.extent[3], 0.0, -header.ydim)
+    data_type = BIL_DATA_TYPES[header.type[1:]]
+    block = (header.columns, 1)
+    return RasterInfo(file, header.columns, header.rows, geotransform, data_type, header.nodata, header.wkt, block)
+
+
+def asc_info(file):
+    # ESRI ASCII grid: the header lines before the first row of cells
+    header = {}
+    with open(file, encoding="ascii", errors="replace") as data:
+        for line in data:
+            fields = line.split()
+            if len(fields) != 2 or not fields[0][0].isalpha():
+                break
+            header[fields[0].lower()] = float(fields[1])
+    try:
+        width = int(header["ncols"])
+        height = int(header["nrows"])
+        size = header["cellsize"]
+        x = header["xllcorner"] if "xllcorner" in header else header["xllcenter"] - size / 2
+        y = header["yllcorner"] if "yllcorner" in header else header["yllcenter"] - size / 2
+    except KeyError as e:
+        raise ValueError(f"{file}: no {e.args[0]} in the header")
+    geotransform = (x, size, 0.0, y + height * size, 0.0, -size)
+    return RasterInfo(file, width, height, geotransform, "Float32", header.get("nodata_value"), read_prj(file), None)
+
+
+def raster_info(file):
+    """Size, georeference, data type, nodata value and CRS of a GeoTIFF, BIL or ASCII grid from its headers."""
+    extension = os.path.splitext(file)[1].lower()
+    if extension in (".tif", ".tiff"):
+        return tiff_info(file)
+    if extension == ".bil":
+        return bil_info(file)
+    if extension == ".asc":
+        return asc_info(file)
+    raise ValueError(f"{file}: no GeoTIFF, BIL or ASCII grid")
+
+
+def number(value):
+    return format(value, ".15g")
+
+
+def build_vrt(files, output):
+    """
+    Writes a virtual raster (VRT) over the rasters: a single band of the size of all of them,
+    with the cell size of the finest. Only the headers of the rasters are read (see raster_info),
+    the size and type of every raster is stored in the VRT as well, so GDAL (and QGIS) only open
+    the rasters of the area which is drawn. Other formats than those of VRT_EXTENSIONS need GDAL.
+    Returns the number of columns and rows of the VRT.
+    """
+    if not files:
+        raise ValueError("no rasters for a virtual raster")
+    if any(os.path.splitext(file)[1].lower() not in VRT_EXTENSIONS for file in files):
+        if gdal is None:
+            raise ValueError(f"virtual rasters of other files than {', '.join(VRT_EXTENSIONS)} need GDAL")
+        try:
+            dataset = gdal.BuildVRT(output, list(files))
+        except RuntimeError:
+            # GDAL with gdal.UseExceptions()
+            dataset = None
+        if dataset is None:
+            raise OSError(f"{output}: {gdal.GetLastErrorMsg() or 'GDAL failed'}")
+        size = (dataset.RasterXSize, dataset.RasterYSize)
+        dataset = None
+        return size
+    rasters = [raster_info(file) for file in files]
+    size_x = min(raster.geotransform[1] for raster in rasters)
+    size_y = min(-raster.geotransform[5] for raster in rasters)
+    min_x = min(raster.geotransform[0] for raster in rasters)
+    max_y = max(raster.geotransform[3] for raster in rasters)
+    max_x = max(raster.geotransform[0] + raster.width * raster.geotransform[1] for raster in rasters)
+    min_y = min(raster.geotransform[3] + raster.height * raster.geotransform[5] for raster in rasters)
+    columns = max(1, round((max_x - min_x) / size_x))
+    rows = max(1, round((max_y - min_y) / size_y))
+    data_types = {raster.data_type for raster in rasters}
+    if len(data_types) == 1:
+        data_type = data_types.pop()
+    else:
+        data_type = "Float64" if "Float64" in data_types else "Float32"
+    dataset = ET.Element("VRTDataset", rasterXSize=str(columns), rasterYSize=str(rows))
+    srs = next((raster.srs for raster in rasters if raster.srs), "")
+    if srs:
+        ET.SubElement(dataset, "SRS").text = srs
+    geotransform = (min_x, size_x, 0.0, max_y, 0.0, -size_y)
+    ET.SubElement(dataset, "GeoTransform").text = ", ".join(number(value) for value in geotransform)
+    band = ET.SubElement(dataset, "VRTRasterBand", dataType=data_type, band="1")
+    nodata = next((raster.nodata for raster in rasters if raster.nodata is not None), None)
+    if nodata is not None:
+        ET.SubElement(band, "NoDataValue").text = number(nodata)
+    folder = os.path.dirname(os.path.abspath(output))
+    for raster in rasters:
+        # a nodata cell of a raster does not hide the cells of the rasters before
+        source = ET.SubElement(band, "SimpleSource" if raster.nodata is None else "ComplexSource")
+        try:
+            path = os.path.relpath(os.path.abspath(raster.file), folder)
+            relative = "1"
+        except ValueError:
+            # on another drive
+            path = os.path.abspath(raster.file)
+            relative = "0"
+        ET.SubElement(source, "SourceFilename", relativeToVRT=relative).text = path.replace(os.sep, "/")
+        ET.SubElement(source, "SourceBand").text = "1"
+        properties = {"RasterXSize": str(raster.width), "RasterYSize": str(raster.height), "DataType": raster.data_type}
+        if raster.block is not None:
+            properties.update(BlockXSize=str(raster.block[0]), BlockYSize=str(raster.block[1]))
+        ET.SubElement(source, "SourceProperties", properties)
+        ET.SubElement(source, "SrcRect", xOff="0", yOff="0", xSize=str(raster.width), ySize=str(raster.height))
+        ET.SubElement(
+            source,
+            "DstRect",
+            xOff=number((raster.geotransform[0] - min_x) / size_x),
+            yOff=number((max_y - raster.geotransform[3]) / size_y),
+            xSize=number(raster.width * raster.geotransform[1] / size_x),
+            ySize=number(-raster.height * raster.geotransform[5] / size_y),
+        )
+        if raster.nodata is not None:
+            ET.SubElement(source, "NODATA").text = number(raster.nodata)
+    ET.indent(dataset)
+    staging = f"{output}.{uuid.uuid4().hex}.tmp"
+    ET.ElementTree(dataset).write(staging, encoding="utf-8", xml_declaration=False)
+    os.replace(staging, output)
+    return columns, rows
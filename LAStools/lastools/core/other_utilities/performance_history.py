@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    performance_history.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import csv
+import json
+import sqlite3
+
+from qgis.core import QgsProcessingException, QgsProcessingParameterNumber, QgsProcessingParameterString
+from qgis.PyQt.QtGui import QIcon
+
+from ..algo import LastoolsAlgorithm
+from ..utils import LastoolsUtils, help_string_plugin, lasgroup_info, lastool_info, licence, paths
+
+
+class PerformanceRegressions(LastoolsAlgorithm):
+    TOOL_NAME = "PerformanceRegressions"
+    LASTOOL = "history"
+    LICENSE = "o"
+    LASGROUP = 6
+    ALGORITHM = "ALGORITHM"
+    BASELINE = "BASELINE"
+    TOLERANCE = "TOLERANCE"
+    MIN_SECONDS = "MIN_SECONDS"
+    MIN_MEMORY = "MIN_MEMORY"
+
+    def initAlgorithm(self, config=None):
+        # reads the history only: no LAStools executable to look up
+        self.addParameter(
+            QgsProcessingParameterString(
+                PerformanceRegressions.ALGORITHM,
+                "algorithm (name, e.g. FlightLinesToCHMFirstReturn; empty: all)",
+                None,
+                False,
+                True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                PerformanceRegressions.BASELINE,
+                "baseline (number of earlier runs with the same parameters and input size)",
+                QgsProcessingParameterNumber.Integer,
+                10,
+                False,
+                1,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                PerformanceRegressions.TOLERANCE,
+                "tolerance [%]",
+                QgsProcessingParameterNumber.Double,
+                20.0,
+                False,
+                0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                PerformanceRegressions.MIN_SECONDS,
+                "ignore time differences below [s]",
+                QgsProcessingParameterNumber.Double,
+                1.0,
+                False,
+                0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                PerformanceRegressions.MIN_MEMORY,
+                "ignore memory differences below [MB]",
+                QgsProcessingParameterNumber.Double,
+                16.0,
+                False,
+                0.0,
+            )
+        )
+        self.add_parameters_generic_output_gui("comparison (CSV)", "CSV files (*.csv)", True)
+
+    @staticmethod
+    def format(metric, value):
+        if metric == "peak_rss":
+            return f"{value / (1 << 20):.0f} MB"
+        return f"{value:.1f} s"
+
+    def processAlgorithm(self, parameters, context, feedback):
+        history = LastoolsUtils.history()
+        algorithm = self.parameterAsString(parameters, PerformanceRegressions.ALGORITHM, context).strip()
+        baseline = self.parameterAsInt(parameters, PerformanceRegressions.BASELINE, context)
+        tolerance = self.parameterAsDouble(parameters, PerformanceRegressions.TOLERANCE, context) / 100
+        min_seconds = self.parameterAsDouble(parameters, PerformanceRegressions.MIN_SECONDS, context)
+        min_bytes = self.parameterAsDouble(parameters, PerformanceRegressions.MIN_MEMORY, context) * (1 << 20)
+        try:
+            keys = history.keys(algorithm or None)
+            comparisons = []
+            for key in keys:
+                if feedback.isCanceled():
+                    raise QgsProcessingException("Canceled by user.")
+                latest = history.runs(key=key, limit=1)[0]
+                compared = history.compare(key, baseline, tolerance, min_seconds, min_bytes)
+                if compared is None:
+                    feedback.pushInfo(f"{latest['algorithm']} ({latest['finished']}): no earlier runs to compare with")
+                    continue
+                feedback.pushInfo(
+                    f"{latest['algorithm']} ({latest['finished']}, {latest['input_bytes'] / (1 << 20):.0f} MB input) "
+                    f"against {compared[0]['runs']} earlier runs, parameters {latest['parameters']}"
+                )
+                for comparison in compared:
+                    comparison["finished"] = latest["finished"]
+                    comparison["parameters"] = json.loads(latest["parameters"])
+                    stage = comparison["stage"] or "run"
+                    text = (
+                        f"  {stage} {comparison['metric']}: {self.format(comparison['metric'], comparison['latest'])}"
+                        f" (baseline {self.format(comparison['metric'], comparison['baseline'])},"
+                        f" {comparison['change']:+.0%})"
+                    )
+                    if comparison["executable_changed"]:
+                        text += f", {stage} executable changed"
+                    if comparison["regression"]:
+                        feedback.reportError(f"{text} REGRESSION")
+                    else:
+                        feedback.pushInfo(text)
+                comparisons.extend(compared)
+        except sqlite3.Error as e:
+            raise QgsProcessingException(f"performance history not readable: {e}")
+        if not keys:
+            feedback.pushWarning("no runs in the performance history" + (f" of {algorithm}" if algorithm else ""))
+        regressions = [comparison for comparison in comparisons if comparison["regression"]]
+        feedback.pushInfo(f"{len(regressions)} regressions in {len(comparisons)} comparisons")
+        output = self.parameterAsString(parameters, self.OUTPUT_GENERIC, context)
+        if output:
+            columns = ["algorithm", "finished", "stage", "metric", "latest", "baseline", "runs", "change"]
+            columns += ["regression", "executable_changed", "parameters"]
+            with open(output, "w", newline="", encoding="utf-8") as out:
+                writer = csv.DictWriter(out, columns)
+                writer.writeheader()
+                for comparison in comparisons:
+                    writer.writerow(dict(comparison, parameters=json.dumps(comparison["parameters"], sort_keys=True)))
+        return {self.OUTPUT_GENERIC: output, "comparisons": comparisons, "regressions": len(regressions)}
+
+    def createInstance(self):
+        return PerformanceRegressions()
+
+    def name(self):
+        return self.TOOL_NAME
+
+    def displayName(self):
+        return lastool_info[self.TOOL_NAME]["disp"]
+
+    def group(self):
+        return lasgroup_info[self.LASGROUP]["group"]
+
+    def groupId(self):
+        return lasgroup_info[self.LASGROUP]["group_id"]
+
+    def helpUrl(self):
+        # no LAStools tool, no README
+        return ""
+
+    def shortHelpString(self):
+        return lastool_info[self.TOOL_NAME]["help"] + help_string_plugin()
+
+    def shortDescription(self):
+        return lastool_info[self.TOOL_NAME]["desc"]
+
+    def icon(self):
+        icon_file = licence[self.LICENSE]["path"]
+        return QIcon(f"{paths['img']}{icon_file}")
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    synthetic_las.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsProcessingException,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterCrs,
+    QgsProcessingParameterEnum,
+    QgsProcessingParameterExtent,
+    QgsProcessingParameterNumber,
+)
+from qgis.PyQt.QtGui import QIcon
+
+from ..algo import LastoolsAlgorithm
+from ..io import SYNTHETIC_VERSIONS, SyntheticLas
+from ..utils import help_string_plugin, lasgroup_info, lastool_info, licence, paths
+
+
+class SyntheticPointCloud(LastoolsAlgorithm):
+    TOOL_NAME = "SyntheticPointCloud"
+    LASTOOL = "synthetic"
+    LICENSE = "o"
+    LASGROUP = 9
+    EXTENT = "EXTENT"
+    CRS = "CRS"
+    DENSITY = "DENSITY"
+    FLIGHTLINES = "FLIGHTLINES"
+    OVERLAP = "OVERLAP"
+    VEGETATION = "VEGETATION"
+    BUILDINGS = "BUILDINGS"
+    NOISE = "NOISE"
+    SEED = "SEED"
+    POINT_FORMAT = "POINT_FORMAT"
+    POINT_FORMATS = [
+        (version, point_format)
+        for version, point_formats in SYNTHETIC_VERSIONS.items()
+        for point_format in point_formats
+    ]
+    FILE_PER_FLIGHTLINE = "FILE_PER_FLIGHTLINE"
+
+    def initAlgorithm(self, config=None):
+        # written in process: no LAStools executable to look up
+        self.addParameter(
+            QgsProcessingParameterExtent(SyntheticPointCloud.EXTENT, "extent of the scene", "0,1000,0,1000", False)
+        )
+        self.addParameter(
+            QgsProcessingParameterCrs(
+                SyntheticPointCloud.CRS, "CRS of the points (empty: the one of the extent)", None, True
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.DENSITY,
+                "point density (points per square unit, per flight line)",
+                QgsProcessingParameterNumber.Double,
+                10.0,
+                False,
+                0.001,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.FLIGHTLINES,
+                "number of flight lines (north-south)",
+                QgsProcessingParameterNumber.Integer,
+                4,
+                False,
+                1,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.OVERLAP,
+                "overlap of the flight lines [%]",
+                QgsProcessingParameterNumber.Double,
+                20.0,
+                False,
+                0.0,
+                99.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.VEGETATION,
+                "vegetation cover [%]",
+                QgsProcessingParameterNumber.Double,
+                30.0,
+                False,
+                0.0,
+                100.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.BUILDINGS, "number of buildings", QgsProcessingParameterNumber.Integer, 20, False, 0
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.NOISE,
+                "noise points [%]",
+                QgsProcessingParameterNumber.Double,
+                0.1,
+                False,
+                0.0,
+                100.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                SyntheticPointCloud.SEED,
+                "seed (the same seed gives the same points)",
+                QgsProcessingParameterNumber.Integer,
+                0,
+                False,
+                0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                SyntheticPointCloud.POINT_FORMAT,
+                "LAS version and point format",
+                [
+                    f"LAS {version[0]}.{version[1]} point format {fmt}"
+                    for version, fmt in SyntheticPointCloud.POINT_FORMATS
+                ],
+                False,
+                1,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterBoolean(SyntheticPointCloud.FILE_PER_FLIGHTLINE, "one file per flight line", True)
+        )
+        self.add_parameters_output_directory_gui(False)
+
+    def processAlgorithm(self, parameters, context, feedback):
+        crs = self.parameterAsCrs(parameters, SyntheticPointCloud.CRS, context)
+        if not crs.isValid():
+            crs = self.parameterAsExtentCrs(parameters, SyntheticPointCloud.EXTENT, context)
+        extent = self.parameterAsExtent(parameters, SyntheticPointCloud.EXTENT, context, crs)
+        if extent.isEmpty():
+            raise QgsProcessingException("The extent of the scene is empty.")
+        version, point_format = SyntheticPointCloud.POINT_FORMATS[
+            self.parameterAsEnum(parameters, SyntheticPointCloud.POINT_FORMAT, context)
+        ]
+        scene = SyntheticLas(
+            (extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum()),
+            self.parameterAsDouble(parameters, SyntheticPointCloud.DENSITY, context),
+            self.parameterAsInt(parameters, SyntheticPointCloud.FLIGHTLINES, context),
+            self.parameterAsDouble(parameters, SyntheticPointCloud.OVERLAP, context) / 100,
+            self.parameterAsDouble(parameters, SyntheticPointCloud.VEGETATION, context) / 100,
+            self.parameterAsInt(parameters, SyntheticPointCloud.BUILDINGS, context),
+            self.parameterAsDouble(parameters, SyntheticPointCloud.NOISE, context) / 100,
+            self.parameterAsInt(parameters, SyntheticPointCloud.SEED, context),
+        )
+        # GeoTIFF keys for an EPSG code, the WKT for LAS 1.4
+        authority, _, code = crs.authid().partition(":") if crs.isValid() else ("", "", "")
+        epsg = int(code) if authority == "EPSG" and code.isdigit() else 0
+        wkt = crs.toWkt(QgsCoordinateReferenceSystem.WKT1_GDAL) if crs.isValid() and version == (1, 4) else ""
+        output_dir = self.parameterAsString(parameters, self.OUTPUT_DIRECTORY, context)
+        output_dir = output_dir.removesuffix(self.OUTPUT_DIRECTORY)  # may added on temp dir, remove now!
+        os.makedirs(output_dir, exist_ok=True)
+        if self.parameterAsBool(parameters, SyntheticPointCloud.FILE_PER_FLIGHTLINE, context):
+            outputs = [
+                (os.path.join(output_dir, f"flightline_{line + 1:02d}.las"), [line])
+                for line in range(scene.flightlines)
+            ]
+        else:
+            outputs = [(os.path.join(output_dir, "synthetic.las"), None)]
+        points = scene.count()
+        total = max(1, points)
+        feedback.pushInfo(f"writing {points} points to {len(outputs)} files")
+        done = 0
+        for file, lines in outputs:
+
+            def progress(written, count, before=done):
+                feedback.setProgress(100.0 * (before + written) / total)
+
+            done += scene.write(
+                file, point_format, version, lines, None, 0.01, epsg, wkt, progress, feedback.isCanceled
+            )
+            if feedback.isCanceled():
+                raise QgsProcessingException("Canceled by user.")
+            feedback.pushInfo(f"{os.path.basename(file)} written")
+        return {self.OUTPUT_DIRECTORY: output_dir, "files": [file for file, _ in outputs], "points": done}
+
+    def createInstance(self):
+        return SyntheticPointCloud()
+
+    def name(self):
+        return self.TOOL_NAME
+
+    def displayName(self):
+        return lastool_info[self.TOOL_NAME]["disp"]
+
+    def group(self):
+        return lasgroup_info[self.LASGROUP]["group"]
+
+    def groupId(self):
+        return lasgroup_info[self.LASGROUP]["group_id"]
+
+    def helpUrl(self):
+        # no LAStools tool, no README
+        return ""
+
+    def shortHelpString(self):
+        return lastool_info[self.TOOL_NAME]["help"] + help_string_plugin()
+
+    def shortDescription(self):
+        return lastool_info[self.TOOL_NAME]["desc"]
+
+    def icon(self):
+        icon_file = licence[self.LICENSE]["path"]
+        return QIcon(f"{paths['img']}{icon_file}")
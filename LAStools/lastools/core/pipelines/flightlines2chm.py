@@ -20,13 +20,11 @@ __author__ = "rapidlasso"
 __date__ = "March 2024"
 __copyright__ = "(C) 2024, rapidlasso GmbH"
 
-import os
-
 from qgis.core import QgsProcessingParameterEnum, QgsProcessingParameterNumber, QgsProcessingParameterString
 from qgis.PyQt.QtGui import QIcon
 
 from ..algo import LastoolsAlgorithm
-from ..utils import LastoolsUtils, help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
+from ..utils import help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
 
 
 class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
@@ -46,7 +44,7 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToCHMFirstReturn.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -78,20 +76,22 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
             )
         )
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_output_directory_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
+        raster_format = self.get_parameters_raster_output_format(parameters, context)
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToCHMFirstReturn.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToCHMFirstReturn.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -102,10 +102,10 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-o")
         commands.append(base_name)
         commands.append("-olaz")
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary(base_name + "*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*.laz"
@@ -125,10 +125,10 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary(base_name + "*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -140,10 +140,10 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary(base_name + "*_gh.laz")])
 
         # then we rasterize the normalized tiles into CHMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_gh.laz"
@@ -157,8 +157,9 @@ class FlightLinesToCHMFirstReturn(LastoolsAlgorithm):
         commands.append("_chm_fr")
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_chm_fr." + raster_format)])
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToCHMFirstReturn()
@@ -207,7 +208,7 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToCHMHighestReturn.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -250,19 +251,21 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         )
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_directory_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
+        raster_format = self.get_parameters_raster_output_format(parameters, context)
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToCHMHighestReturn.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToCHMHighestReturn.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -274,10 +277,10 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         commands.append(base_name)
         commands.append("-olaz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary(base_name + "*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*.laz"
@@ -297,10 +300,10 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary(base_name + "*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -312,10 +315,10 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary(base_name + "*_gh.laz")])
 
         # then we thin and splat the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasthin" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasthin")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_gh.laz"
@@ -334,10 +337,10 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasthin", commands, [pipeline.temporary(base_name + "*_ght.laz")])
 
         # then we rasterize the normalized tiles into CHMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_ght.laz"
@@ -352,9 +355,10 @@ class FlightLinesToCHMHighestReturn(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_chm_hr." + raster_format)])
 
-        return {"commands": commands}
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToCHMHighestReturn()
@@ -404,7 +408,7 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToCHMSpikeFree.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -458,23 +462,25 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         )
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
+        raster_format = self.get_parameters_raster_output_format(parameters, context)
         # needed for thinning and spike-free
 
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToCHMSpikeFree.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToCHMSpikeFree.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -486,10 +492,10 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         commands.append(base_name)
         commands.append("-olaz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary(base_name + "*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*.laz"
@@ -509,11 +515,11 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary(base_name + "*_g.laz")])
 
         # then we height-normalize the tiles
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -525,10 +531,10 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary(base_name + "*_gh.laz")])
 
         # then we thin and splat the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasthin" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasthin")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_gh.laz"
@@ -546,11 +552,11 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasthin", commands, [pipeline.temporary(base_name + "*_ght.laz")])
 
         # then we rasterize the normalized tiles into CHMs
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_ght.laz"
@@ -571,9 +577,10 @@ class FlightLinesToCHMSpikeFree(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_chm_sf." + raster_format)])
 
-        return {"commands": commands}
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToCHMSpikeFree()
@@ -20,13 +20,11 @@ __author__ = "rapidlasso"
 __date__ = "March 2024"
 __copyright__ = "(C) 2024, rapidlasso GmbH"
 
-import os
-
 from qgis.core import QgsProcessingParameterEnum, QgsProcessingParameterNumber, QgsProcessingParameterString
 from qgis.PyQt.QtGui import QIcon
 
 from ..algo import LastoolsAlgorithm
-from ..utils import LastoolsUtils, help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
+from ..utils import help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
 
 
 class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
@@ -46,7 +44,7 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToDTMandDSMFirstReturn.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -84,23 +82,25 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         )
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
+        raster_format = self.get_parameters_raster_output_format(parameters, context)
         # needed for thinning
 
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToDTMandDSMFirstReturn.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToDTMandDSMFirstReturn.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -112,10 +112,10 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         commands.append(base_name)
         commands.append("-olaz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary(base_name + "*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*.laz"
@@ -135,10 +135,10 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary(base_name + "*_g.laz")])
 
         # then we rasterize the classified tiles into DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -157,10 +157,10 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_dtm." + raster_format)])
 
         # then we rasterize the classified tiles into first return DSMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -177,8 +177,9 @@ class FlightLinesToDTMandDSMFirstReturn(LastoolsAlgorithm):
         commands.append("_dsm")
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_dsm." + raster_format)])
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToDTMandDSMFirstReturn()
@@ -227,7 +228,7 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToDTMandDSMSpikeFree.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -275,21 +276,23 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         )
         self.add_parameters_raster_output_format_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
+        raster_format = self.get_parameters_raster_output_format(parameters, context)
         # needed for thinning and spike-free
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToDTMandDSMSpikeFree.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToDTMandDSMSpikeFree.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -301,10 +304,10 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         commands.append(base_name)
         commands.append("-olaz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary(base_name + "*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*.laz"
@@ -324,10 +327,10 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary(base_name + "*_g.laz")])
 
         # then we rasterize the classified tiles into DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -346,10 +349,10 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_dtm." + raster_format)])
 
         # then we rasterize the classified tiles into spike-free DSMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem" + LastoolsUtils.command_ext())]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, base_name + "*_g.laz"
@@ -369,8 +372,9 @@ class FlightLinesToDTMandDSMSpikeFree(LastoolsAlgorithm):
         commands.append("_dsm")
         self.add_parameters_raster_output_format_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        pipeline.add("las2dem", commands, [pipeline.output(base_name + "*_dsm." + raster_format)])
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToDTMandDSMSpikeFree()
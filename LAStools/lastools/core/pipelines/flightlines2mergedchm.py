@@ -20,13 +20,11 @@ __author__ = "rapidlasso"
 __date__ = "March 2024"
 __copyright__ = "(C) 2024, rapidlasso GmbH"
 
-import os
-
 from qgis.core import QgsProcessingParameterEnum, QgsProcessingParameterNumber
 from qgis.PyQt.QtGui import QIcon
 
 from ..algo import LastoolsAlgorithm
-from ..utils import LastoolsUtils, help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
+from ..utils import help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
 
 
 class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
@@ -45,7 +43,7 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToMergedCHMFirstReturn.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -75,21 +73,22 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # needed for thinning and killing
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToMergedCHMFirstReturn.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToMergedCHMFirstReturn.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -97,10 +96,10 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("tile.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("tile*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*.laz")
         method = self.parameterAsInt(parameters, FlightLinesToMergedCHMFirstReturn.TERRAIN, context)
@@ -118,10 +117,10 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("tile*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_g.laz")
         commands.append("-replace_z")
@@ -131,10 +130,10 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("tile*_gh.laz")])
 
         # then we rasterize the height-normalized tiles into trivial zero-level DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         commands.append("-keep_class")
@@ -150,10 +149,10 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_dtm.bil")])
 
         # then we rasterize the normalized tiles into first-return CHMs (with kill)
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         commands.append("-keep_first")
@@ -169,18 +168,21 @@ class FlightLinesToMergedCHMFirstReturn(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm_fr.bil")])
 
         # then we combine the zero-level DTMs and the first-return CHMs into a single output CHM
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasgrid")]
+        commands = [self.lastool_command("lasgrid")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile_*.bil")
         commands.append("-merged")
         self.add_parameters_step_commands(parameters, context, commands)
         commands.append("-highest")
         self.add_parameters_raster_output_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        # a BIL or GeoTIFF output is mosaicked in process from the tile rasters, lasgrid is the fallback
+        output = self.parameterAsString(parameters, self.OUTPUT_RASTER, context)
+        pipeline.add_mosaic(commands, pipeline.temporary("tile_*.bil"), output, step, "highest")
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToMergedCHMFirstReturn()
@@ -228,7 +230,7 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToMergedCHMHighestReturn.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -268,21 +270,22 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # needed for thinning and killing
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToMergedCHMHighestReturn.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToMergedCHMHighestReturn.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -290,10 +293,10 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("tile.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("tile*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*.laz")
         method = self.parameterAsInt(parameters, FlightLinesToMergedCHMHighestReturn.TERRAIN, context)
@@ -311,10 +314,10 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("tile*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_g.laz")
         commands.append("-replace_z")
@@ -324,10 +327,10 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("tile*_gh.laz")])
 
         # then we thin and splat the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasthin")]
+        commands = [self.lastool_command("lasthin")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         beam_width = self.parameterAsDouble(parameters, FlightLinesToMergedCHMHighestReturn.BEAM_WIDTH, context)
@@ -343,10 +346,10 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasthin", commands, [pipeline.temporary("tile*_ght.laz")])
 
         # then we rasterize the height-normalized tiles into trivial zero-level DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         commands.append("-keep_class")
@@ -362,10 +365,10 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_dtm.bil")])
 
         # then we rasterize the normalized tiles into highest-return CHMs (with kill)
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         self.add_parameters_step_commands(parameters, context, commands)
@@ -380,18 +383,21 @@ class FlightLinesToMergedCHMHighestReturn(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm_hr.bil")])
 
         # then we combine the zero-level DTMs and the highest-return CHMs into a single output CHM
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasgrid")]
+        commands = [self.lastool_command("lasgrid")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile_*.bil")
         commands.append("-merged")
         self.add_parameters_step_commands(parameters, context, commands)
         commands.append("-highest")
         self.add_parameters_raster_output_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        # a BIL or GeoTIFF output is mosaicked in process from the tile rasters, lasgrid is the fallback
+        output = self.parameterAsString(parameters, self.OUTPUT_RASTER, context)
+        pipeline.add_mosaic(commands, pipeline.temporary("tile_*.bil"), output, step, "highest")
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToMergedCHMHighestReturn()
@@ -439,7 +445,7 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToMergedCHMPitFree.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -475,21 +481,22 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # needed for thinning and killing
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToMergedCHMPitFree.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToMergedCHMPitFree.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -497,10 +504,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("tile.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("tile*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*.laz")
         method = self.parameterAsInt(parameters, FlightLinesToMergedCHMPitFree.TERRAIN, context)
@@ -518,10 +525,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("tile*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_g.laz")
         commands.append("-replace_z")
@@ -531,10 +538,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("tile*_gh.laz")])
 
         # then we thin and splat the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasthin")]
+        commands = [self.lastool_command("lasthin")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         beam_width = self.parameterAsDouble(parameters, FlightLinesToMergedCHMPitFree.BEAM_WIDTH, context)
@@ -550,10 +557,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasthin", commands, [pipeline.temporary("tile*_ght.laz")])
 
         # then we rasterize the height-normalized tiles into trivial zero-level DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         commands.append("-keep_class")
@@ -569,10 +576,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_dtm.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 00
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         self.add_parameters_step_commands(parameters, context, commands)
@@ -587,10 +594,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm00.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 02
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -607,10 +614,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm02.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 05
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -627,11 +634,11 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm05.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 10
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -648,11 +655,11 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm10.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 15
 
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -669,10 +676,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm15.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 20
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -689,10 +696,10 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm20.bil")])
 
         # then we rasterize the normalized tiles into the partial CHMs at level 25
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         commands.append("-drop_z_below")
@@ -709,18 +716,21 @@ class FlightLinesToMergedCHMPitFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm25.bil")])
 
         # then we combine the partial CHMs into a single output CHM
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasgrid")]
+        commands = [self.lastool_command("lasgrid")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile_*.bil")
         commands.append("-merged")
         self.add_parameters_step_commands(parameters, context, commands)
         commands.append("-highest")
         self.add_parameters_raster_output_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        # a BIL or GeoTIFF output is mosaicked in process from the tile rasters, lasgrid is the fallback
+        output = self.parameterAsString(parameters, self.OUTPUT_RASTER, context)
+        pipeline.add_mosaic(commands, pipeline.temporary("tile_*.bil"), output, step, "highest")
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToMergedCHMPitFree()
@@ -769,7 +779,7 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 FlightLinesToMergedCHMSpikeFree.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -820,21 +830,22 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_raster_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # needed for thinning and killing
         step = self.get_parameters_step_value(parameters, context)
 
         # first we tile the data
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         commands.append("-files_are_flightlines")
-        tile_size = self.parameterAsDouble(parameters, FlightLinesToMergedCHMSpikeFree.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, FlightLinesToMergedCHMSpikeFree.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -842,10 +853,10 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("tile.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("tile*.laz")])
 
         # then we ground classify the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*.laz")
         method = self.parameterAsInt(parameters, FlightLinesToMergedCHMSpikeFree.TERRAIN, context)
@@ -863,10 +874,10 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("tile*_g.laz")])
 
         # then we height-normalize the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_g.laz")
         commands.append("-replace_z")
@@ -876,10 +887,10 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("tile*_gh.laz")])
 
         # then we thin and splat the tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasthin")]
+        commands = [self.lastool_command("lasthin")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         beam_width = self.parameterAsDouble(parameters, FlightLinesToMergedCHMSpikeFree.BEAM_WIDTH, context)
@@ -895,10 +906,10 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasthin", commands, [pipeline.temporary("tile*_ght.laz")])
 
         # then we rasterize the height-normalized tiles into trivial zero-level DTMs
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_gh.laz")
         commands.append("-keep_class")
@@ -914,10 +925,10 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_dtm.bil")])
 
         # then we rasterize the normalized tiles into spike-free CHMs (with kill)
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "las2dem")]
+        commands = [self.lastool_command("las2dem")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile*_ght.laz")
         self.add_parameters_step_commands(parameters, context, commands)
@@ -938,18 +949,21 @@ class FlightLinesToMergedCHMSpikeFree(LastoolsAlgorithm):
         commands.append("-obil")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("las2dem", commands, [pipeline.temporary("tile*_chm_sf.bil")])
 
         # then we combine the zero-level DTMs and the spike-free CHMs into a single output CHM
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasgrid")]
+        commands = [self.lastool_command("lasgrid")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(parameters, context, commands, "tile_*.bil")
         commands.append("-merged")
         self.add_parameters_step_commands(parameters, context, commands)
         commands.append("-highest")
         self.add_parameters_raster_output_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        # a BIL or GeoTIFF output is mosaicked in process from the tile rasters, lasgrid is the fallback
+        output = self.parameterAsString(parameters, self.OUTPUT_RASTER, context)
+        pipeline.add_mosaic(commands, pipeline.temporary("tile_*.bil"), output, step, "highest")
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return FlightLinesToMergedCHMSpikeFree()
@@ -20,13 +20,11 @@ __author__ = "rapidlasso"
 __date__ = "March 2024"
 __copyright__ = "(C) 2024, rapidlasso GmbH"
 
-import os
-
 from qgis.core import QgsProcessingParameterBoolean, QgsProcessingParameterEnum, QgsProcessingParameterNumber
 from qgis.PyQt.QtGui import QIcon
 
 from ..algo import LastoolsAlgorithm
-from ..utils import LastoolsUtils, help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
+from ..utils import help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
 
 
 class HugeFileClassify(LastoolsAlgorithm):
@@ -48,7 +46,7 @@ class HugeFileClassify(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 HugeFileClassify.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -77,17 +75,18 @@ class HugeFileClassify(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_point_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # first we tile the data with option '-reversible'
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_commands(parameters, context, commands)
-        tile_size = self.parameterAsDouble(parameters, HugeFileClassify.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, HugeFileClassify.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -96,10 +95,10 @@ class HugeFileClassify(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("hugeFileClassify.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("hugeFileClassify*.laz")])
 
         # then we ground classify the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileClassify*.laz"
@@ -119,10 +118,10 @@ class HugeFileClassify(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("hugeFileClassify*_g.laz")])
 
         # then we compute the height for each points in the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileClassify*_g.laz"
@@ -133,10 +132,10 @@ class HugeFileClassify(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("hugeFileClassify*_gh.laz")])
 
         # then we classify buildings and trees in the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasclassify")]
+        commands = [self.lastool_command("lasclassify")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileClassify*_gh.laz"
@@ -147,10 +146,10 @@ class HugeFileClassify(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasclassify", commands, [pipeline.temporary("hugeFileClassify*_ghc.laz")])
 
         # then we reverse the tiling
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileClassify*_ghc.laz"
@@ -158,9 +157,10 @@ class HugeFileClassify(LastoolsAlgorithm):
         commands.append("-reverse_tiling")
         self.add_parameters_point_output_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [self.parameterAsString(parameters, self.OUTPUT_LASLAZ, context)])
 
-        return {"commands": commands}
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return HugeFileClassify()
@@ -210,7 +210,7 @@ class HugeFileGroundClassify(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 HugeFileGroundClassify.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -241,17 +241,18 @@ class HugeFileGroundClassify(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_point_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # first we tile the data with option '-reversible'
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_commands(parameters, context, commands)
-        tile_size = self.parameterAsDouble(parameters, HugeFileGroundClassify.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, HugeFileGroundClassify.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -260,10 +261,10 @@ class HugeFileGroundClassify(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("hugeFileGroundClassify.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("hugeFileGroundClassify*.laz")])
 
         # then we ground classify the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileGroundClassify*.laz"
@@ -283,10 +284,10 @@ class HugeFileGroundClassify(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("hugeFileGroundClassify*_g.laz")])
 
         # then we reverse the tiling
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileGroundClassify*_g.laz"
@@ -294,9 +295,10 @@ class HugeFileGroundClassify(LastoolsAlgorithm):
         commands.append("-reverse_tiling")
         self.add_parameters_point_output_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [self.parameterAsString(parameters, self.OUTPUT_LASLAZ, context)])
 
-        return {"commands": commands}
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return HugeFileGroundClassify()
@@ -346,7 +348,7 @@ class HugeFileNormalize(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 HugeFileNormalize.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
@@ -375,17 +377,18 @@ class HugeFileNormalize(LastoolsAlgorithm):
         self.add_parameters_temporary_directory_gui()
         self.add_parameters_point_output_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_tile_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
+        pipeline = self.pipeline(parameters, context, feedback)
         # first we tile the data with option '-reversible'
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_input_commands(parameters, context, commands)
-        tile_size = self.parameterAsDouble(parameters, HugeFileNormalize.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, HugeFileNormalize.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -394,10 +397,10 @@ class HugeFileNormalize(LastoolsAlgorithm):
         commands.append("-o")
         commands.append("hugeFileNormalize.laz")
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [pipeline.temporary("hugeFileNormalize*.laz")])
 
         # then we ground classify the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasground")]
+        commands = [self.lastool_command("lasground")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileNormalize*.laz"
@@ -417,10 +420,10 @@ class HugeFileNormalize(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasground", commands, [pipeline.temporary("hugeFileNormalize*_g.laz")])
 
         # then we height-normalize each points in the reversible tiles
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lasheight")]
+        commands = [self.lastool_command("lasheight")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileNormalize*_g.laz"
@@ -432,10 +435,10 @@ class HugeFileNormalize(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lasheight", commands, [pipeline.temporary("hugeFileNormalize*_gh.laz")])
 
         # then we reverse the tiling
-        commands = [os.path.join(LastoolsUtils.lastools_path(), "bin", "lastile")]
+        commands = [self.lastool_command("lastile")]
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_temporary_directory_as_input_files_commands(
             parameters, context, commands, "hugeFileNormalize*_gh.laz"
@@ -443,9 +446,10 @@ class HugeFileNormalize(LastoolsAlgorithm):
         commands.append("-reverse_tiling")
         self.add_parameters_point_output_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        pipeline.add("lastile", commands, [self.parameterAsString(parameters, self.OUTPUT_LASLAZ, context)])
 
-        return {"commands": commands}
+        pipeline.run()
+        return self.results(commands)
 
     def createInstance(self):
         return HugeFileNormalize()
@@ -149,7 +149,7 @@ class Las3dPolyRadialDistance(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return Las3dPolyRadialDistance()
@@ -310,7 +310,7 @@ class Las3dPolyHorizontalVerticalDistance(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return Las3dPolyHorizontalVerticalDistance()
@@ -87,7 +87,7 @@ class LasBoundary(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_vector_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasBoundary()
@@ -133,6 +133,7 @@ class LasBoundaryPro(LastoolsAlgorithm):
     def initAlgorithm(self, config=None):
         super().initAlgorithm(config)
         self.add_parameters_point_input_folder_gui()
+        self.add_parameters_aoi_gui()
         self.add_parameters_filter1_return_class_flags_gui()
         self.addParameter(QgsProcessingParameterEnum(self.MODE, "compute boundary based on", self.MODES, False, 0))
         self.addParameter(
@@ -145,6 +146,7 @@ class LasBoundaryPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.LABELS, "produce labels", False))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_vector_output_format_gui()
@@ -178,8 +180,8 @@ class LasBoundaryPro(LastoolsAlgorithm):
         self.add_parameters_output_appendix_commands(parameters, context, commands)
         self.add_parameters_vector_output_format_commands(parameters, context, commands)
         self.add_parameters_output_directory_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"command": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasBoundaryPro()
@@ -71,7 +71,7 @@ class LasDiff(LastoolsAlgorithm):
         if self.parameterAsBool(parameters, self.CREATE_DIFFERENCE_FILE, context):
             self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasDiff()
@@ -155,7 +155,7 @@ class LasDistance(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasDistance()
@@ -94,7 +94,7 @@ class LasDuplicate(LastoolsAlgorithm):
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"": None}
+        return self.results(commands)
 
     def createInstance(self):
         return LasDuplicate()
@@ -172,6 +172,7 @@ class LasDuplicatePro(LastoolsAlgorithm):
         self.add_parameters_point_output_format_gui()
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
@@ -197,9 +198,9 @@ class LasDuplicatePro(LastoolsAlgorithm):
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
 
-        self.run_lastools(commands, feedback)
+        self.run_lastools_per_file(parameters, context, commands, feedback)
 
-        return {"": None}
+        return self.results(commands)
 
     def createInstance(self):
         return LasDuplicatePro()
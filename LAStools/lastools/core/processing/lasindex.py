@@ -61,7 +61,7 @@ class LasIndex(LastoolsAlgorithm):
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"": None}
+        return self.results(commands)
 
     def createInstance(self):
         return LasIndex()
@@ -111,6 +111,7 @@ class LasIndexPro(LastoolsAlgorithm):
         )
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
 
     def processAlgorithm(self, parameters, context, feedback):
@@ -126,8 +127,8 @@ class LasIndexPro(LastoolsAlgorithm):
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"": None}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasIndexPro()
@@ -92,7 +92,7 @@ class LasIntensity(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasIntensity()
@@ -191,7 +191,7 @@ class LasIntensityAttenuationFactor(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"command": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasIntensityAttenuationFactor()
@@ -46,7 +46,7 @@ class LasPrecision(LastoolsAlgorithm):
         self.add_parameters_point_input_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasPrecision()
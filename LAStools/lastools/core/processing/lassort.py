@@ -60,7 +60,7 @@ class LasSort(LastoolsAlgorithm):
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"": None}
+        return self.results(commands)
 
     def name(self):
         return self.TOOL_NAME
@@ -108,6 +108,7 @@ class LasSortPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.BY_POINT_SOURCE_ID, "sort by point source ID", False))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_point_output_format_gui()
@@ -129,8 +130,8 @@ class LasSortPro(LastoolsAlgorithm):
         self.add_parameters_point_output_format_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"": None}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def name(self):
         return self.TOOL_NAME
@@ -44,11 +44,11 @@ class LasTile(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 self.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
-                4.0,
+                0.0,
                 10000.0,
             )
         )
@@ -74,10 +74,9 @@ class LasTile(LastoolsAlgorithm):
     def processAlgorithm(self, parameters, context, feedback):
         commands = [self.get_command(parameters, context, feedback)]
         self.add_parameters_point_input_commands(parameters, context, commands)
-        tile_size = self.parameterAsInt(parameters, self.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, self.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -89,7 +88,7 @@ class LasTile(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasTile()
@@ -139,11 +138,11 @@ class LasTilePro(LastoolsAlgorithm):
         self.addParameter(
             QgsProcessingParameterNumber(
                 self.TILE_SIZE,
-                "tile size (side length of square tile)",
+                "tile size (side length of square tile, 0: automatic from the point density)",
                 QgsProcessingParameterNumber.Double,
                 1000.0,
                 False,
-                4.0,
+                0.0,
                 10000.0,
             )
         )
@@ -180,10 +179,9 @@ class LasTilePro(LastoolsAlgorithm):
         self.add_parameters_point_input_folder_commands(parameters, context, commands)
         self.add_parameters_files_are_flightlines_commands(parameters, context, commands)
         self.add_parameters_apply_file_source_id_commands(parameters, context, commands)
-        tile_size = self.parameterAsInt(parameters, self.TILE_SIZE, context)
+        tile_size, buffer = self.get_parameters_tile_size_buffer(parameters, context, feedback)
         commands.append("-tile_size")
         commands.append(str(tile_size))
-        buffer = self.parameterAsDouble(parameters, self.BUFFER, context)
         if buffer != 0.0:
             commands.append("-buffer")
             commands.append(str(buffer))
@@ -201,7 +199,7 @@ class LasTilePro(LastoolsAlgorithm):
         self.add_parameters_output_appendix_commands(parameters, context, commands)
         self.add_parameters_point_output_format_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasTilePro()
@@ -113,7 +113,7 @@ class LasPublish(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasPublish()
@@ -237,7 +237,7 @@ class LasPublishPro(LastoolsAlgorithm):
         commands.append("-olaz")
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasPublishPro()
@@ -88,7 +88,7 @@ class LasControl(LastoolsAlgorithm):
             commands.append("-olaz")
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasControl()
@@ -121,7 +121,7 @@ class LasInfo(LastoolsAlgorithm):
         self.add_parameters_generic_output_commands(parameters, context, commands, "-o")
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasInfo()
@@ -213,6 +213,7 @@ class LasInfoPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.JSON, "JSON output", False))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_output_directory_gui()
@@ -249,8 +250,8 @@ class LasInfoPro(LastoolsAlgorithm):
         commands.append("-otxt")
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasInfoPro()
@@ -75,7 +75,7 @@ class LasProbe(LastoolsAlgorithm):
         if self.parameterAsString(parameters, self.OUTPUT_GENERIC, context):
             self.add_parameters_generic_output_commands(parameters, context, commands, "-o")
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasProbe()
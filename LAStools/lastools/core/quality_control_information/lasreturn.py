@@ -72,7 +72,7 @@ class LasReturn(LastoolsAlgorithm):
         self.add_parameters_verbose_64_gui_commands(parameters, context, commands)
         self.add_parameters_point_output_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasReturn()
@@ -129,6 +129,7 @@ class LasReturnPro(LastoolsAlgorithm):
         self.addParameter(QgsProcessingParameterBoolean(self.SKIP_INCOMPLETE, "skip incomplete returns", False))
         self.add_parameters_additional_gui()
         self.add_parameters_cores_gui()
+        self.add_parameters_per_file_gui()
         self.add_parameters_verbose_64_gui()
         self.add_parameters_output_appendix_gui()
         self.add_parameters_output_directory_gui()
@@ -148,8 +149,8 @@ class LasReturnPro(LastoolsAlgorithm):
         self.add_parameters_output_directory_commands(parameters, context, commands)
         self.add_parameters_additional_commands(parameters, context, commands)
         self.add_parameters_cores_commands(parameters, context, commands)
-        self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        self.run_lastools_per_file(parameters, context, commands, feedback)
+        return self.results(commands)
 
     def createInstance(self):
         return LasReturnPro()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    registry.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+# all algorithms of the provider in toolbox order: (TOOL_NAME, LASTOOL, module, class, LASGROUP, LICENSE)
+# the algorithm modules are imported on first use only, see LastoolsAlgorithmStub
+
+processing_algorithms = [
+    ("LasIndex", "lasindex", "processing.lasindex", "LasIndex", 3, "o"),
+    ("LasIndexPro", "lasindex", "processing.lasindex", "LasIndexPro", 3, "o"),
+    ("LasMerge", "lasmerge", "processing.lasmerge", "LasMerge", 3, "o"),
+    ("LasMergePro", "lasmerge", "processing.lasmerge", "LasMergePro", 3, "c"),
+    ("LasOverage", "lasoverage", "processing.lasoverage", "LasOverage", 3, "c"),
+    ("LasOveragePro", "lasoverage", "processing.lasoverage", "LasOveragePro", 3, "c"),
+    ("LasBoundary", "lasboundary", "processing.lasboundary", "LasBoundary", 3, "c"),
+    ("LasBoundaryPro", "lasboundary", "processing.lasboundary", "LasBoundaryPro", 3, "c"),
+    ("LasClip", "lasclip", "processing.lasclip", "LasClip", 3, "c"),
+    ("LasTile", "lastile", "processing.lastile", "LasTile", 3, "c"),
+    ("LasTilePro", "lastile", "processing.lastile", "LasTilePro", 3, "c"),
+    ("LasSplit", "lassplit", "processing.lassplit", "LasSplit", 3, "c"),
+    ("LasSort", "lassort", "processing.lassort", "LasSort", 3, "c"),
+    ("LasSortPro", "lassort", "processing.lassort", "LasSortPro", 3, "c"),
+    ("LasDuplicate", "lasduplicate", "processing.lasduplicate", "LasDuplicate", 3, "c"),
+    ("LasDuplicatePro", "lasduplicate", "processing.lasduplicate", "LasDuplicatePro", 3, "c"),
+    ("LasPrecision", "lasprecision", "processing.lasprecision", "LasPrecision", 6, "o"),
+    ("LasNoise", "lasnoise", "processing.lasnoise", "LasNoise", 3, "c"),
+    ("LasNoisePro", "lasnoise", "processing.lasnoise", "LasNoisePro", 3, "c"),
+    ("LasDiff", "lasdiff", "processing.lasdiff", "LasDiff", 3, "c"),
+    ("LasDistance", "lasdistance", "processing.lasdistance", "LasDistance", 3, "c"),
+    ("LasCopy", "lascopy", "processing.lascopy", "LasCopy", 2, "c"),
+    ("Las3dPolyRadialDistance", "las3dpoly", "processing.las3dpoly", "Las3dPolyRadialDistance", 3, "c"),
+    (
+        "Las3dPolyHorizontalVerticalDistance",
+        "las3dpoly",
+        "processing.las3dpoly",
+        "Las3dPolyHorizontalVerticalDistance",
+        3,
+        "c",
+    ),
+    ("LasIntensity", "lasintensity", "processing.lasintensity", "LasIntensity", 3, "c"),
+    (
+        "LasIntensityAttenuationFactor",
+        "lasintensity",
+        "processing.lasintensity",
+        "LasIntensityAttenuationFactor",
+        3,
+        "c",
+    ),
+]
+
+data_convert_algorithms = [
+    ("Las2txt", "las2txt", "data_convert.las2txt", "Las2txt", 2, "o"),
+    ("Las2txtPro", "las2txt", "data_convert.las2txt", "Las2txtPro", 2, "o"),
+    ("Txt2Las", "txt2las", "data_convert.txt2las", "Txt2Las", 2, "o"),
+    ("Txt2LasPro", "txt2las", "data_convert.txt2las", "Txt2LasPro", 2, "o"),
+    ("Las2LasFilter", "las2las", "data_convert.las2las", "Las2LasFilter", 2, "o"),
+    ("Las2LasProFilter", "las2las", "data_convert.las2las", "Las2LasProFilter", 2, "o"),
+    ("Las2LasProject", "las2las", "data_convert.las2las", "Las2LasProject", 2, "o"),
+    ("Las2LasProProject", "las2las", "data_convert.las2las", "Las2LasProProject", 2, "o"),
+    ("Las2LasTransform", "las2las", "data_convert.las2las", "Las2LasTransform", 2, "o"),
+    ("Las2LasProTransform", "las2las", "data_convert.las2las", "Las2LasProTransform", 2, "o"),
+    ("Las2Shp", "las2shp", "data_convert.las2shp", "Las2Shp", 2, "c"),
+    ("Shp2Las", "shp2las", "data_convert.shp2las", "Shp2Las", 2, "c"),
+    ("e572las", "e572las", "data_convert.e572las", "e572las", 2, "f"),
+]
+
+classification_filtering_algorithms = [
+    ("LasGround", "lasground", "classification_filtering.lasground", "LasGround", 4, "c"),
+    ("LasGroundPro", "lasground", "classification_filtering.lasground", "LasGroundPro", 4, "c"),
+    ("LasGroundNew", "lasground_new", "classification_filtering.lasground_new", "LasGroundNew", 4, "c"),
+    ("LasGroundProNew", "lasground_new", "classification_filtering.lasground_new", "LasGroundProNew", 4, "c"),
+    ("LasClassify", "lasclassify", "classification_filtering.lasclassify", "LasClassify", 4, "c"),
+    ("LasClassifyPro", "lasclassify", "classification_filtering.lasclassify", "LasClassifyPro", 4, "c"),
+    ("LasThin", "lasthin", "classification_filtering.lasthin", "LasThin", 4, "c"),
+    ("LasThinPro", "lasthin", "classification_filtering.lasthin", "LasThinPro", 4, "c"),
+    ("LasThin3d", "lasthin3d", "classification_filtering.lasthin3d", "LasThin3d", 4, "c"),
+    ("LasThin3dPro", "lasthin3d", "classification_filtering.lasthin3d", "LasThin3dPro", 4, "c"),
+]
+
+data_compression_algorithms = [
+    ("LasZip", "laszip", "data_compression.laszip", "LasZip", 1, "o"),
+    ("LasZipPro", "laszip", "data_compression.laszip", "LasZipPro", 1, "o"),
+]
+
+dsm_dtm_generation_productions_algorithms = [
+    ("Las2Dem", "las2dem", "dsm_dtm_generation_prodctions.las2dem", "Las2Dem", 5, "c"),
+    ("Las2DemPro", "las2dem", "dsm_dtm_generation_prodctions.las2dem", "Las2DemPro", 5, "c"),
+    ("Las2DemNew", "las2dem_new", "dsm_dtm_generation_prodctions.las2dem_new", "Las2DemNew", 5, "c"),
+    ("Las2DemNewPro", "las2dem_new", "dsm_dtm_generation_prodctions.las2dem_new", "Las2DemNewPro", 5, "c"),
+    ("Las2Iso", "las2iso", "dsm_dtm_generation_prodctions.las2iso", "Las2Iso", 5, "c"),
+    ("LasPlanes", "lasplanes", "dsm_dtm_generation_prodctions.lasplanes", "LasPlanes", 5, "c"),
+    ("LasGrid", "lasgrid", "dsm_dtm_generation_prodctions.lasgrid", "LasGrid", 5, "c"),
+    ("LasGridPro", "lasgrid", "dsm_dtm_generation_prodctions.lasgrid", "LasGridPro", 5, "c"),
+    ("LasHeight", "lasheight", "dsm_dtm_generation_prodctions.lasheight", "LasHeight", 5, "c"),
+    ("LasHeightClassify", "lasheight", "dsm_dtm_generation_prodctions.lasheight", "LasHeightClassify", 5, "c"),
+    ("LasHeightPro", "lasheight", "dsm_dtm_generation_prodctions.lasheight", "LasHeightPro", 5, "c"),
+    ("LasHeightProClassify", "lasheight", "dsm_dtm_generation_prodctions.lasheight", "LasHeightProClassify", 5, "c"),
+    ("LasCanopy", "lascanopy", "dsm_dtm_generation_prodctions.lascanopy", "LasCanopy", 5, "c"),
+    ("LasCanopyPro", "lascanopy", "dsm_dtm_generation_prodctions.lascanopy", "LasCanopyPro", 5, "c"),
+    ("LasVoxel", "lasvoxel", "dsm_dtm_generation_prodctions.lasvoxel", "LasVoxel", 5, "c"),
+    ("Blast2Dem", "blast2dem", "dsm_dtm_generation_prodctions.blast2dem", "Blast2Dem", 5, "c"),
+    ("Blast2DemPro", "blast2dem", "dsm_dtm_generation_prodctions.blast2dem", "Blast2DemPro", 5, "c"),
+    ("Blast2Iso", "blast2iso", "dsm_dtm_generation_prodctions.blast2iso", "Blast2Iso", 5, "c"),
+    ("Blast2IsoPro", "blast2iso", "dsm_dtm_generation_prodctions.blast2iso", "Blast2IsoPro", 5, "c"),
+]
+
+publishing_algorithms = [
+    ("LasPublish", "laspublish", "publishing.laspublish", "LasPublish", 7, "c"),
+    ("LasPublishPro", "laspublish", "publishing.laspublish", "LasPublishPro", 7, "c"),
+]
+
+quality_control_information_algorithms = [
+    ("LasInfo", "lasinfo", "quality_control_information.lasinfo", "LasInfo", 6, "o"),
+    ("LasInfoPro", "lasinfo", "quality_control_information.lasinfo", "LasInfoPro", 6, "o"),
+    ("LasOverlap", "lasoverlap", "quality_control_information.lasoverlap", "LasOverlap", 6, "c"),
+    ("LasOverlapPro", "lasoverlap", "quality_control_information.lasoverlap", "LasOverlapPro", 6, "c"),
+    ("LasControl", "lascontrol", "quality_control_information.lascontrol", "LasControl", 6, "c"),
+    ("LasProbe", "lasprobe", "quality_control_information.lasprobe", "LasProbe", 6, "o"),
+    ("LasReturn", "lasreturn", "quality_control_information.lasreturn", "LasReturn", 6, "c"),
+    ("LasReturnPro", "lasreturn", "quality_control_information.lasreturn", "LasReturnPro", 6, "c"),
+    ("LasValidate", "lasvalidate", "quality_control_information.lasvalidate", "LasValidate", 6, "f"),
+    ("LasValidatePro", "lasvalidate", "quality_control_information.lasvalidate", "LasValidatePro", 6, "f"),
+    ("LasOptimize", "lasoptimize", "quality_control_information.lasoptimize", "LasOptimize", 2, "f"),
+    ("PerformanceRegressions", "history", "other_utilities.performance_history", "PerformanceRegressions", 6, "o"),
+]
+
+visualization_colorization_algorithms = [
+    ("LasView", "lasview", "visualization_colorization.lasview", "LasView", 8, "c"),
+    ("LasViewPro", "lasview", "visualization_colorization.lasview", "LasViewPro", 8, "c"),
+    ("LasColor", "lascolor", "visualization_colorization.lascolor", "LasColor", 8, "c"),
+]
+
+pipelines_algorithms = [
+    (
+        "FlightLinesToCHMFirstReturn",
+        "flightlines2chm",
+        "pipelines.flightlines2chm",
+        "FlightLinesToCHMFirstReturn",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToCHMHighestReturn",
+        "flightlines2chm",
+        "pipelines.flightlines2chm",
+        "FlightLinesToCHMHighestReturn",
+        9,
+        "c",
+    ),
+    ("FlightLinesToCHMSpikeFree", "flightlines2chm", "pipelines.flightlines2chm", "FlightLinesToCHMSpikeFree", 9, "c"),
+    (
+        "FlightLinesToDTMandDSMFirstReturn",
+        "flightlines2dtmdsm",
+        "pipelines.flightlines2dtmdsm",
+        "FlightLinesToDTMandDSMFirstReturn",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToDTMandDSMSpikeFree",
+        "flightlines2dtmdsm",
+        "pipelines.flightlines2dtmdsm",
+        "FlightLinesToDTMandDSMSpikeFree",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToMergedCHMFirstReturn",
+        "flightlines2mergedchm",
+        "pipelines.flightlines2mergedchm",
+        "FlightLinesToMergedCHMFirstReturn",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToMergedCHMHighestReturn",
+        "flightlines2mergedchm",
+        "pipelines.flightlines2mergedchm",
+        "FlightLinesToMergedCHMHighestReturn",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToMergedCHMPitFree",
+        "flightlines2mergedchm",
+        "pipelines.flightlines2mergedchm",
+        "FlightLinesToMergedCHMPitFree",
+        9,
+        "c",
+    ),
+    (
+        "FlightLinesToMergedCHMSpikeFree",
+        "flightlines2mergedchm",
+        "pipelines.flightlines2mergedchm",
+        "FlightLinesToMergedCHMSpikeFree",
+        9,
+        "c",
+    ),
+    ("HugeFileClassify", "hugefile", "pipelines.hugefile", "HugeFileClassify", 9, "c"),
+    ("HugeFileGroundClassify", "hugefile", "pipelines.hugefile", "HugeFileGroundClassify", 9, "c"),
+    ("HugeFileNormalize", "hugefile", "pipelines.hugefile", "HugeFileNormalize", 9, "c"),
+    ("SyntheticPointCloud", "synthetic", "other_utilities.synthetic_las", "SyntheticPointCloud", 9, "o"),
+]
+
+algorithms = (
+    processing_algorithms
+    + data_convert_algorithms
+    + classification_filtering_algorithms
+    + data_compression_algorithms
+    + dsm_dtm_generation_productions_algorithms
+    + publishing_algorithms
+    + quality_control_information_algorithms
+    + visualization_colorization_algorithms
+    + pipelines_algorithms
+)
+
+
+def check_registry():
+    """
+    Compares the entries with the attributes of their algorithm classes, returns the differences as messages.
+    Imports all algorithm modules: run by the eager startup benchmark (benchmarks/startup.py), never by the provider.
+    """
+    import importlib
+
+    differences = []
+    names = [entry[0] for entry in algorithms]
+    for name in sorted({name for name in names if names.count(name) > 1}):
+        differences.append(f"{name}: registered {names.count(name)} times")
+    for entry in algorithms:
+        tool_name, _, module, class_name, _, _ = entry
+        try:
+            algorithm_class = getattr(importlib.import_module(f"{__package__}.{module}"), class_name)
+        except (ImportError, AttributeError) as e:
+            differences.append(f"{tool_name}: {e}")
+            continue
+        attributes = tuple(
+            getattr(algorithm_class, attribute, None) for attribute in ("TOOL_NAME", "LASTOOL", "LASGROUP", "LICENSE")
+        )
+        registered = (entry[0], entry[1], entry[4], entry[5])
+        if attributes != registered:
+            differences.append(
+                f"{tool_name}: registered as (TOOL_NAME, LASTOOL, LASGROUP, LICENSE) {registered}, "
+                f"{module}.{class_name} has {attributes}"
+            )
+    return differences
@@ -2,15 +2,28 @@
 defining all the classes and objects
 """
 
-from .help import help_string_help, lasgroup_info, lastool_info, licence, paths, readme_url
+from .help import help_string_help, help_string_plugin, lasgroup_info, lastool_info, licence, paths, readme_url
+from .cache import LastoolsCache
+from .history import LastoolsHistory
+from .verbose import VERBOSE_OUTPUTS, VerboseOutput, verbose_output
+from .process import LastoolsPool, LastoolsProcess, replay_lines
 from .utils import LastoolsUtils
 
 __all__ = [
     LastoolsUtils,
+    LastoolsProcess,
+    LastoolsPool,
+    LastoolsCache,
+    LastoolsHistory,
+    VerboseOutput,
+    VERBOSE_OUTPUTS,
+    verbose_output,
+    replay_lines,
     paths,
     lastool_info,
     lasgroup_info,
     licence,
     help_string_help,
+    help_string_plugin,
     readme_url,
 ]
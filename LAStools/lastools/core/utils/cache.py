@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    cache.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+class LastoolsCache:
+    """
+    Content addressed cache of LAStools results.
+
+    An entry is keyed by the command (tool and normalized arguments) and the identity of
+    all input files. It holds the output files of the run and its console output.
+    On a hit the outputs are hard-linked (or copied) back instead of running the tool.
+    The cache is bounded in size, least recently used entries are evicted first.
+    """
+
+    MANIFEST = "manifest.json"
+    CONSOLE = "console.txt"
+    # options which do not change the results
+    IGNORED_OPTIONS = {"-v": 0, "-verbose": 0, "-cores": 1}
+    # options whose value is a directory or file name (pattern) written by the tool
+    OUTPUT_OPTIONS = ["-o", "-odir"]
+
+    def __init__(self, folder, max_size, use_hash=False):
+        self.folder = folder
+        self.max_size = max_size
+        self.use_hash = use_hash and xxhash is not None
+
+    @staticmethod
+    def unwrap(arg):
+        # undo LastoolsAlgorithm.pathwrap
+        if len(arg) > 1 and arg.startswith('"') and arg.endswith('"'):
+            return arg[1:-1]
+        return arg
+
+    @staticmethod
+    def normpath(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def identity(self, file):
+        stat = os.stat(file)
+        if not self.use_hash:
+            return [stat.st_size, stat.st_mtime_ns]
+        digest = xxhash.xxh3_128()
+        with open(file, "rb") as data:
+            for chunk in iter(lambda: data.read(1 << 20), b""):
+                digest.update(chunk)
+        return [stat.st_size, digest.hexdigest()]
+
+    def key(self, commands):
+        """Returns the cache key of a command list, None if the command can not be cached."""
+        if "-gui" in commands:
+            return None
+        args = []
+        inputs = {}
+        skip = 0
+        previous = ""
+        for arg in (self.unwrap(command) for command in commands):
+            if skip:
+                skip -= 1
+                continue
+            if arg in self.IGNORED_OPTIONS:
+                skip = self.IGNORED_OPTIONS[arg]
+                continue
+            output, previous = previous in self.OUTPUT_OPTIONS, arg
+            if output:
+                # an existing output from an earlier run is no input
+                args.append(self.normpath(arg))
+                continue
+            if any(char in arg for char in "*?") and not arg.startswith("-"):
+                files = sorted(glob.glob(arg))
+                if not files:
+                    return None
+            elif os.path.isfile(arg):
+                files = [arg]
+            else:
+                args.append(arg)
+                continue
+            args.append(self.normpath(arg))
+            for file in files:
+                inputs[self.normpath(file)] = self.identity(file)
+        text = json.dumps({"args": args, "inputs": inputs}, sort_keys=True)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def output_patterns(self, commands):
+        """
+        The files the command writes as (path, extended) pairs: the files with the path and any extension,
+        and the ones extending the path too if extended. None if they can not be told. They are named after
+        the '-o' file, else after the input files (cut by '-ocut', with the '-odix' appended) in the '-odir'
+        folder or next to the inputs. Other runs writing into the same folders at the same time write other files.
+        """
+        args = [self.unwrap(command) for command in commands]
+        options = {}
+        inputs = []
+        for i, arg in enumerate(args[:-1]):
+            value = args[i + 1]
+            if arg == "-i":
+                inputs.extend(glob.glob(value) if any(char in value for char in "*?") else [value])
+            elif arg == "-lof":
+                try:
+                    with open(value, encoding="utf-8") as data:
+                        inputs.extend(line.strip() for line in data if line.strip())
+                except OSError:
+                    return None
+            elif arg in ("-o", "-odir", "-odix", "-ocut"):
+                options[arg] = value
+        if "-o" in options:
+            output = os.path.join(options.get("-odir", ""), options["-o"])
+            # lastile and the -split options append to the name
+            return [(self.normpath(os.path.splitext(output)[0]), True)]
+        if not inputs:
+            return None
+        try:
+            cut = int(options.get("-ocut", 0))
+        except ValueError:
+            return None
+        patterns = set()
+        for file in inputs:
+            name = os.path.splitext(os.path.basename(file))[0]
+            if cut > 0:
+                name = name[:-cut]
+            folder = options.get("-odir", os.path.dirname(file))
+            if "-odix" in options:
+                patterns.add((self.normpath(os.path.join(folder, name + options["-odix"])), False))
+            else:
+                patterns.add((self.normpath(os.path.join(folder, name)), True))
+        return sorted(patterns)
+
+    @staticmethod
+    def snapshot(folders):
+        files = {}
+        for folder in folders:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files[os.path.join(folder, entry.name)] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def watch(self, commands):
+        """
+        Remembers the state of the output files before the run, see written(). None if the outputs of the
+        command can not be told (see output_patterns).
+        """
+        patterns = self.output_patterns(commands)
+        if patterns is None:
+            return None
+        folders = sorted({os.path.dirname(path) for path, _ in patterns if os.path.isdir(os.path.dirname(path))})
+        matcher = re.compile(
+            "(?:"
+            + "|".join(re.escape(path) + (".*" if extended else r"\.[^\\/]*") for path, extended in patterns)
+            + r")\Z"
+        )
+        return folders, self.snapshot(folders), matcher
+
+    @staticmethod
+    def written(watch):
+        """The output files of the run written since watch()."""
+        folders, before, matcher = watch
+        return sorted(
+            file
+            for file, state in LastoolsCache.snapshot(folders).items()
+            if before.get(file) != state and matcher.match(os.path.normcase(file))
+        )
+
+    def entry(self, key):
+        return os.path.join(self.folder, key[:2], key)
+
+    def console_file(self, key):
+        # console output of a running command is written here, see store()
+        os.makedirs(self.folder, exist_ok=True)
+        return os.path.join(self.folder, f"{key}.{uuid.uuid4().hex}.{self.CONSOLE}")
+
+    @staticmethod
+    def link(source, target):
+        if os.path.lexists(target):
+            os.remove(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def store(self, key, watch, console_file):
+        """Stores the output files written since watch() as new entry."""
+        outputs = self.written(watch)
+        entry = self.entry(key)
+        staging = f"{entry}.{uuid.uuid4().hex}"
+        os.makedirs(staging)
+        manifest = {"created": time.time(), "files": []}
+        for i, file in enumerate(outputs):
+            name = f"{i}_{os.path.basename(file)}"
+            self.link(file, os.path.join(staging, name))
+            stat = os.stat(file)
+            manifest["files"].append({"name": name, "path": file, "state": [stat.st_size, stat.st_mtime_ns]})
+        if console_file is not None and os.path.isfile(console_file):
+            os.replace(console_file, os.path.join(staging, self.CONSOLE))
+        with open(os.path.join(staging, self.MANIFEST), "w", encoding="utf-8") as out:
+            json.dump(manifest, out, indent=1)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(staging, entry)
+        self.evict()
+
+    def restore(self, key):
+        """
+        Restores the outputs of a cached entry. Returns the path of its console output
+        (possibly not existing) on a hit, None on a miss.
+        """
+        entry = self.entry(key)
+        try:
+            with open(os.path.join(entry, self.MANIFEST), encoding="utf-8") as data:
+                manifest = json.load(data)
+        except (OSError, ValueError):
+            return None
+        files = manifest["files"]
+        # a cached file changed (e.g. rewritten through a hard link): the entry is invalid
+        for file in files:
+            try:
+                stat = os.stat(os.path.join(entry, file["name"]))
+            except OSError:
+                stat = None
+            if stat is None or [stat.st_size, stat.st_mtime_ns] != file["state"]:
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+        for file in files:
+            os.makedirs(os.path.dirname(file["path"]), exist_ok=True)
+            self.link(os.path.join(entry, file["name"]), file["path"])
+        # most recently used
+        os.utime(os.path.join(entry, self.MANIFEST))
+        return os.path.join(entry, self.CONSOLE)
+
+    def outputs(self, key):
+        """The output files of a cached entry, the files restore() restores."""
+        try:
+            with open(os.path.join(self.entry(key), self.MANIFEST), encoding="utf-8") as data:
+                return [file["path"] for file in json.load(data)["files"]]
+        except (OSError, ValueError):
+            return []
+
+    def discard(self, console_file):
+        if console_file is not None and os.path.isfile(console_file):
+            os.remove(console_file)
+
+    def entries(self):
+        # (last use, size, path) of all entries
+        entries = []
+        for manifest in glob.glob(os.path.join(self.folder, "??", "*", self.MANIFEST)):
+            entry = os.path.dirname(manifest)
+            size = 0
+            for file in os.scandir(entry):
+                size += file.stat().st_size
+            entries.append((os.path.getmtime(manifest), size, entry))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -58,6 +58,15 @@ def help_string_help(lastool, lic):
       """
 
 
+# general help text below the help of the algorithms running no LAStools tool (no README, no licence)
+def help_string_plugin():
+    return """
+      <h3>Links</h3>
+      See <a href="https://rapidlasso.de">rapidlasso webpage</a> for further informations.
+      See the <a href="https://rapidlasso.de/lastools-as-qgis-plugin">LAStools QGIS page</a> for informations about this plugin.
+      """
+
+
 # groups
 lasgroup_info = {
     1: {"group": "1. Data Compression (LAZ)", "group_id": "data_compression"},
@@ -89,6 +98,11 @@ txt_inlazdir = f"{fop}input directory:{fcc} directory of LAS/LAZ files to be pro
 txt_inshpfile = f"{fop}input polygon(s):{fcc} input shapefile to be processed."
 txt_inpolyfile = f"{fop}input polyline(s)/polygons SHP/CSV file:{fcc} input file to match against."
 txt_cores = f"{fop}number of cores:{fcc} process multiple inputs on multiple tasks in parallel."
+txt_per_file = f"{fop}one process per file:{fcc} start one LAStools process per input file, largest files first, on the given number of cores. Reports progress and failures per file."
+txt_aoi = f"{fop}area of interest:{fcc} optional extent and/or polygons, grown by the buffer: only the input files whose bounding box intersects it are processed. The bounding boxes are read from the file headers, the points are not read."
+txt_per_tile = f"{fop}process tile by tile:{fcc} the steps working file by file run on each tile as soon as the tile is done with the step before, instead of waiting for the slowest tile. The tiles share the cores."
+txt_cog = f"{fop}cloud optimized GeoTIFF:{fcc} rewrite the GeoTIFF outputs as cloud optimized GeoTIFFs (tiled, compressed, with overviews) using GDAL, in parallel on the cores. Other raster formats are left as they are."
+txt_vrt = f"{fop}virtual raster (VRT):{fcc} write a virtual raster over the output raster tiles of a directory run, one per product, and add it to the project. It is built from the headers of the tiles without reading a cell."
 txt_step = f"{fop}step size / pixel size:{fcc} size of input dimension per output pixel."
 txt_pixel_attrib = f"{fop}attribute:{fcc} attribute to use to calculate output pixel."
 txt_pixel_method = f"{fop}method:{fcc} method to calculate output pixel color."
@@ -101,7 +115,7 @@ txt_canopy = f"""
 {fop}density rasters:{fcc} optional individual density raster.
 """
 txt_tile = f"""
-{fop}tile size:{fcc} Tile size should be according to your resolution. One target tile should not exceed the size of 10 million points.
+{fop}tile size:{fcc} Tile size should be according to your resolution. One target tile should not exceed the size of 10 million points. With 0 the tile size is chosen from the point density in the headers of the input files for about 8 million points per tile, and the buffer is raised to 25 times the step size (or point spacing) if smaller.
 {fop}buffer around each tile:{fcc} Set a buffer around each tile to avoid border artifacts wher points are triangulated.
 """
 txt_boundary = f"""
@@ -317,6 +331,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {txt_args("laszip")}
 See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex</a> about index files (*.lax).
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {txt_laszip_outro}
@@ -360,6 +375,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {txt_filter_value}
 {txt_args("las2las")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -394,6 +410,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {txt_proj}
 {txt_args("las2las")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -429,6 +446,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {txt_transform}
 {txt_args("las2las")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -492,6 +510,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {fop}write column description:{fcc} write a header line to the output containing the column description (this enables to omit -parse during import using txt2las)
 {txt_args("las2txt")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -545,6 +564,7 @@ See <a href="https://downloads.rapidlasso.de/readme/lasindex_README.md">lasindex
 {txt_proj}
 {txt_args("txt2las")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -680,6 +700,8 @@ More merge and copy arguments see README file.
 {txt_boundary}
 {txt_args("lasboundary")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -735,6 +757,8 @@ Takes as input a LAS/LAZ/TXT file and a SHP/TXT file with one or many polygons (
 {fop}repair invalid number of returns:{fcc} repair invalid number of return values
 {fop}skip incomplete returns:{fcc} skip incomplete returns
 {txt_args("lasreturn")}
+{txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -763,6 +787,7 @@ Takes as input a LAS/LAZ/TXT file and a SHP/TXT file with one or many polygons (
 {txt_inlazdir}
 {txt_args("lassort")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -809,6 +834,7 @@ Takes as input a LAS/LAZ/TXT file and a SHP/TXT file with one or many polygons (
 {txt_inlazdir}
 {txt_args("lasindex")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -920,6 +946,7 @@ The output report defaults to stdout unless you specify an output file with '-o
 {txt_inlazdir}
 {txt_args("lasnoise")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1027,6 +1054,7 @@ tiles file 'large.laz' with tile size 500 and buffer 10 in reversible mode. the
 {txt_inlazdir}
 {txt_args("lasclassify")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1057,6 +1085,7 @@ tiles file 'large.laz' with tile size 500 and buffer 10 in reversible mode. the
 {txt_inlazdir}
 {txt_args("lasground")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1087,6 +1116,7 @@ tiles file 'large.laz' with tile size 500 and buffer 10 in reversible mode. the
 {txt_inlazdir}
 {txt_args("lasground_new")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1117,6 +1147,7 @@ tiles file 'large.laz' with tile size 500 and buffer 10 in reversible mode. the
 {txt_inlazdir}
 {txt_args("lasthin")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1147,6 +1178,7 @@ first point per 3d-grid cell.""",
 {txt_inlazdir}
 {txt_args("lasthin3d")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1164,6 +1196,7 @@ first point per 3d-grid cell.""",
 {txt_pixel_attrib}
 {txt_pixel_method}
 {txt_args("blast2dem")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1184,6 +1217,10 @@ first point per 3d-grid cell.""",
 {txt_pixel_method}
 {txt_args("blast2dem")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
+{txt_cog}
+{txt_vrt}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1212,6 +1249,8 @@ first point per 3d-grid cell.""",
 {txt_inlazdir}
 {txt_args("blast2iso")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
 {txt_verbose}
 {txt_64bit}
                 """,
@@ -1228,6 +1267,7 @@ first point per 3d-grid cell.""",
 {txt_pixel_attrib}
 {txt_pixel_method}
 {txt_args("las2dem")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1248,6 +1288,10 @@ first point per 3d-grid cell.""",
 {txt_pixel_method}
 {txt_args("las2dem")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
+{txt_cog}
+{txt_vrt}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1266,6 +1310,7 @@ first point per 3d-grid cell.""",
 {txt_pixel_attrib}
 {txt_pixel_method}
 {txt_args("las2dem_new")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1286,6 +1331,10 @@ first point per 3d-grid cell.""",
 {txt_pixel_method}
 {txt_args("las2dem_new")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
+{txt_cog}
+{txt_vrt}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1313,6 +1362,7 @@ first point per 3d-grid cell.""",
 {txt_inlazfile}
 {txt_canopy}
 {txt_args("lascanopy")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1330,6 +1380,10 @@ first point per 3d-grid cell.""",
 {txt_canopy}
 {txt_args("lascanopy")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
+{txt_cog}
+{txt_vrt}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1348,6 +1402,7 @@ first point per 3d-grid cell.""",
 {txt_pixel_attrib}
 {txt_pixel_method}
 {txt_args("lasgrid")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1368,6 +1423,10 @@ first point per 3d-grid cell.""",
 {txt_pixel_method}
 {txt_args("lasgrid")}
 {txt_cores}
+{txt_per_file}
+{txt_aoi}
+{txt_cog}
+{txt_vrt}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1400,6 +1459,7 @@ first point per 3d-grid cell.""",
 {txt_replace_z}
 {txt_args("lasheight")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1432,6 +1492,7 @@ first point per 3d-grid cell.""",
 {txt_replace_z}
 {txt_args("lasheight")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
                 """,
@@ -1469,6 +1530,8 @@ first point per 3d-grid cell.""",
 <h3>Parameters</h3>
 {txt_inlazfile}
 {txt_args("lasduplicate")}
+{txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1516,6 +1579,7 @@ This example analyzes all raw integer coordinates of "in.laz" into three separat
 {txt_inlazdir}
 {txt_args("lasinfo")}
 {txt_cores}
+{txt_per_file}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1533,6 +1597,7 @@ create ONE textfile with all LAZ file header information.
 {txt_inlazfile}
 {txt_filter}
 {txt_args("lasoverlap")}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1550,6 +1615,7 @@ create ONE textfile with all LAZ file header information.
 {txt_filter}
 {txt_args("lasoverlap")}
 {txt_cores}
+{txt_cog}
 {txt_verbose}
 {txt_64bit}
 {head_console_examples}
@@ -1661,86 +1727,143 @@ create ONE textfile with all LAZ file header information.
     },
     "FlightLinesToCHMFirstReturn": {
         "disp": "Flightlines to CHM - first return",
-        "help": """
+        "help": f"""
                     Create a canopy height model with first return only
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a canopy height model with first return only",
     },
     "FlightLinesToCHMHighestReturn": {
         "disp": "Flightlines to CHM - highest return",
-        "help": """
+        "help": f"""
                     Create a canopy height model with highest return only
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a canopy height model with highest return only",
     },
     "FlightLinesToCHMSpikeFree": {
         "disp": "Flightlines to CHM - spike free",
-        "help": """
+        "help": f"""
                     Create a canopy height model with spike free option
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a canopy height model with spike free option",
     },
     "FlightLinesToDTMandDSMFirstReturn": {
         "disp": "FlightLines to DTM & DSM - first return",
-        "help": """
+        "help": f"""
                      Create a digital terrain model and digital surface model out of lidar data files using the first return only
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a digital terrain model and digital surface model out of lidar data files using the first return only",
     },
     "FlightLinesToDTMandDSMSpikeFree": {
         "disp": "FlightLines to DTM & DSM - spike free",
-        "help": """
+        "help": f"""
                     Create a digital terrain model and digital surface model with spike free option
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a digital terrain model and digital surface model with spike free option",
     },
     "FlightLinesToMergedCHMFirstReturn": {
         "disp": "FlightLines to merged CHM - first return",
-        "help": """
+        "help": f"""
                     Create a merged canopy height model out of lidar data files using the first return only
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a merged canopy height model out of lidar data files using the first return only",
     },
     "FlightLinesToMergedCHMHighestReturn": {
         "disp": "FlightLines to merged CHM - highest return",
-        "help": """
+        "help": f"""
                     Create a merged canopy height model out of lidar data files with highest return
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a merged canopy height model out of lidar data files with highest return",
     },
     "FlightLinesToMergedCHMPitFree": {
         "disp": "FlightLines to merged CHM - pit free",
-        "help": """
+        "help": f"""
                     Create a pit free merged canopy height model out of lidar data files
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a pit free merged canopy height model out of lidar data files",
     },
     "FlightLinesToMergedCHMSpikeFree": {
         "disp": "FlightLines to merged CHM - spike free",
-        "help": """
+        "help": f"""
                     Create a canopy height model out of lidar data files which are optional in flightlines
+<h3>Parameters</h3>
+{txt_per_tile}
+{txt_cog}
                 """,
         "desc": "Create a canopy height model out of lidar data files which are optional in flightlines",
     },
     "HugeFileClassify": {
         "disp": "Huge file - classify",
-        "help": """
+        "help": f"""
                     Do a classification for huge lidar data files
+<h3>Parameters</h3>
+{txt_per_tile}
                 """,
         "desc": "Do a classification for huge lidar data files",
     },
     "HugeFileGroundClassify": {
         "disp": "Huge file - ground classify",
-        "help": """
+        "help": f"""
                     Do a ground classification for huge lidar data files
+<h3>Parameters</h3>
+{txt_per_tile}
                 """,
         "desc": "Do a ground classification for huge lidar data files",
     },
     "HugeFileNormalize": {
         "disp": "Huge file - normalize",
-        "help": """
+        "help": f"""
                     Normalize huge lidar data files
+<h3>Parameters</h3>
+{txt_per_tile}
                 """,
         "desc": "Normalize huge lidar data files",
     },
+    "SyntheticPointCloud": {
+        "disp": "Synthetic point cloud",
+        "help": """
+                    Writes synthetic airborne LiDAR data with NumPy, no LAStools needed:
+                    a smooth terrain with buildings, vegetation (first and last returns) and noise,
+                    scanned by overlapping north-south flight lines with their own point source IDs.
+                    The same seed gives the same points, so the files serve as reproducible
+                    test data of any size, density, extent and point format (LAS 1.2 or 1.4).
+                """,
+        "desc": "Write synthetic LAS files as reproducible test data",
+    },
+    "PerformanceRegressions": {
+        "disp": "Performance regressions",
+        "help": """
+                    Compares the latest run of the algorithms with the runs before it.
+                    Every run of an algorithm is kept in the performance history of the QGIS profile:
+                    its wall time and, per stage (LAStools tool), the wall and cpu time and the peak memory.
+                    Runs are compared with the median of the earlier runs of the same algorithm with the
+                    same parameters (outputs aside) and an input of the same size class (a power of two).
+                    A time or peak memory above the baseline by more than the tolerance is reported as
+                    regression, a changed executable of a stage (e.g. a LAStools update) is noted.
+                """,
+        "desc": "Compare the latest runs with the performance history",
+    },
 }
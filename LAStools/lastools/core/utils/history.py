@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    history.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import datetime
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import statistics
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    size_class INTEGER NOT NULL,
+    input_bytes INTEGER NOT NULL,
+    finished TEXT NOT NULL,
+    wall_time REAL NOT NULL,
+    peak_rss INTEGER
+);
+CREATE INDEX runs_key ON runs (key, id);
+CREATE TABLE stages (
+    run INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    wall_time REAL NOT NULL,
+    cpu_time REAL,
+    peak_rss INTEGER,
+    read_bytes INTEGER,
+    write_bytes INTEGER,
+    executable TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run, stage)
+);
+"""
+
+
+class LastoolsHistory:
+    """
+    Performance history of the algorithm runs in a SQLite database.
+
+    A run is stored with its wall time and, per stage (the LAStools runs of a tool, or an in
+    process stage like the mosaic), the summed wall and cpu time and the peak memory.
+    Runs are keyed by the algorithm, its normalized parameters (without the outputs) and the
+    size class of its input, so the same job on the same kind of data can be compared across
+    runs: compare() checks the latest run against the median of the runs before it.
+    The signature (size and time) of the executable of a stage is kept as well, so a
+    regression can be told apart from a LAStools upgrade.
+    """
+
+    # increase on changes of SCHEMA, an older database is rebuilt
+    SCHEMA_VERSION = 1
+    # runs kept per key, older ones are deleted
+    MAX_RUNS = 100
+    METRICS = ["wall_time", "cpu_time", "peak_rss"]
+    # metrics flagged when they got worse, cpu time is reported only
+    FLAGGED_METRICS = ["wall_time", "peak_rss"]
+
+    def __init__(self, database):
+        self.database = database
+
+    def connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.database)), exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS stages")
+                connection.execute("DROP TABLE IF EXISTS runs")
+                connection.executescript(SCHEMA)
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        return connection
+
+    @staticmethod
+    def size_class(input_bytes):
+        # n: 2^n to 2^(n+1) bytes of input
+        return int(math.log2(input_bytes)) if input_bytes > 0 else 0
+
+    @staticmethod
+    def normalize(value):
+        # parameter values compared as text, paths in one spelling
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [LastoolsHistory.normalize(item) for item in value]
+        value = str(value).strip()
+        if os.path.isabs(value):
+            return os.path.normcase(os.path.normpath(value))
+        return value
+
+    @staticmethod
+    def key(algorithm, parameters, size_class):
+        text = json.dumps([algorithm, parameters, size_class], sort_keys=True)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def stage_name(tool):
+        # the 32 and 64 bit versions are the same stage
+        return tool[:-2] if tool.endswith("64") else tool
+
+    @staticmethod
+    def stages(records, executables=None):
+        """Metrics of the stages of a run from the metrics records of its LAStools runs (cached ones left out)."""
+        stages = {}
+        for record in records:
+            if record.get("cached") or "wall_time" not in record:
+                continue
+            name = LastoolsHistory.stage_name(record["tool"])
+            stage = stages.setdefault(
+                name,
+                {
+                    "runs": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": None,
+                    "peak_rss": None,
+                    "read_bytes": None,
+                    "write_bytes": None,
+                    "executable": (executables or {}).get(record["tool"], ""),
+                },
+            )
+            stage["runs"] += 1
+            stage["wall_time"] += record["wall_time"]
+            if "user_time" in record:
+                stage["cpu_time"] = (stage["cpu_time"] or 0.0) + record["user_time"] + record.get("system_time", 0.0)
+            if "peak_rss" in record:
+                stage["peak_rss"] = max(stage["peak_rss"] or 0, record["peak_rss"])
+            for name in ("read_bytes", "write_bytes"):
+                if name in record:
+                    stage[name] = (stage[name] or 0) + record[name]
+        return stages
+
+    @staticmethod
+    def input_bytes(records):
+        # the input of the first stage is the input of the algorithm (all files of a run per file)
+        if not records:
+            return 0
+        first = records[0]["tool"]
+        return sum(record["input_bytes"] for record in records if record["tool"] == first)
+
+    def add(self, algorithm, parameters, wall_time, records, executables=None):
+        """
+        Stores a run of an algorithm: its normalized parameters (a dict), its wall time and the metrics
+        records of its LAStools runs (see LastoolsAlgorithm.record_metrics). Returns the key of the run.
+        """
+        input_bytes = self.input_bytes(records)
+        size_class = self.size_class(input_bytes)
+        parameters = {name: self.normalize(value) for name, value in parameters.items()}
+        key = self.key(algorithm, parameters, size_class)
+        stages = self.stages(records, executables)
+        peaks = [stage["peak_rss"] for stage in stages.values() if stage["peak_rss"] is not None]
+        with closing(self.connect()) as connection, connection:
+            run = connection.execute(
+                "INSERT INTO runs (key, algorithm, parameters, size_class, input_bytes, finished, wall_time, peak_rss)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    algorithm,
+                    json.dumps(parameters, sort_keys=True),
+                    size_class,
+                    input_bytes,
+                    datetime.datetime.now().isoformat(timespec="seconds"),
+                    wall_time,
+                    max(peaks) if peaks else None,
+                ),
+            ).lastrowid
+            for name, stage in stages.items():
+                columns = ", ".join(stage)
+                values = ", ".join("?" for _ in stage)
+                connection.execute(
+                    f"INSERT INTO stages (run, stage, {columns}) VALUES (?, ?, {values})",
+                    [run, name] + list(stage.values()),
+                )
+            connection.execute(
+                "DELETE FROM runs WHERE key = ? AND id NOT IN (SELECT id FROM runs WHERE key = ? ORDER BY id DESC LIMIT ?)",
+                (key, key, self.MAX_RUNS),
+            )
+        return key
+
+    def runs(self, algorithm=None, key=None, limit=None):
+        """The runs (dicts with the columns of runs), latest first."""
+        sql = "SELECT * FROM runs WHERE 1"
+        args = []
+        if algorithm is not None:
+            sql += " AND algorithm = ?"
+            args.append(algorithm)
+        if key is not None:
+            sql += " AND key = ?"
+            args.append(key)
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with closing(self.connect()) as connection:
+            return [dict(row) for row in connection.execute(sql, args)]
+
+    def keys(self, algorithm=None):
+        """The keys with runs (of the algorithm), the most recently run first."""
+        sql = "SELECT key, MAX(id) AS latest FROM runs"
+        args = []
+        if algorithm is not None:
+            sql += " WHERE algorithm = ?"
+            args.append(algorithm)
+        sql += " GROUP BY key ORDER BY latest DESC"
+        with closing(self.connect()) as connection:
+            return [row["key"] for row in connection.execute(sql, args)]
+
+    def stage_rates(self, algorithm, limit=10):
+        """Median seconds per input byte of the stages in the latest runs of the algorithm, by stage."""
+        rates = {}
+        with closing(self.connect()) as connection:
+            for row in connection.execute(
+                "SELECT stages.stage, stages.wall_time, runs.input_bytes FROM stages JOIN runs ON stages.run = runs.id"
+                " WHERE runs.id IN (SELECT id FROM runs WHERE algorithm = ? AND input_bytes > 0 ORDER BY id DESC LIMIT ?)",
+                (algorithm, limit),
+            ):
+                rates.setdefault(row["stage"], []).append(row["wall_time"] / row["input_bytes"])
+        return {stage: statistics.median(values) for stage, values in rates.items()}
+
+    def compare(self, key, baseline=10, tolerance=0.2, min_seconds=1.0, min_bytes=16 << 20):
+        """
+        Compares the latest run of the key with the median of the baseline runs before it, stage by stage
+        and for the whole run. Returns the comparisons (dicts), None without earlier runs. A wall time or peak
+        memory more than tolerance (a share) and min_seconds or min_bytes above the baseline is a regression.
+        """
+        with closing(self.connect()) as connection:
+            runs = [
+                dict(row)
+                for row in connection.execute(
+                    "SELECT * FROM runs WHERE key = ? ORDER BY id DESC LIMIT ?", (key, baseline + 1)
+                )
+            ]
+            if len(runs) < 2:
+                return None
+            stages = {run["id"]: {} for run in runs}
+            ids = ", ".join("?" for _ in runs)
+            for row in connection.execute(f"SELECT * FROM stages WHERE run IN ({ids})", list(stages)):
+                stages[row["run"]][row["stage"]] = dict(row)
+        latest, earlier = runs[0], runs[1:]
+        comparisons = []
+
+        def compare(stage, metric, value, values, executable_changed=False):
+            values = [other for other in values if other is not None]
+            if value is None or not values:
+                return
+            median = statistics.median(values)
+            minimum = min_bytes if metric == "peak_rss" else min_seconds
+            comparisons.append(
+                {
+                    "algorithm": latest["algorithm"],
+                    "stage": stage,
+                    "metric": metric,
+                    "latest": value,
+                    "baseline": median,
+                    "runs": len(values),
+                    "change": value / median - 1 if median > 0 else 0.0,
+                    "regression": metric in self.FLAGGED_METRICS
+                    and value > median * (1 + tolerance)
+                    and value - median > minimum,
+                    "executable_changed": executable_changed,
+                }
+            )
+
+        for metric in ("wall_time", "peak_rss"):
+            compare("", metric, latest[metric], [run[metric] for run in earlier])
+        for name, stage in sorted(stages[latest["id"]].items()):
+            before = [stages[run["id"]][name] for run in earlier if name in stages[run["id"]]]
+            # the executable of the latest run is not the one of the run before
+            changed = bool(before) and stage["executable"] != before[0]["executable"]
+            for metric in self.METRICS:
+                compare(name, metric, stage[metric], [other[metric] for other in before], changed)
+        return comparisons
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    process.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+import queue
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+from processing.tools.system import isWindows
+
+from .verbose import verbose_output
+
+# severity of a console line, same scale as the LAStools return codes
+SEVERITY_INFO = 0
+SEVERITY_WARNING = 1
+SEVERITY_ERROR = 3
+
+
+def classify_line(line):
+    if "ERROR:" in line:
+        return SEVERITY_ERROR
+    if "WARNING:" in line:
+        return SEVERITY_WARNING
+    return SEVERITY_INFO
+
+
+def child_pids(pid):
+    # all (grand)children of pid as far as visible in /proc, deepest last
+    parents = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as stat:
+                # the ppid follows the parenthesized command name
+                fields = stat.read().rsplit(b")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        parents.setdefault(int(fields[1]), []).append(int(entry))
+    children = []
+    pending = [pid]
+    while pending:
+        for child in parents.get(pending.pop(0), []):
+            children.append(child)
+            pending.append(child)
+    return children
+
+
+def replay_lines(feedback, console_file, batch_size=200):
+    # forward a console output saved earlier, see LastoolsProcess.console_file
+    with open(console_file, encoding="utf-8") as console:
+        batch = []
+        batch_severity = SEVERITY_INFO
+        for line in console:
+            line = line.rstrip("\n")
+            severity = classify_line(line)
+            if batch and (severity != batch_severity or len(batch) >= batch_size):
+                push_lines(feedback, batch_severity, batch)
+                batch = []
+            batch_severity = severity
+            batch.append(line)
+        push_lines(feedback, batch_severity, batch)
+
+
+def push_lines(feedback, severity, lines):
+    # forward a batch of console lines of the same severity to the processing log
+    if feedback is None or not lines:
+        return
+    text = "\n".join(lines)
+    if severity >= SEVERITY_ERROR:
+        feedback.reportError(text)
+    elif severity >= SEVERITY_WARNING:
+        feedback.pushWarning(text)
+    else:
+        feedback.pushConsoleInfo(text)
+
+
+class LastoolsProcess:
+    """
+    A single LAStools child process. Its console output is read line by line
+    on a background thread and handed over through a bounded queue, so the
+    output never has to be held in memory as a whole.
+    """
+
+    # max. number of lines waiting in the queue before the reader blocks
+    QUEUE_SIZE = 1000
+    # max. number of lines forwarded to the log in one batch
+    BATCH_SIZE = 200
+    # seconds between checks of the cancel flag
+    POLL_INTERVAL = 0.1
+    # seconds a terminated process tree gets before it is killed
+    KILL_TIMEOUT = 0.5
+    # seconds between samples of the I/O counters
+    IO_INTERVAL = 1.0
+
+    def __init__(self, commandline, label="", console_file=None):
+        self.commandline = commandline
+        # optional prefix of all forwarded lines, to tell concurrent processes apart
+        self.label = label
+        # optional file receiving a copy of the console output
+        self.console_file = console_file
+        self.lines = queue.Queue(self.QUEUE_SIZE)
+        self.severity = SEVERITY_INFO
+        self.returncode = None
+        self.sub = None
+        self.reader = None
+        self.canceled = False
+        # resource usage of the run: wall time, cpu times, peak rss and i/o bytes (as far as available)
+        self.metrics = {}
+        self.started = None
+        self.io = {}
+        self.io_sampled = 0.0
+        # phase times and counts from the verbose output, see VerboseOutput
+        self.verbose = verbose_output(commandline)
+
+    @staticmethod
+    def decode(raw):
+        if isWindows():
+            return raw.decode("cp850", errors="replace")
+        return raw.decode("utf-8", errors="replace")
+
+    def args(self):
+        # without a shell POSIX needs the argument vector, windows takes the command line as is
+        if isWindows():
+            return self.commandline
+        return shlex.split(self.commandline)
+
+    def start(self):
+        self.started = time.monotonic()
+        self.metrics["start"] = time.time()
+        # own process group, so -cores workers and wine children can be stopped together
+        if isWindows():
+            group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {"start_new_session": True}
+        self.sub = subprocess.Popen(
+            self.args(),
+            shell=False,
+            stdout=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            universal_newlines=False,
+            **group,
+        )
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+        return self
+
+    def _read(self):
+        console = None
+        try:
+            if self.console_file is not None:
+                console = open(self.console_file, "w", encoding="utf-8")
+            for raw in iter(self.sub.stdout.readline, b""):
+                line = self.decode(raw).rstrip("\r\n")
+                if console is not None:
+                    console.write(line + "\n")
+                severity = classify_line(line)
+                self.severity = max(self.severity, severity)
+                self.verbose.feed(line)
+                self.lines.put((severity, line))
+        finally:
+            if console is not None:
+                console.close()
+            self.sub.stdout.close()
+            # end of output marker
+            self.lines.put(None)
+
+    def forward(self, feedback, timeout=POLL_INTERVAL):
+        """
+        Forwards pending console lines to the feedback in batches of equal severity.
+        Returns False once the complete output was forwarded.
+        """
+        self.sample_io()
+        batch = []
+        batch_severity = SEVERITY_INFO
+        try:
+            item = self.lines.get(timeout=timeout)
+            while True:
+                if item is None:
+                    push_lines(feedback, batch_severity, batch)
+                    return False
+                severity, line = item
+                if batch and (severity != batch_severity or len(batch) >= self.BATCH_SIZE):
+                    push_lines(feedback, batch_severity, batch)
+                    batch = []
+                batch_severity = severity
+                batch.append(f"[{self.label}] {line}" if self.label else line)
+                item = self.lines.get_nowait()
+        except queue.Empty:
+            push_lines(feedback, batch_severity, batch)
+            return True
+
+    def terminate_tree(self):
+        if self.sub.poll() is not None:
+            return
+        if isWindows():
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(self.sub.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+            return
+        # children may have left the process group (e.g. wine), collect them before they get orphaned
+        pids = [self.sub.pid] + child_pids(self.sub.pid)
+        self._signal(pids, signal.SIGTERM)
+        deadline = time.monotonic() + self.KILL_TIMEOUT
+        while time.monotonic() < deadline and self.sub.poll() is None:
+            time.sleep(0.05)
+        self._signal(pids, signal.SIGKILL)
+
+    def _signal(self, pids, sig):
+        try:
+            os.killpg(self.sub.pid, sig)
+        except OSError:
+            pass
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+
+    def sample_io(self):
+        # i/o counters of the process and its children, only available from linux /proc
+        now = time.monotonic()
+        if now - self.io_sampled < self.IO_INTERVAL or not os.path.isdir("/proc"):
+            return
+        self.io_sampled = now
+        for pid in [self.sub.pid] + child_pids(self.sub.pid):
+            counters = {}
+            try:
+                with open(f"/proc/{pid}/io") as io:
+                    for line in io:
+                        name, value = line.split(":")
+                        counters[name] = int(value)
+            except (OSError, ValueError):
+                continue
+            # counters of exited children are kept with their last sample
+            self.io[pid] = (counters.get("read_bytes", 0), counters.get("write_bytes", 0))
+
+    def _wait(self):
+        if not hasattr(os, "wait4"):
+            returncode = self.sub.wait()
+        else:
+            try:
+                _, status, usage = os.wait4(self.sub.pid, 0)
+            except ChildProcessError:
+                # already reaped by Popen.poll()
+                usage = None
+                returncode = self.sub.wait()
+            else:
+                returncode = os.waitstatus_to_exitcode(status)
+                self.sub.returncode = returncode
+            if usage is not None:
+                # ru_maxrss is kilobytes on linux and bytes on macOS
+                self.metrics["user_time"] = usage.ru_utime
+                self.metrics["system_time"] = usage.ru_stime
+                self.metrics["peak_rss"] = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        self.metrics["wall_time"] = time.monotonic() - self.started
+        if self.io:
+            self.metrics["read_bytes"] = sum(read for read, _ in self.io.values())
+            self.metrics["write_bytes"] = sum(write for _, write in self.io.values())
+        return returncode
+
+    def cancel(self):
+        self.canceled = True
+        self.terminate_tree()
+
+    def wait(self):
+        if self.canceled:
+            # discard what is left, a detached grandchild may still hold the pipe: do not wait for it forever
+            deadline = time.monotonic() + self.KILL_TIMEOUT
+            while self.forward(None) and time.monotonic() < deadline:
+                pass
+            self.reader.join(self.KILL_TIMEOUT)
+        else:
+            self.reader.join()
+        self.returncode = self._wait()
+        # a canceled reader may still be running
+        verbose = self.verbose.result() if not self.canceled else {"phases": {}}
+        if verbose["phases"] or len(verbose) > 1:
+            self.metrics["verbose"] = verbose
+        return self.returncode
+
+    def run(self, feedback):
+        self.start()
+        while self.forward(feedback):
+            if feedback is not None and feedback.isCanceled():
+                self.cancel()
+                break
+        return self.wait()
+
+
+class LastoolsPool:
+    """
+    Runs a list of LAStools command lines with at most `size` processes at the same time.
+    Output of all processes is forwarded by the calling thread, which also watches the cancel flag.
+    """
+
+    def __init__(self, size, feedback):
+        self.size = max(1, size)
+        self.feedback = feedback
+
+    def run(self, jobs, finished=None):
+        """
+        Runs the jobs, given as (label, commandline) tuples, in the given order.
+        finished(process, done, total) is called in the calling thread after each process ended.
+        Returns the processes in the order of the jobs.
+        """
+        pending = deque(LastoolsProcess(commandline, label) for label, commandline in jobs)
+        processes = list(pending)
+        running = []
+        done = 0
+        while pending or running:
+            if self.feedback is not None and self.feedback.isCanceled():
+                for process in running:
+                    process.cancel()
+                for process in running:
+                    process.wait()
+                break
+            while pending and len(running) < self.size:
+                running.append(pending.popleft().start())
+            ended = [process for process in running if not process.forward(self.feedback, 0)]
+            for process in ended:
+                running.remove(process)
+                process.wait()
+                done += 1
+                if finished is not None:
+                    finished(process, done, len(processes))
+            if not ended:
+                time.sleep(LastoolsProcess.POLL_INTERVAL / 2)
+        return processes
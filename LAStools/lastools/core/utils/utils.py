@@ -20,17 +20,32 @@ __author__ = "rapidlasso"
 __date__ = "January 2025"
 __copyright__ = "(c) 2025, rapidlasso GmbH"
 
+import json
 import os
-import subprocess
+import tempfile
+import threading
 from qgis.core import (
     Qgis,
+    QgsApplication,
     QgsMessageLog,
 )
 from qgis.utils import iface
 from processing.core.ProcessingConfig import ProcessingConfig
 from processing.tools.system import isWindows
 
+from .cache import LastoolsCache
+from .history import LastoolsHistory
+from ..io import LasCatalog
+from .process import LastoolsProcess
+
 class LastoolsUtils:
+    # concurrent algorithms append to the same metrics log
+    metrics_lock = threading.Lock()
+    # LAStools folder -> (folder mtime, file names), see lastools_executables()
+    executables = {}
+    # last LAStools folder checked by lastools_check_path()
+    checked_path = None
+
     @staticmethod
     def isDebug():
         return False # todo: always set to False prio delivery
@@ -68,15 +83,74 @@ class LastoolsUtils:
                 val = os.path.join(val, "bin")
             return val
 
+    @staticmethod
+    def profile_folder():
+        # plugin data (cache, logs) in the active QGIS user profile
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), "lastools")
+
+    @staticmethod
+    def catalog():
+        # header summaries of the input files, shared by all algorithms
+        return LasCatalog(os.path.join(LastoolsUtils.profile_folder(), "catalog.sqlite"))
+
+    @staticmethod
+    def history():
+        # performance history of the algorithm runs
+        return LastoolsHistory(os.path.join(LastoolsUtils.profile_folder(), "history.sqlite"))
+
+    @staticmethod
+    def scratch_folder():
+        # root of the temporary directories the pipelines create for themselves
+        return ProcessingConfig.getSetting("LASTOOLS_SCRATCH_FOLDER") or tempfile.gettempdir()
+
+    @staticmethod
+    def cache():
+        # result cache as configured in the provider settings, None if not activated
+        if not ProcessingConfig.getSetting("LASTOOLS_CACHE_ACTIVATED"):
+            return None
+        folder = ProcessingConfig.getSetting("LASTOOLS_CACHE_FOLDER")
+        if not folder:
+            folder = os.path.join(LastoolsUtils.profile_folder(), "cache")
+        size = int(ProcessingConfig.getSetting("LASTOOLS_CACHE_SIZE") or 0) * 1024 * 1024
+        return LastoolsCache(folder, size, ProcessingConfig.getSetting("LASTOOLS_CACHE_XXHASH"))
+
+    @staticmethod
+    def lastools_executables():
+        # file names in the LAStools folder from one directory scan, rescanned only if the folder changed
+        ltp = LastoolsUtils.lastools_path()
+        try:
+            mtime = os.stat(ltp).st_mtime_ns
+        except OSError:
+            return None
+        cached = LastoolsUtils.executables.get(ltp)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(ltp) as entries:
+                names = frozenset(os.path.normcase(entry.name) for entry in entries if entry.is_file())
+            cached = (mtime, names)
+            LastoolsUtils.executables[ltp] = cached
+        return cached[1]
+
+    @staticmethod
+    def lastools_versions(lastool):
+        # (has32, has64) of a tool
+        names = LastoolsUtils.lastools_executables() or frozenset()
+        if LastoolsUtils.has_wine() or isWindows():
+            return os.path.normcase(lastool + ".exe") in names, os.path.normcase(lastool + "64.exe") in names
+        return False, os.path.normcase(lastool + "64") in names
+
     @staticmethod
     def lastools_check_path():
         # check config path on plugin load and report problems to the main notification
         err = ""
         ltp = LastoolsUtils.lastools_path()
+        # called for every algorithm: report only once per configured path
+        if ltp == LastoolsUtils.checked_path:
+            return
+        LastoolsUtils.checked_path = ltp
         LastoolsUtils.debug(f"path={ltp}")
         if ltp == "":
             err = "No LAStools directory configured."
-        if not os.path.isdir(ltp):
+        if LastoolsUtils.lastools_executables() is None:
             err = f"LAStools directory [{ltp}] not found."
         # report
         if err != "":
@@ -85,19 +159,20 @@ class LastoolsUtils:
         return
 
     @staticmethod
-    def execute_command(commandline: str):
-        with subprocess.Popen(
-            commandline,
-            shell=False,
-            stdout=subprocess.PIPE,
-            stdin=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-            universal_newlines=False, ) as sub:
-          output = sub.communicate()[0]
-          out = ""
-          if isWindows():
-              out = output.decode("cp850", errors="replace")
-          else:
-              out = output.decode("utf-8", errors="replace")
-          returncode = sub.returncode
-        return returncode, out
+    def execute_command(commandline: str, feedback=None, console_file=None, label=""):
+        # run and stream the console output line by line into the feedback
+        process = LastoolsProcess(commandline, label, console_file)
+        returncode = process.run(feedback)
+        return returncode, process.severity, process.metrics
+
+    @staticmethod
+    def metrics_file():
+        return os.path.join(LastoolsUtils.profile_folder(), "metrics.jsonl")
+
+    @staticmethod
+    def log_metrics(record):
+        # one json line per LAStools invocation
+        with LastoolsUtils.metrics_lock:
+            os.makedirs(LastoolsUtils.profile_folder(), exist_ok=True)
+            with open(LastoolsUtils.metrics_file(), "a", encoding="utf-8") as log:
+                log.write(json.dumps(record) + "\n")
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    verbose.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import os
+import re
+
+# "... took 1.23 sec." and the like, the time of the phase described before it
+TOOK = re.compile(r"\btook\s+(\d+(?:\.\d*)?)\s*(?:seconds|second|secs|sec|s)\b", re.IGNORECASE)
+# "needed 4.56 sec for 'tile.laz'": the time of a whole file
+NEEDED = re.compile(r"\bneeded\s+(\d+(?:\.\d*)?)\s*(?:seconds|second|secs|sec|s)\s+for\b", re.IGNORECASE)
+# "total time 4.56 sec", "done in 4.56 sec": the time of the whole run, after the files of a multi-file run
+TOTAL = re.compile(
+    r"\b(?:needed|total time(?: of)?|done in)\s+(\d+(?:\.\d*)?)\s*(?:seconds|second|secs|sec|s)\b", re.IGNORECASE
+)
+MEMORY = re.compile(r"(\d+(?:\.\d*)?)\s*(KB|MB|GB)\b", re.IGNORECASE)
+MEMORY_UNITS = {"kb": 1.0 / 1024, "mb": 1.0, "gb": 1024.0}
+# parts of a phase description which differ from run to run
+VARIABLE = re.compile(r"'[^']*'|\"[^\"]*\"|\d+(?:\.\d*)?(?:e[+-]?\d+)?|\.\.\.|[()\[\],:;=]", re.IGNORECASE)
+
+
+class VerboseOutput:
+    """
+    Structured metrics from the verbose (-v) console output of a LAStools run, fed line by line.
+
+    The times of the phases ("... took 1.2 sec") are summed by phase, a phase is named by the
+    first of the PHASES matching its description (or by the description without its numbers
+    and file names). Of the counters (points read and written, tiles, ...) the maximum is kept,
+    the "file" counters are summed over the files: several lines of a file may report the same
+    points, a file ends with its "needed ... sec" line. The total time is the one of the run summary
+    ("total time ... sec"), without one the sum of the file times. Lines which do not match anything
+    are ignored, so a changed or unknown output costs the structured metrics only.
+
+    The subclasses add the phases and counters of a tool, see VERBOSE_OUTPUTS.
+    """
+
+    # (regular expression on the description of a phase, name of the phase), first match wins
+    PHASES = [
+        (r"spatial index|\blax\b|indexing", "indexing"),
+        (r"bounding box|\bbb\b", "bounding box"),
+        (r"\bsort", "sorting"),
+        (r"\bread|\bload", "reading"),
+        (r"\bwrit|\bsav|\bstor", "writing"),
+    ]
+    # (regular expression with the count as first group, name, "file" or "max")
+    COUNTERS = [
+        (r"\b(?:reading|read|loading|loaded)\s+(\d+)\s+(?:\w+\s+)?points", "points_read", "file"),
+        (r"\b(\d+)\s+points\s+(?:read|loaded)\b", "points_read", "file"),
+        (r"\b(?:writing|wrote|written|storing|stored)\s+(\d+)\s+(?:\w+\s+)?points", "points_written", "file"),
+        (r"\b(\d+)\s+points\s+(?:written|stored)\b", "points_written", "file"),
+    ]
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        # counters of the current file
+        self.file_counters = {}
+        # sum of the "needed ... sec for" lines, and the time of the run summary (None without one)
+        self.file_time = 0.0
+        self.run_time = None
+        self.memory_mb = None
+        # the last line describing what the tool does, the phase of a following bare "took ..." line
+        self.activity = ""
+        self.phase_patterns = [(re.compile(pattern, re.IGNORECASE), name) for pattern, name in self.PHASES]
+        self.counter_patterns = [
+            (re.compile(pattern, re.IGNORECASE), name, mode) for pattern, name, mode in self.COUNTERS
+        ]
+
+    def phase(self, description):
+        # without file names and numbers, and without a leading "lasground:"
+        description = " ".join(VARIABLE.sub(" ", re.sub(r"^\w+:\s", "", description)).lower().split())
+        for pattern, name in self.phase_patterns:
+            if pattern.search(description):
+                return name
+        return description
+
+    def count(self, name, value, mode):
+        counters = self.file_counters if mode == "file" else self.counters
+        counters[name] = max(counters.get(name, value), value)
+
+    def end_of_file(self):
+        for name, value in self.file_counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        self.file_counters = {}
+
+    def feed(self, line):
+        text = line.strip()
+        if not text:
+            return
+        for pattern, name, mode in self.counter_patterns:
+            match = pattern.search(text)
+            if match:
+                self.count(name, int(match.group(1)), mode)
+        if "memory" in text.lower():
+            match = MEMORY.search(text)
+            if match:
+                memory = float(match.group(1)) * MEMORY_UNITS[match.group(2).lower()]
+                self.memory_mb = max(self.memory_mb or 0.0, memory)
+        needed = NEEDED.search(text)
+        if needed:
+            self.file_time += float(needed.group(1))
+            self.end_of_file()
+            return
+        total = TOTAL.search(text)
+        if total:
+            self.run_time = max(self.run_time or 0.0, float(total.group(1)))
+            self.end_of_file()
+            return
+        took = TOOK.search(text)
+        if took is None:
+            self.activity = text
+            return
+        description = text[: took.start()]
+        if not re.search(r"[a-z]", description, re.IGNORECASE):
+            description = self.activity
+        name = self.phase(description) or "other"
+        seconds, count = self.phases.get(name, (0.0, 0))
+        self.phases[name] = (seconds + float(took.group(1)), count + 1)
+
+    def result(self):
+        """The metrics as dict: phases (name: seconds, count), the counters, total_time and memory_mb."""
+        self.end_of_file()
+        result = {
+            "phases": {
+                name: {"seconds": round(seconds, 3), "count": count} for name, (seconds, count) in self.phases.items()
+            }
+        }
+        result.update(self.counters)
+        total_time = self.run_time if self.run_time is not None else self.file_time
+        if total_time:
+            result["total_time"] = round(total_time, 3)
+        if self.memory_mb is not None:
+            result["memory_mb"] = self.memory_mb
+        return result
+
+
+class TinOutput(VerboseOutput):
+    # las2dem, blast2dem: the TIN of the points is rasterized
+    # raster output first: "rasterizing TIN to ... grid" is no TIN construction
+    PHASES = [
+        (r"rasteriz|raster|\bgrid|\bdem\b|\bimage|\bpixel", "raster output"),
+        (r"triangulat|\btin\b|delaunay", "TIN construction"),
+    ] + VerboseOutput.PHASES
+    COUNTERS = VerboseOutput.COUNTERS + [
+        (r"\b(\d+)\s+triangles\b", "triangles", "file"),
+        (r"\b(\d+)\s+(?:by|x)\s+\d+\s+(?:grid|raster|cells|pixels)", "raster_columns", "max"),
+    ]
+
+
+class GroundOutput(VerboseOutput):
+    # lasground, lasground_new: a TIN is refined from the lowest points
+    PHASES = [
+        (r"triangulat|\btin\b|delaunay", "TIN construction"),
+        (r"refin|densif|iteration|spike|bulge|offset", "TIN refinement"),
+        (r"classif|ground", "classification"),
+    ] + VerboseOutput.PHASES
+    COUNTERS = VerboseOutput.COUNTERS + [
+        (r"\b(\d+)\s+(?:points\s+)?(?:classified\s+)?as\s+ground\b", "ground_points", "file"),
+        (r"\b(\d+)\s+ground\s+points\b", "ground_points", "file"),
+    ]
+
+
+class HeightOutput(VerboseOutput):
+    # lasheight: heights above a TIN of the ground points
+    PHASES = [
+        (r"triangulat|\btin\b|delaunay", "TIN construction"),
+        (r"height|normaliz|replace_z", "height computation"),
+    ] + VerboseOutput.PHASES
+    COUNTERS = VerboseOutput.COUNTERS + [
+        (r"\b(\d+)\s+ground\s+points\b", "ground_points", "file"),
+    ]
+
+
+class ClassifyOutput(VerboseOutput):
+    # lasclassify: buildings and high vegetation from the points above the ground
+    PHASES = [
+        (r"planar|building|roof", "building detection"),
+        (r"tree|vegetation|rugged", "vegetation detection"),
+        (r"classif", "classification"),
+    ] + VerboseOutput.PHASES
+    COUNTERS = VerboseOutput.COUNTERS + [
+        (r"\b(\d+)\s+(?:points\s+)?(?:classified\s+)?as\s+building", "building_points", "file"),
+        (r"\b(\d+)\s+(?:points\s+)?(?:classified\s+)?as\s+(?:high\s+)?vegetation", "vegetation_points", "file"),
+    ]
+
+
+class TilingOutput(VerboseOutput):
+    # lastile: a counting pass over the points, then the tiles are written
+    PHASES = [
+        (r"first pass|counting|bounding box", "counting"),
+        (r"second pass|tiling|\btile", "tiling"),
+    ] + VerboseOutput.PHASES
+    COUNTERS = VerboseOutput.COUNTERS + [
+        (r"\b(\d+)\s+(?:\w+\s+)?tiles\b", "tiles", "max"),
+        (r"\b(?:created|creating|wrote|writing)\s+(\d+)\s+(?:\w+\s+)?tiles\b", "tiles", "max"),
+    ]
+
+
+# the parser of the verbose output by tool (name without 64 and extension), VerboseOutput for all others
+VERBOSE_OUTPUTS = {
+    "las2dem": TinOutput,
+    "blast2dem": TinOutput,
+    "lasground": GroundOutput,
+    "lasground_new": GroundOutput,
+    "lasheight": HeightOutput,
+    "lasclassify": ClassifyOutput,
+    "lastile": TilingOutput,
+}
+
+
+def verbose_tool(commandline):
+    # the tool of a command line (possibly behind wine), "" if there is none
+    for arg in commandline.split():
+        name = os.path.splitext(os.path.basename(arg.strip('"').replace("\\", "/")))[0].lower()
+        if name.endswith("64"):
+            name = name[:-2]
+        if name.startswith(("las", "blast", "txt2las", "shp2las", "e572las", "demzip", "hugefile")):
+            return name
+    return ""
+
+
+def verbose_output(commandline):
+    """A fresh parser for the verbose output of the tool of the command line."""
+    return VERBOSE_OUTPUTS.get(verbose_tool(commandline), VerboseOutput)()
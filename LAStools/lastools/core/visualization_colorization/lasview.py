@@ -72,7 +72,7 @@ class LasView(LastoolsAlgorithm):
             commands.append("-win " + self.SIZES[size])
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"commands": commands}
+        return self.results(commands)
 
     def createInstance(self):
         return LasView()
@@ -151,7 +151,7 @@ class LasViewPro(LastoolsAlgorithm):
             commands.append("-win " + LasViewPro.SIZES[size])
         self.add_parameters_additional_commands(parameters, context, commands)
         self.run_lastools(commands, feedback)
-        return {"": None}
+        return self.results(commands)
 
     def createInstance(self):
         return LasViewPro()
@@ -22,115 +22,9 @@ __copyright__ = "(c) 2025, rapidlasso GmbH"
 from processing.core.ProcessingConfig import ProcessingConfig, Setting
 from qgis.core import QgsProcessingProvider
 from qgis.PyQt.QtGui import QIcon
-from .lastools.core.utils import LastoolsUtils
-
-from .lastools.core.classification_filtering import (
-    LasClassify,
-    LasClassifyPro,
-    LasGround,
-    LasGroundNew,
-    LasGroundPro,
-    LasGroundProNew,
-    LasThin,
-    LasThinPro,
-    LasThin3d,
-    LasThin3dPro,
-)
-from .lastools.core.data_compression import LasZip, LasZipPro
-from .lastools.core.data_convert import (
-    Las2LasFilter,
-    Las2LasProFilter,
-    Las2LasProject,
-    Las2LasProProject,
-    Las2LasProTransform,
-    Las2LasTransform,
-    Las2Shp,
-    Las2txt,
-    Las2txtPro,
-    Shp2Las,
-    Txt2Las,
-    Txt2LasPro,
-    e572las,
-)
-from .lastools.core.dsm_dtm_generation_prodctions import (
-    Blast2Dem,
-    Blast2DemPro,
-    Blast2Iso,
-    Blast2IsoPro,
-    Las2Dem,
-    Las2DemPro,
-    Las2DemNew,
-    Las2DemNewPro,
-    Las2Iso,
-    LasCanopy,
-    LasCanopyPro,
-    LasGrid,
-    LasGridPro,
-    LasHeight,
-    LasHeightClassify,
-    LasHeightPro,
-    LasHeightProClassify,
-    LasPlanes,
-    LasVoxel,
-)
-from .lastools.core.pipelines import (
-    FlightLinesToCHMFirstReturn,
-    FlightLinesToCHMHighestReturn,
-    FlightLinesToCHMSpikeFree,
-    FlightLinesToDTMandDSMFirstReturn,
-    FlightLinesToDTMandDSMSpikeFree,
-    FlightLinesToMergedCHMFirstReturn,
-    FlightLinesToMergedCHMHighestReturn,
-    FlightLinesToMergedCHMPitFree,
-    FlightLinesToMergedCHMSpikeFree,
-    HugeFileClassify,
-    HugeFileGroundClassify,
-    HugeFileNormalize,
-)
-from .lastools.core.processing import (
-    Las3dPolyHorizontalVerticalDistance,
-    Las3dPolyRadialDistance,
-    LasBoundary,
-    LasBoundaryPro,
-    LasClip,
-    LasCopy,
-    LasDiff,
-    LasDistance,
-    LasDuplicate,
-    LasDuplicatePro,
-    LasIndex,
-    LasIndexPro,
-    LasIntensity,
-    LasIntensityAttenuationFactor,
-    LasMerge,
-    LasMergePro,
-    LasNoise,
-    LasNoisePro,
-    LasOverage,
-    LasOveragePro,
-    LasPrecision,
-    LasSort,
-    LasSortPro,
-    LasSplit,
-    LasTile,
-    LasTilePro,
-)
-from .lastools.core.publishing import LasPublish, LasPublishPro
-from .lastools.core.quality_control_information import (
-    LasControl,
-    LasInfo,
-    LasInfoPro,
-    LasOptimize,
-    LasOverlap,
-    LasOverlapPro,
-    LasProbe,
-    LasReturn,
-    LasReturnPro,
-    LasValidate,
-    LasValidatePro,
-)
-from .lastools.core.utils import paths
-from .lastools.core.visualization_colorization import LasColor, LasView, LasViewPro
+from .lastools.core.algo import LastoolsAlgorithmStub
+from .lastools.core.registry import algorithms
+from .lastools.core.utils import LastoolsUtils, paths
 
 
 class LAStoolsProvider(QgsProcessingProvider):
@@ -148,6 +42,33 @@ class LAStoolsProvider(QgsProcessingProvider):
             Setting(self.name(), "LASTOOLS_FOLDER", "LAStools folder", "C:/LAStools", valuetype=Setting.FOLDER)
         )
         ProcessingConfig.addSetting(Setting(self.name(), "WINE_FOLDER", "Wine folder", "", valuetype=Setting.FOLDER))
+        ProcessingConfig.addSetting(
+            Setting(self.name(), "LASTOOLS_CACHE_ACTIVATED", "Cache results of identical commands", False)
+        )
+        ProcessingConfig.addSetting(
+            Setting(
+                self.name(),
+                "LASTOOLS_CACHE_FOLDER",
+                "Cache folder (empty: profile folder)",
+                "",
+                valuetype=Setting.FOLDER,
+            )
+        )
+        ProcessingConfig.addSetting(
+            Setting(self.name(), "LASTOOLS_CACHE_SIZE", "Cache size [MB]", 4096, valuetype=Setting.INT)
+        )
+        ProcessingConfig.addSetting(
+            Setting(self.name(), "LASTOOLS_CACHE_XXHASH", "Cache: identify inputs by xxhash (needs xxhash)", False)
+        )
+        ProcessingConfig.addSetting(
+            Setting(
+                self.name(),
+                "LASTOOLS_SCRATCH_FOLDER",
+                "Scratch folder of automatic temporary directories (empty: system temp folder)",
+                "",
+                valuetype=Setting.FOLDER,
+            )
+        )
         ProcessingConfig.readSettings()
         LastoolsUtils.lastools_check_path()
         self.refreshAlgorithms()
@@ -161,6 +82,11 @@ class LAStoolsProvider(QgsProcessingProvider):
         ProcessingConfig.removeSetting("LASTOOLS_ACTIVATED")
         ProcessingConfig.removeSetting("LASTOOLS_FOLDER")
         ProcessingConfig.removeSetting("WINE_FOLDER")
+        ProcessingConfig.removeSetting("LASTOOLS_CACHE_ACTIVATED")
+        ProcessingConfig.removeSetting("LASTOOLS_CACHE_FOLDER")
+        ProcessingConfig.removeSetting("LASTOOLS_CACHE_SIZE")
+        ProcessingConfig.removeSetting("LASTOOLS_CACHE_XXHASH")
+        ProcessingConfig.removeSetting("LASTOOLS_SCRATCH_FOLDER")
         pass
 
     def isActive(self):
@@ -174,139 +100,8 @@ class LAStoolsProvider(QgsProcessingProvider):
         """
         Loads all algorithms belonging to this provider.
         """
-        processing_algorithms = [
-            LasIndex(),
-            LasIndexPro(),
-            LasMerge(),
-            LasMergePro(),
-            LasOverage(),
-            LasOveragePro(),
-            LasBoundary(),
-            LasBoundaryPro(),
-            LasClip(),
-            LasTile(),
-            LasTilePro(),
-            LasSplit(),
-            LasSort(),
-            LasSortPro(),
-            LasDuplicate(),
-            LasDuplicatePro(),
-            LasPrecision(),
-            LasNoise(),
-            LasNoisePro(),
-            LasDiff(),
-            LasDistance(),
-            LasCopy(),
-            Las3dPolyRadialDistance(),
-            Las3dPolyHorizontalVerticalDistance(),
-            LasIntensity(),
-            LasIntensityAttenuationFactor(),
-        ]
-        self.algos = processing_algorithms
-
-        data_convert_algorithms = [
-            Las2txt(),
-            Las2txtPro(),
-            Txt2Las(),
-            Txt2LasPro(),
-            Las2LasFilter(),
-            Las2LasProFilter(),
-            Las2LasProject(),
-            Las2LasProProject(),
-            Las2LasTransform(),
-            Las2LasProTransform(),
-            Las2Shp(),
-            Shp2Las(),
-            e572las(),
-        ]
-        self.algos.extend(data_convert_algorithms)
-
-        classification_filtering_algorithms = [
-            LasGround(),
-            LasGroundPro(),
-            LasGroundNew(),
-            LasGroundProNew(),
-            LasClassify(),
-            LasClassifyPro(),
-            LasThin(),
-            LasThinPro(),
-            LasThin3d(),
-            LasThin3dPro(),
-        ]
-        self.algos.extend(classification_filtering_algorithms)
-
-        data_compression_algorithms = [
-            LasZip(),
-            LasZipPro(),
-        ]
-        self.algos.extend(data_compression_algorithms)
-
-        dsm_dtm_generation_productions_algorithms = [
-            Las2Dem(),
-            Las2DemPro(),
-            Las2DemNew(),
-            Las2DemNewPro(),
-            Las2Iso(),
-            LasPlanes(),
-            LasGrid(),
-            LasGridPro(),
-            LasHeight(),
-            LasHeightClassify(),
-            LasHeightPro(),
-            LasHeightProClassify(),
-            LasCanopy(),
-            LasCanopyPro(),
-            LasVoxel(),
-            Blast2Dem(),
-            Blast2DemPro(),
-            Blast2Iso(),
-            Blast2IsoPro(),
-        ]
-        self.algos.extend(dsm_dtm_generation_productions_algorithms)
-
-        publishing_algorithms = [
-            LasPublish(),
-            LasPublishPro(),
-        ]
-        self.algos.extend(publishing_algorithms)
-
-        quality_control_information_algorithms = [
-            LasInfo(),
-            LasInfoPro(),
-            LasOverlap(),
-            LasOverlapPro(),
-            LasControl(),
-            LasProbe(),
-            LasReturn(),
-            LasReturnPro(),
-            LasValidate(),
-            LasValidatePro(),
-            LasOptimize(),
-        ]
-        self.algos.extend(quality_control_information_algorithms)
-
-        visualization_colorization_algorithms = [
-            LasView(),
-            LasViewPro(),
-            LasColor(),
-        ]
-        self.algos.extend(visualization_colorization_algorithms)
-
-        pipelines_algorithms = [
-            FlightLinesToCHMFirstReturn(),
-            FlightLinesToCHMHighestReturn(),
-            FlightLinesToCHMSpikeFree(),
-            FlightLinesToDTMandDSMFirstReturn(),
-            FlightLinesToDTMandDSMSpikeFree(),
-            FlightLinesToMergedCHMFirstReturn(),
-            FlightLinesToMergedCHMHighestReturn(),
-            FlightLinesToMergedCHMPitFree(),
-            FlightLinesToMergedCHMSpikeFree(),
-            HugeFileClassify(),
-            HugeFileGroundClassify(),
-            HugeFileNormalize(),
-        ]
-        self.algos.extend(pipelines_algorithms)
+        # stubs only, the modules of the algorithms are imported on first use
+        self.algos = [LastoolsAlgorithmStub(*entry) for entry in algorithms]
 
         for algorithm in self.algos:
             self.addAlgorithm(algorithm)
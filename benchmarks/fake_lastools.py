@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    fake_lastools.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Stand-in for a LAStools executable, see overhead.py. It understands the input and output
+options of LAStools (-i, -lof, -o, -odir, -odix, -ocut, -olaz, -obil, ..., -cores, -merged),
+works on every input file for the configured time and writes its outputs with the configured
+size: lastile writes tiles, a BIL output gets a .hdr and a .blw, so the next pipeline stage
+(and the mosaic) finds what it expects.
+
+The behaviour is read from the JSON file in LASTOOLS_FAKE_CONFIG, "default" for all tools
+and the tool name (e.g. "lasground") for the values of a single tool, see DEFAULTS. A run is
+appended as JSON line to the file in LASTOOLS_FAKE_LOG (when set), with the time the script
+started and ended and the time it worked.
+"""
+
+import time
+
+ENTERED = time.time()
+
+import glob  # noqa: E402
+import json  # noqa: E402
+import math  # noqa: E402
+import os  # noqa: E402
+import re  # noqa: E402
+import sys  # noqa: E402
+
+DEFAULTS = {
+    # seconds slept per input file
+    "sleep": 0.0,
+    # cpu seconds burnt per input file
+    "cpu": 0.0,
+    # MB allocated (and touched) while running
+    "memory": 0,
+    # bytes written per output file
+    "output_bytes": 4096,
+    # console lines per input file
+    "lines": 5,
+    # 'WARNING:' and 'ERROR:' lines at the end
+    "warnings": 0,
+    "errors": 0,
+    "returncode": 0,
+    # tiles written by lastile
+    "tiles": 4,
+}
+# formats of the -o<format> options
+FORMATS = "laz las bin qi txt csv tif bil asc img png jpg xyz shp wkt kml".split()
+TILING_TOOLS = ["lastile"]
+
+
+def tool_name(executable):
+    name = os.path.splitext(os.path.basename(executable))[0]
+    return name[:-2] if name.endswith("64") else name
+
+
+def load_config(tool):
+    config = dict(DEFAULTS)
+    file = os.environ.get("LASTOOLS_FAKE_CONFIG")
+    if file:
+        with open(file, encoding="utf-8") as data:
+            values = json.load(data)
+        config.update(values.get("default", {}))
+        config.update(values.get(tool, {}))
+    return config
+
+
+def parse(args):
+    options = {"inputs": [], "output": None, "odir": None, "odix": "", "ocut": 0, "format": None, "cores": 1}
+    flags = set()
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        value = args[i + 1].strip('"') if i + 1 < len(args) else None
+        if arg == "-i" and value is not None:
+            files = sorted(glob.glob(value))
+            options["inputs"].extend(files if files else [value])
+            i += 1
+        elif arg == "-lof" and value is not None:
+            with open(value, encoding="utf-8") as data:
+                options["inputs"].extend(line.strip() for line in data if line.strip())
+            i += 1
+        elif arg in ("-o", "-odir", "-odix") and value is not None:
+            options[arg[1:] if arg != "-o" else "output"] = value
+            i += 1
+        elif arg in ("-ocut", "-cores") and value is not None:
+            options[arg[1:]] = int(value)
+            i += 1
+        elif arg == "-step" and value is not None:
+            options["step"] = float(value)
+            i += 1
+        elif arg.startswith("-o") and arg[2:] in FORMATS:
+            options["format"] = arg[2:]
+        else:
+            flags.add(arg)
+        i += 1
+    options["merged"] = "-merged" in flags
+    return options
+
+
+def outputs(tool, options, config):
+    inputs = options["inputs"]
+    output = options["output"]
+    if output is not None and options["odir"] and not os.path.isabs(output):
+        output = os.path.join(options["odir"], output)
+    if tool in TILING_TOOLS:
+        base, extension = os.path.splitext(output or os.path.join(options["odir"] or ".", "tile"))
+        extension = "." + options["format"] if options["format"] else extension or ".laz"
+        side = math.ceil(math.sqrt(config["tiles"]))
+        return [f"{base}_{1000 * (i % side)}_{1000 * (i // side)}{extension}" for i in range(config["tiles"])]
+    if output is not None:
+        return [output]
+    if not (options["odir"] or options["odix"] or options["format"]):
+        # e.g. lasinfo or lasindex: nothing written
+        return []
+    files = []
+    for file in inputs:
+        stem, extension = os.path.splitext(os.path.basename(file))
+        if options["ocut"]:
+            stem = stem[: -options["ocut"]]
+        extension = "." + options["format"] if options["format"] else extension
+        files.append(os.path.join(options["odir"] or os.path.dirname(file), stem + options["odix"] + extension))
+    return files
+
+
+def write_output(file, size, step):
+    os.makedirs(os.path.dirname(os.path.abspath(file)), exist_ok=True)
+    base, extension = os.path.splitext(file)
+    if extension.lower() == ".bil":
+        # square float raster of about the size, placed by the coordinates in the name (tile_1000_2000)
+        columns = max(1, int(math.sqrt(size / 4)))
+        size = columns * columns * 4
+        numbers = [int(number) for number in re.findall(r"\d+", os.path.basename(base))[-2:]]
+        x, y = numbers if len(numbers) == 2 else (0, 0)
+        with open(base + ".hdr", "w", encoding="ascii") as out:
+            out.write(f"nrows {columns}\nncols {columns}\nnbands 1\nnbits 32\npixeltype float\nbyteorder I\n")
+            out.write("layout bil\nnodata -9999\n")
+        with open(base + ".blw", "w", encoding="ascii") as out:
+            out.write(f"{step}\n0\n0\n{-step}\n{x + step / 2}\n{y + (columns - 0.5) * step}\n")
+    with open(file, "wb") as out:
+        out.write(bytes(size))
+    return size
+
+
+def work(config):
+    if config["sleep"] > 0:
+        time.sleep(config["sleep"])
+    end = time.process_time() + config["cpu"]
+    while time.process_time() < end:
+        sum(i * i for i in range(10000))
+
+
+def main():
+    tool = tool_name(sys.argv[0])
+    config = load_config(tool)
+    options = parse(sys.argv[1:])
+    started = time.time()
+    memory = bytearray(int(config["memory"] * 1024 * 1024))
+    # touched, so it is resident
+    for i in range(0, len(memory), 4096):
+        memory[i] = 1
+    units = options["inputs"] or ["stdin"]
+    # -cores runs the files in rounds of cores files, a merged run reads all files in one process
+    cores = 1 if options["merged"] or tool in TILING_TOOLS else max(1, options["cores"])
+    for round_start in range(0, len(units), cores):
+        work(config)
+        for file in units[round_start : round_start + cores]:
+            for line in range(config["lines"]):
+                print(f"{tool}: {os.path.basename(file)} line {line + 1} of {config['lines']}", flush=True)
+    written = 0
+    files = outputs(tool, options, config)
+    for file in files:
+        written += write_output(file, config["output_bytes"], options.get("step", 1.0))
+    for i in range(config["warnings"]):
+        print(f"WARNING: fake warning {i + 1} of {tool}", flush=True)
+    for i in range(config["errors"]):
+        print(f"ERROR: fake error {i + 1} of {tool}", flush=True)
+    del memory
+    exited = time.time()
+    if os.environ.get("LASTOOLS_FAKE_LOG"):
+        record = {
+            "tool": tool,
+            "argv": sys.argv,
+            "entered": ENTERED,
+            "started": started,
+            "exited": exited,
+            "work": exited - started,
+            "inputs": len(options["inputs"]),
+            "outputs": len(files),
+            "output_bytes": written,
+        }
+        # one short line per append, concurrent runs do not interleave
+        with open(os.environ["LASTOOLS_FAKE_LOG"], "a", encoding="utf-8") as log:
+            log.write(json.dumps(record) + "\n")
+    return config["returncode"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    overhead.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Runs the algorithms and pipelines of the provider in a headless QGIS against stand-ins
+for the LAStools executables and reports the makespan and the overhead of the plugin.
+
+    python benchmarks/overhead.py [--algorithms Las2DemPro FlightLinesToCHMFirstReturn]
+                                  [--cores 1 4] [--per-file] [--per-tile] [--sleep 0.1]
+
+The stand-ins (fake_lastools.py) sleep, burn cpu, allocate memory, print console lines and
+write outputs as configured, so the numbers are the ones of the plugin alone: the overhead
+of a run is its wall time in the plugin minus the time the stand-in worked, "outside runs"
+is the time of the algorithm no run was going on (parameters, command lines, scheduling).
+"spawn" is the overhead of a bare subprocess.run() of a stand-in, for comparison.
+The strategies (cores, per file, per tile) can be compared on the same stand-ins.
+
+Everything runs in a temporary QGIS profile, the settings of the user are not touched.
+POSIX only (the stand-ins are python scripts), needs the QGIS python bindings.
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import argparse
+import glob
+import json
+import os
+import re
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE = os.path.join(REPO, "benchmarks", "fake_lastools.py")
+# executable of a stand-in
+WRAPPER = """#!{python}
+import sys
+sys.path.insert(0, {folder!r})
+import fake_lastools
+sys.exit(fake_lastools.main())
+"""
+
+
+def lastools_names():
+    # the tools of the algorithms and of the pipeline stages
+    sys.path.insert(0, REPO)
+    from LAStools.lastools.core.registry import algorithms
+
+    names = {lastool for _, lastool, _, _, _, _ in algorithms}
+    for module in glob.glob(os.path.join(REPO, "LAStools", "lastools", "core", "pipelines", "*.py")):
+        with open(module, encoding="utf-8") as source:
+            names.update(re.findall(r'lastool_command\("(\w+)"\)', source.read()))
+    return sorted(names)
+
+
+def write_bin(folder):
+    # '<tool>64' as LAStools has it on linux, and a license file: no demo mode
+    os.makedirs(folder, exist_ok=True)
+    for name in lastools_names():
+        executable = os.path.join(folder, name + "64")
+        with open(executable, "w", encoding="utf-8") as out:
+            out.write(WRAPPER.format(python=sys.executable, folder=os.path.dirname(FAKE)))
+        os.chmod(executable, 0o755)
+    with open(os.path.join(folder, "lastoolslicense.txt"), "w", encoding="utf-8") as out:
+        out.write("stand-ins of the overhead benchmark\n")
+
+
+def write_inputs(folder, files, points):
+    # overlapping flight lines of a synthetic scene, as .laz and .las (the wildcards of the algorithms differ)
+    sys.path.insert(0, REPO)
+    from LAStools.lastools.core.io import SyntheticLas
+
+    os.makedirs(folder, exist_ok=True)
+    scene = SyntheticLas((0.0, 0.0, 2000.0, 2000.0), points * files / 2000.0**2, files, seed=files)
+    for i in range(files):
+        file = os.path.join(folder, f"flightline_{i + 1:02d}.las")
+        scene.write(file, lines=[i])
+        shutil.copyfile(file, file[:-4] + ".laz")
+
+
+def input_file(folder, extension):
+    # single input file of a parameter, by its extension or the first one of its file filter
+    match = re.search(r"\*\.(\w+)", extension)
+    extension = match.group(1) if match else extension or "laz"
+    file = os.path.join(folder, f"input.{extension}")
+    if not os.path.exists(file):
+        if extension in ("las", "laz"):
+            shutil.copyfile(os.path.join(folder, "flightline_01.las"), file)
+        else:
+            with open(file, "w", encoding="utf-8") as out:
+                out.write("0 0 0\n")
+    return file
+
+
+def measure_spawn(folder, runs=5):
+    # overhead of a bare subprocess.run() of a stand-in without console output
+    config = os.path.join(folder, "spawn.json")
+    with open(config, "w", encoding="utf-8") as out:
+        json.dump({"default": {"lines": 0}}, out)
+    log = os.path.join(folder, "spawn.jsonl")
+    env = dict(os.environ, LASTOOLS_FAKE_CONFIG=config, LASTOOLS_FAKE_LOG=log)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([os.path.join(folder, "bin", "lasinfo64")], check=True, env=env, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    with open(log, encoding="utf-8") as records:
+        work = [json.loads(line)["work"] for line in records]
+    return statistics.median(wall - worked for wall, worked in zip(times, work))
+
+
+def read_log(file, position):
+    # the runs of the stand-ins appended since position
+    if not os.path.exists(file):
+        return [], position
+    with open(file, encoding="utf-8") as log:
+        log.seek(position)
+        lines = log.readlines()
+        return [json.loads(line) for line in lines if line.endswith("\n")], log.tell()
+
+
+def busy_time(intervals):
+    # length of the union of the intervals
+    total = 0.0
+    end = None
+    for start, stop in sorted(intervals):
+        if end is None or start > end:
+            total += stop - start
+            end = stop
+        elif stop > end:
+            total += stop - end
+            end = stop
+    return total
+
+
+def evaluate(records, fakes, makespan, spawn):
+    """
+    Matches the metrics of the runs with the runs of the stand-ins.
+    Returns the stages, the overheads of all runs and the time outside runs.
+    """
+    pending = list(fakes)
+    stages = {}
+    overheads = []
+    intervals = []
+    in_process = 0.0
+    for record in records:
+        tool = record["tool"]
+        tool = tool[:-2] if tool.endswith("64") else tool
+        stage = stages.setdefault(tool, {"runs": 0, "wall": 0.0, "work": 0.0, "overheads": []})
+        stage["runs"] += 1
+        wall = record.get("wall_time", 0.0)
+        stage["wall"] += wall
+        try:
+            argv = shlex.split(record["command"])
+        except ValueError:
+            argv = None
+        fake = next((fake for fake in pending if fake["argv"] == argv), None)
+        if fake is None:
+            # in process (e.g. the mosaic) or not run (cached, failed before the start)
+            stage["work"] += wall
+            in_process += wall
+            continue
+        pending.remove(fake)
+        stage["work"] += fake["work"]
+        stage["overheads"].append(wall - fake["work"])
+        overheads.append(wall - fake["work"])
+        intervals.append((fake["exited"] - wall, fake["exited"]))
+    for stage in stages.values():
+        runs = stage.pop("overheads")
+        stage["overhead"] = statistics.median(runs) if runs else None
+        stage["overhead_max"] = max(runs) if runs else None
+        stage["plugin"] = stage["overhead"] - spawn if runs else None
+    return stages, overheads, max(0.0, makespan - busy_time(intervals) - in_process)
+
+
+def milliseconds(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:8.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[1], formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--algorithms", nargs="*", help="names of the algorithms (default: all)")
+    parser.add_argument("--cores", nargs="+", type=int, default=[1, 4], help="cores of the runs to compare")
+    parser.add_argument("--per-file", action="store_true", help="also run one process per file where possible")
+    parser.add_argument("--per-tile", action="store_true", help="also run the pipelines tile by tile")
+    parser.add_argument("--files", type=int, default=8, help="input flight lines")
+    parser.add_argument("--points", type=int, default=10000, help="points per input file")
+    parser.add_argument("--sleep", type=float, default=0.05, help="seconds the stand-ins sleep per input file")
+    parser.add_argument("--cpu", type=float, default=0.0, help="cpu seconds the stand-ins burn per input file")
+    parser.add_argument("--memory", type=float, default=0, help="MB the stand-ins allocate")
+    parser.add_argument("--output-bytes", type=int, default=4096, help="bytes per output file of the stand-ins")
+    parser.add_argument("--lines", type=int, default=5, help="console lines per input file of the stand-ins")
+    parser.add_argument("--warnings", type=int, default=0, help="'WARNING:' lines per run of the stand-ins")
+    parser.add_argument("--errors", type=int, default=0, help="'ERROR:' lines per run of the stand-ins")
+    parser.add_argument("--tiles", type=int, default=4, help="tiles written by the lastile stand-in")
+    parser.add_argument("--config", help='JSON file with values of single tools, e.g. {"lasground": {"cpu": 0.5}}')
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--keep", action="store_true", help="keep the working directory")
+    args = parser.parse_args()
+    if os.name == "nt":
+        sys.exit("the stand-ins are python scripts, which windows does not run as LAStools executables")
+
+    work = tempfile.mkdtemp(prefix="lastools_overhead_")
+    config = {
+        "default": {
+            "sleep": args.sleep,
+            "cpu": args.cpu,
+            "memory": args.memory,
+            "output_bytes": args.output_bytes,
+            "lines": args.lines,
+            "warnings": args.warnings,
+            "errors": args.errors,
+            "tiles": args.tiles,
+        }
+    }
+    if args.config:
+        with open(args.config, encoding="utf-8") as data:
+            for tool, values in json.load(data).items():
+                config.setdefault(tool, {}).update(values)
+    with open(os.path.join(work, "config.json"), "w", encoding="utf-8") as out:
+        json.dump(config, out)
+    log = os.path.join(work, "runs.jsonl")
+    inputs = os.path.join(work, "input")
+    write_bin(os.path.join(work, "bin"))
+    write_inputs(inputs, args.files, args.points)
+    # inherited by the stand-ins; the QGIS profile of the benchmark is a new one
+    os.environ.update(
+        LASTOOLS_FAKE_CONFIG=os.path.join(work, "config.json"),
+        LASTOOLS_FAKE_LOG=log,
+        QGIS_CUSTOM_CONFIG_PATH=os.path.join(work, "profile"),
+        QT_QPA_PLATFORM="offscreen",
+    )
+    spawn = measure_spawn(work)
+
+    from qgis.core import (
+        QgsApplication,
+        QgsProcessingContext,
+        QgsProcessingFeedback,
+        QgsProcessingParameterFile,
+        QgsProcessingParameterFileDestination,
+        QgsProcessingParameterFolderDestination,
+        QgsProject,
+    )
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    sys.path.append(os.path.join(QgsApplication.pkgDataPath(), "python", "plugins"))
+    from processing.core.Processing import Processing
+    from processing.core.ProcessingConfig import ProcessingConfig
+
+    Processing.initialize()
+    from LAStools.lastools.core.algo import LastoolsAlgorithm
+    from LAStools.lastools_provider import LAStoolsProvider
+
+    provider = LAStoolsProvider()
+    QgsApplication.processingRegistry().addProvider(provider)
+    ProcessingConfig.setSettingValue("LASTOOLS_FOLDER", os.path.join(work, "bin"))
+    ProcessingConfig.setSettingValue("LASTOOLS_CACHE_ACTIVATED", False)
+    ProcessingConfig.setSettingValue("LASTOOLS_SCRATCH_FOLDER", os.path.join(work, "scratch"))
+
+    class Feedback(QgsProcessingFeedback):
+        # counts the messages instead of showing them, keeps the errors
+        def __init__(self):
+            super().__init__()
+            self.messages = 0
+            self.errors = []
+
+        def pushInfo(self, info):
+            self.messages += 1
+
+        pushConsoleInfo = pushCommandInfo = pushDebugInfo = pushWarning = setProgressText = pushInfo
+
+        def reportError(self, error, fatalError=False):
+            self.messages += 1
+            self.errors.append(error)
+
+    stubs = {stub.name(): stub for stub in provider.algorithms()}
+    names = args.algorithms or list(stubs)
+    unknown = [name for name in names if name not in stubs]
+    if unknown:
+        sys.exit(f"unknown algorithms: {' '.join(unknown)}")
+
+    def parameters(algorithm, output):
+        values = {}
+        for definition in algorithm.parameterDefinitions():
+            name = definition.name()
+            if name == LastoolsAlgorithm.TEMPORARY_DIRECTORY:
+                # managed by the pipeline
+                continue
+            if isinstance(definition, QgsProcessingParameterFile):
+                if definition.behavior() == QgsProcessingParameterFile.Folder:
+                    values[name] = inputs
+                else:
+                    values[name] = input_file(inputs, definition.extension() or definition.fileFilter())
+            elif isinstance(definition, QgsProcessingParameterFolderDestination):
+                values[name] = os.path.join(output, name.lower())
+                os.makedirs(values[name], exist_ok=True)
+            elif isinstance(definition, QgsProcessingParameterFileDestination):
+                values[name] = os.path.join(output, f"{name.lower()}.{definition.defaultFileExtension()}")
+        return values
+
+    def strategies(algorithm):
+        names = {definition.name() for definition in algorithm.parameterDefinitions()}
+        for cores in args.cores if LastoolsAlgorithm.CORES in names else [None]:
+            label = f"{cores} cores" if cores else "-"
+            values = {LastoolsAlgorithm.CORES: cores} if cores else {}
+            yield label, values
+            if args.per_file and LastoolsAlgorithm.PER_FILE in names:
+                yield f"{label} per file", dict(values, **{LastoolsAlgorithm.PER_FILE: True})
+            if args.per_tile and LastoolsAlgorithm.PER_TILE in names:
+                yield f"{label} per tile", dict(values, **{LastoolsAlgorithm.PER_TILE: True})
+
+    print(f"{len(names)} algorithms, stand-ins in {work}, spawn of a stand-in {milliseconds(spawn).strip()}")
+    print(
+        f"{'algorithm':40} {'strategy':18} {'runs':>5} {'makespan':>11} {'work':>11} "
+        f"{'overhead/run':>12} {'plugin/run':>11} {'outside runs':>12}  status"
+    )
+    position = 0
+    results = []
+    for name in names:
+        algorithm = stubs[name].create()
+        for label, values in strategies(algorithm):
+            # a new instance per run, as processing does
+            algorithm = stubs[name].create()
+            output = os.path.join(work, "output", name, label.replace(" ", "_"))
+            values.update(parameters(algorithm, output))
+            context = QgsProcessingContext()
+            context.setProject(QgsProject.instance())
+            feedback = Feedback()
+            _, position = read_log(log, position)
+            start = time.perf_counter()
+            ok, status = algorithm.checkParameterValues(values, context)
+            if not ok:
+                status = f"invalid parameters: {status}"
+            else:
+                try:
+                    if algorithm.prepare(values, context, feedback):
+                        algorithm.runPrepared(values, context, feedback)
+                    status = feedback.errors[0] if feedback.errors else "ok"
+                except Exception as e:
+                    status = f"failed: {e}"
+            makespan = time.perf_counter() - start
+            fakes, position = read_log(log, position)
+            stages, overheads, outside = evaluate(algorithm.run_metrics, fakes, makespan, spawn)
+            runs = sum(stage["runs"] for stage in stages.values())
+            work_time = sum(stage["work"] for stage in stages.values())
+            overhead = statistics.median(overheads) if overheads else None
+            plugin = overhead - spawn if overheads else None
+            status = status.splitlines()[0][:60] if status else "ok"
+            print(
+                f"{name:40} {label:18} {runs:5d} {makespan:9.3f} s {work_time:9.3f} s "
+                f"{milliseconds(overhead):>12} {milliseconds(plugin):>11} {milliseconds(outside):>12}  {status}"
+            )
+            if len(stages) > 1:
+                for tool, stage in stages.items():
+                    print(
+                        f"  {tool:38} {'':18} {stage['runs']:5d} {stage['wall']:9.3f} s {stage['work']:9.3f} s "
+                        f"{milliseconds(stage['overhead']):>12} {milliseconds(stage['plugin']):>11}"
+                    )
+            results.append(
+                {
+                    "algorithm": name,
+                    "strategy": label,
+                    "status": status,
+                    "makespan": makespan,
+                    "work": work_time,
+                    "outside_runs": outside,
+                    "feedback_messages": feedback.messages,
+                    "stages": stages,
+                }
+            )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump({"spawn": spawn, "config": config, "results": results}, out, indent=1)
+    QgsApplication.processingRegistry().removeProvider(provider)
+    app.exitQgis()
+    if not args.keep:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
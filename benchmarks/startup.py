@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************************************************
+    startup.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (c) 2026 by rapidlasso GmbH
+    Email                : info near rapidlasso point de
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Measures the load time of the LAStools provider in a headless QGIS.
+
+    python benchmarks/startup.py [--runs 5]
+
+"lazy" registers the algorithm stubs (what the provider does), "eager" imports
+all algorithm modules and creates and initializes every algorithm, as the provider
+did before the stubs. Every run is a fresh python process, so nothing is imported yet.
+The eager runs also check the registry against the algorithm classes (see check_registry)
+and fail on a difference.
+Needs the QGIS python bindings, e.g. run it from the OSGeo4W shell or set PYTHONPATH.
+"""
+
+__author__ = "rapidlasso"
+__date__ = "October 2026"
+__copyright__ = "(c) 2026, rapidlasso GmbH"
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUN = r"""
+import os, sys, time
+from qgis.core import QgsApplication
+app = QgsApplication([], False)
+app.initQgis()
+sys.path.append(os.path.join(QgsApplication.pkgDataPath(), "python", "plugins"))
+sys.path.insert(0, {repo!r})
+from processing.core.Processing import Processing
+Processing.initialize()
+start = time.perf_counter()
+from LAStools.lastools_provider import LAStoolsProvider
+if {mode!r} == "eager":
+    import importlib
+    from LAStools.lastools.core.registry import algorithms
+    for _, _, module, class_name, _, _ in algorithms:
+        algorithm = getattr(importlib.import_module("LAStools.lastools.core." + module), class_name)()
+        algorithm.initAlgorithm()
+        algorithm.shortHelpString()
+provider = LAStoolsProvider()
+QgsApplication.processingRegistry().addProvider(provider)
+print(time.perf_counter() - start, len(provider.algorithms()))
+if {mode!r} == "eager":
+    from LAStools.lastools.core.registry import check_registry
+    differences = check_registry()
+    if differences:
+        sys.exit("registry.py differs from the algorithm classes:\n" + "\n".join(differences))
+"""
+
+
+def measure(mode):
+    out = subprocess.run(
+        [sys.executable, "-c", RUN.format(repo=REPO, mode=mode)],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+    ).stdout.split()
+    return float(out[-2]), int(out[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[1], formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    results = {}
+    for mode in ["eager", "lazy"]:
+        times = []
+        for _ in range(args.runs):
+            seconds, count = measure(mode)
+            times.append(seconds)
+        results[mode] = statistics.median(times)
+        print(f"{mode:6} {count:4d} algorithms  median {results[mode] * 1000:8.1f} ms  min {min(times) * 1000:8.1f} ms")
+    print(f"lazy registration takes {results['lazy'] / results['eager'] * 100:.0f}% of the eager load time")
+
+
+if __name__ == "__main__":
+    main()